@@ -0,0 +1,204 @@
+"""
+Admission Control - Begrenzung und Gegendruck für teure Endpunkte
+
+Zwei Stufen, beide zur Laufzeit über configure() änderbar:
+
+    1. Token Bucket pro Client (IP oder API-Key): rate Requests pro Sekunde,
+       bis zu burst auf einmal. Leerer Bucket -> sofort abgelehnt.
+    2. Nebenläufigkeitslimit: höchstens max_concurrent Aufrufe gleichzeitig,
+       dahinter eine kurze Warteschlange (max_queue Plätze, queue_timeout
+       Sekunden). Volle Warteschlange oder abgelaufene Wartezeit -> abgelehnt.
+
+Abgelehnte Requests bekommen eine AdmissionRejected-Exception mit
+retry_after (Sekunden); Webserver antworten damit 429 + Retry-After.
+
+Verwendung:
+    admission = AdmissionController('discuss', max_concurrent=4, max_queue=8)
+    admission.check_client(client_id)    # Stufe 1
+    with admission.slot():               # Stufe 2
+        run_discussion()
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTED
+
+
+# Schlüssel, die configure() akzeptiert
+LIMIT_KEYS = ('max_concurrent', 'max_queue', 'queue_timeout', 'client_rate', 'client_burst')
+
+# Ab so vielen Buckets werden volle (= länger inaktive) Buckets entfernt
+MAX_IDLE_BUCKETS = 10000
+
+
+class AdmissionRejected(Exception):
+    """Request abgelehnt (Limit erreicht)"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"Zu viele Anfragen ({reason}), erneut versuchen in {math.ceil(retry_after)}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _TokenBucket:
+    """Token Bucket; Aufrufer hält den Lock des Controllers"""
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, rate: float, burst: float, now: float) -> None:
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+
+class AdmissionController:
+    """Token Bucket pro Client plus Nebenläufigkeitslimit mit Warteschlange (thread-sicher)"""
+
+    def __init__(self,
+                 name: str,
+                 max_concurrent: int = 4,
+                 max_queue: int = 8,
+                 queue_timeout: float = 10.0,
+                 client_rate: float = 0.2,
+                 client_burst: float = 5):
+        """
+        Args:
+            name: Label für die Metriken (z.B. 'discuss')
+            max_concurrent: Gleichzeitig laufende Aufrufe
+            max_queue: Wartende Aufrufe, darüber wird sofort abgelehnt (0 = keine Warteschlange)
+            queue_timeout: Maximale Wartezeit in der Warteschlange (Sekunden)
+            client_rate: Requests pro Sekunde und Client im Mittel (0 = kein Client-Limit)
+            client_burst: Requests, die ein Client auf einmal stellen darf
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+
+        self.running = 0
+        self.waiting = 0
+        self.rejected: Dict[str, int] = {}
+        # Gleitender Mittelwert der Laufzeit, für Retry-After bei voller Warteschlange
+        self._avg_duration = 1.0
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._condition = threading.Condition()
+        ADMISSION_QUEUE_DEPTH.set(0, endpoint=name)
+
+    def configure(self, **limits) -> Dict:
+        """
+        Ändert Limits zur Laufzeit; wartende Aufrufe sehen neue Plätze sofort
+
+        Raises:
+            ValueError: Bei unbekanntem Schlüssel oder negativem Wert
+        """
+        unknown = set(limits) - set(LIMIT_KEYS)
+        if unknown:
+            raise ValueError(f"Unbekannte Limits: {', '.join(sorted(unknown))} (erlaubt: {', '.join(LIMIT_KEYS)})")
+        for key, value in limits.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{key} muss eine Zahl >= 0 sein")
+        if limits.get('max_concurrent') == 0:
+            raise ValueError("max_concurrent muss mindestens 1 sein")
+        with self._condition:
+            for key, value in limits.items():
+                setattr(self, key, value)
+            self._condition.notify_all()
+        return self.limits()
+
+    def limits(self) -> Dict:
+        """Aktuelle Limits und Auslastung"""
+        with self._condition:
+            return {
+                **{key: getattr(self, key) for key in LIMIT_KEYS},
+                'running': self.running,
+                'waiting': self.waiting,
+                'rejected': dict(self.rejected),
+                'clients': len(self._buckets),
+            }
+
+    def check_client(self, client: str) -> None:
+        """
+        Verbraucht ein Token aus dem Bucket des Clients
+
+        Raises:
+            AdmissionRejected: Wenn der Bucket leer ist (retry_after = Zeit bis zum nächsten Token)
+        """
+        if self.client_rate <= 0:
+            return
+        now = time.monotonic()
+        with self._condition:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                if len(self._buckets) >= MAX_IDLE_BUCKETS:
+                    self._evict_idle(now)
+                bucket = self._buckets[client] = _TokenBucket(self.client_burst, now)
+            bucket.refill(self.client_rate, self.client_burst, now)
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return
+            self.rejected['client_rate'] = self.rejected.get('client_rate', 0) + 1
+            retry_after = (1 - bucket.tokens) / self.client_rate
+        self._reject('client_rate', retry_after)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Belegt einen der max_concurrent Plätze, ggf. nach Wartezeit
+
+        Raises:
+            AdmissionRejected: Bei voller Warteschlange oder abgelaufener Wartezeit
+        """
+        with self._condition:
+            reason = None
+            if self.running >= self.max_concurrent:
+                if self.waiting >= self.max_queue:
+                    reason = 'queue_full'
+                elif not self._wait_for_slot():
+                    reason = 'queue_timeout'
+            if reason:
+                self.rejected[reason] = self.rejected.get(reason, 0) + 1
+                retry_after = self._estimated_wait()
+            else:
+                self.running += 1
+        if reason:
+            self._reject(reason, retry_after)
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.running -= 1
+                self._avg_duration = 0.8 * self._avg_duration + 0.2 * (time.monotonic() - started)
+                self._condition.notify()
+
+    def _wait_for_slot(self) -> bool:
+        """Wartet in der Warteschlange auf einen freien Platz; Aufrufer hält den Lock"""
+        self.waiting += 1
+        ADMISSION_QUEUE_DEPTH.set(self.waiting, endpoint=self.name)
+        try:
+            return self._condition.wait_for(lambda: self.running < self.max_concurrent,
+                                            timeout=self.queue_timeout)
+        finally:
+            self.waiting -= 1
+            ADMISSION_QUEUE_DEPTH.set(self.waiting, endpoint=self.name)
+
+    def _estimated_wait(self) -> float:
+        """Grobe Schätzung, wann wieder ein Platz frei ist; Aufrufer hält den Lock"""
+        return self._avg_duration * (self.waiting + 1) / max(self.max_concurrent, 1)
+
+    def _evict_idle(self, now: float) -> None:
+        for client, bucket in list(self._buckets.items()):
+            bucket.refill(self.client_rate, self.client_burst, now)
+            if bucket.tokens >= self.client_burst:
+                del self._buckets[client]
+
+    def _reject(self, reason: str, retry_after: float) -> None:
+        ADMISSION_REJECTED.inc(endpoint=self.name, reason=reason)
+        raise AdmissionRejected(reason, max(retry_after, 1.0))
@@ -0,0 +1,288 @@
+"""
+Async GitHub Client - Nicht-blockierende Variante von GitHubClient (aiohttp)
+
+Gleiche Oberfläche wie GitHubClient (create_repository, create_multiple_files,
+check_rate_limit, get_repo_info), aber als Coroutinen mit asyncio.sleep-Drosselung.
+Damit laufen GitHub-Aufrufe auf derselben Event-Loop wie der Round Table oder
+die Dashboards, ohne sie zu blockieren.
+
+Repositories werden als JSON-Dictionaries der REST API zurückgegeben, nicht als
+PyGithub-Objekte. create_multiple_files schreibt alle Dateien in einem Commit
+(Git-Data-API: ein Tree mit Inhalten, ein Commit, ein Ref-Update).
+
+Verwendung:
+    async with AsyncGitHubClient('config.json') as github:
+        repo = await github.create_repository('mein-projekt', 'Beschreibung')
+        await github.create_multiple_files(repo, {'README.md': '# Hallo'})
+        print(await github.check_rate_limit())
+"""
+import asyncio
+import base64
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+import aiohttp
+
+from metrics import GITHUB_API_CALLS, GITHUB_API_DURATION, GITHUB_RATE_LIMIT_REMAINING
+from tracing import span
+
+
+class AsyncGitHubError(Exception):
+    """Fehlerstatus der GitHub API"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class AsyncGitHubClient:
+    """Asynchroner Client für GitHub API Operationen"""
+
+    # Wie oft bei sekundärem Rate Limit (403/429 mit Retry-After) erneut versucht wird
+    MAX_RETRIES = 3
+
+    def __init__(self, config_path: str = 'config.json'):
+        """
+        Initialisiert den Client (die HTTP-Session entsteht erst beim ersten Request)
+
+        Args:
+            config_path: Pfad zur Konfigurationsdatei (gleiche Schlüssel wie GitHubClient)
+        """
+        if not os.path.exists(config_path):
+            raise FileNotFoundError(f"Config-Datei nicht gefunden: {config_path}")
+        with open(config_path, 'r', encoding='utf-8') as f:
+            self.config = json.load(f)
+
+        self.token = self.config.get('github_token')
+        self.username = self.config.get('github_username')
+        if not self.token:
+            raise ValueError("GitHub Token nicht in config.json gefunden!")
+
+        self.base_url = (self.config.get('base_url') or 'https://api.github.com').rstrip('/')
+        self.rate_limit_delay = self.config.get('rate_limit_delay', 1.0)
+        self.pool_size = self.config.get('pool_size', 10)
+        self.timeout = self.config.get('timeout', 30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._login: Optional[str] = self.username
+
+    async def __aenter__(self) -> 'AsyncGitHubClient':
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Schließt die HTTP-Session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Gepoolte Session; muss innerhalb einer laufenden Event-Loop angelegt werden"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    'Authorization': f'token {self.token}',
+                    'Accept': 'application/vnd.github+json',
+                    'User-Agent': 'github-auto-coder',
+                },
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def login(self) -> str:
+        """Login des authentifizierten Benutzers (aus Config oder GET /user, danach gemerkt)"""
+        if self._login is None:
+            self._login = (await self._request('get_user', 'GET', '/user'))['login']
+        return self._login
+
+    async def create_repository(self,
+                                repo_name: str,
+                                description: str = "",
+                                private: bool = False,
+                                auto_init: bool = False) -> Dict:
+        """
+        Erstellt ein neues GitHub Repository
+
+        Args:
+            repo_name: Name des Repositories
+            description: Beschreibung des Repositories
+            private: Ob das Repo privat sein soll
+            auto_init: Ob ein README.md automatisch erstellt werden soll
+
+        Returns:
+            Repository als Dictionary (REST-JSON)
+        """
+        print(f"📦 Erstelle Repository: {repo_name}")
+        try:
+            repo = await self._request('create_repo', 'POST', '/user/repos', {
+                'name': repo_name,
+                'description': description,
+                'private': private,
+                'auto_init': auto_init,
+            }, repo=repo_name)
+        except AsyncGitHubError as e:
+            if e.status == 422:
+                print(f"⚠️  Repository '{repo_name}' existiert bereits")
+                return await self.get_repository(repo_name)
+            raise Exception(f"Fehler beim Erstellen des Repositories: {e}")
+
+        print(f"✅ Repository erstellt: {repo['html_url']}")
+        await self._throttle()
+        return repo
+
+    async def get_repository(self, repo_name: str) -> Dict:
+        """
+        Holt ein existierendes Repository
+
+        Args:
+            repo_name: Name des Repositories
+
+        Returns:
+            Repository als Dictionary (REST-JSON)
+        """
+        try:
+            return await self._request('get_repo', 'GET', f'/repos/{await self.login()}/{repo_name}',
+                                       repo=repo_name)
+        except AsyncGitHubError:
+            raise Exception(f"Repository nicht gefunden: {repo_name}")
+
+    async def create_multiple_files(self,
+                                    repo: Dict,
+                                    files: Dict[str, str],
+                                    commit_message: str = "Add project files") -> str:
+        """
+        Erstellt mehrere Dateien in einem einzigen Commit
+
+        Leere Repositories werden mit der ersten Datei über die Contents-API
+        initialisiert, da die Git-Data-API dort nicht verfügbar ist.
+
+        Args:
+            repo: Repository-Dictionary
+            files: Dictionary mit {Pfad: Inhalt}
+            commit_message: Commit-Nachricht
+
+        Returns:
+            SHA des neuen Commits
+        """
+        print(f"📝 Erstelle {len(files)} Dateien...")
+        full_name = repo['full_name']
+        branch = self.config.get('default_branch', 'main')
+        remaining = dict(files)
+
+        try:
+            ref = await self._request('get_ref', 'GET', f'/repos/{full_name}/git/ref/heads/{branch}')
+            head = ref['object']['sha']
+        except AsyncGitHubError as e:
+            if e.status not in (404, 409) or not remaining:
+                raise Exception(f"Fehler beim Erstellen der Dateien: {e}")
+            first_path = next(iter(remaining))
+            created = await self._request('create_file', 'PUT', f'/repos/{full_name}/contents/{first_path}', {
+                'message': f"Add {first_path}",
+                'content': base64.b64encode(remaining.pop(first_path).encode('utf-8')).decode('ascii'),
+                'branch': branch,
+            }, file=first_path)
+            head = created['commit']['sha']
+            if not remaining:
+                print(f"  ✅ {len(files)} Dateien committet")
+                return head
+
+        try:
+            commit = await self._request('get_commit', 'GET', f'/repos/{full_name}/git/commits/{head}')
+            tree = await self._request('create_tree', 'POST', f'/repos/{full_name}/git/trees', {
+                'base_tree': commit['tree']['sha'],
+                'tree': [{'path': path, 'mode': '100644', 'type': 'blob', 'content': content}
+                         for path, content in remaining.items()],
+            }, files=len(remaining), bytes=sum(len(content) for content in remaining.values()))
+            new_commit = await self._request('create_commit', 'POST', f'/repos/{full_name}/git/commits', {
+                'message': commit_message,
+                'tree': tree['sha'],
+                'parents': [head],
+            })
+            await self._request('update_ref', 'PATCH', f'/repos/{full_name}/git/refs/heads/{branch}',
+                                {'sha': new_commit['sha']})
+        except AsyncGitHubError as e:
+            raise Exception(f"Fehler beim Erstellen der Dateien: {e}")
+
+        print(f"  ✅ {len(files)} Dateien committet")
+        await self._throttle()
+        return new_commit['sha']
+
+    async def check_rate_limit(self) -> Dict:
+        """
+        Prüft das aktuelle Rate Limit
+
+        Returns:
+            Dictionary mit Rate Limit Informationen
+        """
+        core = (await self._request('rate_limit', 'GET', '/rate_limit'))['resources']['core']
+        GITHUB_RATE_LIMIT_REMAINING.set(core['remaining'])
+        return {
+            'limit': core['limit'],
+            'remaining': core['remaining'],
+            'reset_time': datetime.fromtimestamp(core['reset'], tz=timezone.utc)
+        }
+
+    async def get_repo_info(self, repo: Union[Dict, str]) -> Dict:
+        """
+        Holt Informationen über ein Repository
+
+        Args:
+            repo: Repository-Dictionary oder Name (wird dann geladen)
+
+        Returns:
+            Dictionary mit Repository-Informationen
+        """
+        if isinstance(repo, str):
+            repo = await self.get_repository(repo)
+        return {
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'url': repo['html_url'],
+            'description': repo['description'],
+            'private': repo['private'],
+            'created_at': datetime.fromisoformat(repo['created_at'].replace('Z', '+00:00')),
+            'default_branch': repo['default_branch'],
+            'size': repo['size'],
+            'language': repo['language']
+        }
+
+    async def _request(self, call: str, method: str, path: str, body: Optional[Dict] = None,
+                       **attributes) -> Any:
+        """Ein API-Request mit Trace-Span, Metriken und Wartezeit bei sekundärem Rate Limit"""
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            with span(f'github.{call}', **attributes):
+                for attempt in range(self.MAX_RETRIES + 1):
+                    async with self.session.request(method, f'{self.base_url}{path}', json=body) as response:
+                        remaining = response.headers.get('X-RateLimit-Remaining')
+                        if remaining is not None:
+                            GITHUB_RATE_LIMIT_REMAINING.set(int(remaining))
+                        retry_after = response.headers.get('Retry-After')
+                        if response.status in (403, 429) and retry_after and attempt < self.MAX_RETRIES:
+                            print(f"⏳ Sekundäres Rate Limit, warte {retry_after}s...")
+                            await asyncio.sleep(float(retry_after))
+                            continue
+                        data = await response.json(content_type=None) if response.content_length != 0 else None
+                        if response.status >= 400:
+                            message = data.get('message', response.reason) if isinstance(data, dict) else response.reason
+                            raise AsyncGitHubError(response.status, message)
+                        break
+            outcome = 'ok'
+            return data
+        finally:
+            GITHUB_API_CALLS.inc(call=call, outcome=outcome)
+            GITHUB_API_DURATION.observe(time.perf_counter() - started, call=call)
+
+    async def _throttle(self) -> None:
+        """Wartet rate_limit_delay Sekunden, ohne die Event-Loop zu blockieren"""
+        if self.rate_limit_delay > 0:
+            with span('github.rate_limit_delay'):
+                await asyncio.sleep(self.rate_limit_delay)
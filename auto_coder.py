@@ -5,14 +5,25 @@ GitHub Auto-Coder - Automatische GitHub Repository-Erstellung
 import argparse
 import sys
 import os
-from typing import Dict, Optional
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 from colorama import init, Fore, Style
 
 from task_parser import TaskParser, ProjectPlan
 from code_generator import CodeGenerator
-from github_client import GitHubClient
-from round_table import RoundTable
-import asyncio
+from content_store import ContentStore
+from metrics import GENERATED_BYTES, GENERATED_FILES
+from project_archive import format_from_filename, write_archive
+from project_templates import plan_delta, static_files, template_combos, template_name
+from tracing import Trace, JsonFileExporter, OTLPExporter, format_trace, span
+from upload_journal import UploadJournal
+
+# github_client (PyGithub) und round_table werden erst bei Bedarf importiert,
+# damit --help und --local-only schnell starten
+if TYPE_CHECKING:
+    from github import Repository
+    from github_client import GitHubClient
+    from round_table import RoundTable
 
 # Initialisiere Colorama für farbige Ausgabe
 init(autoreset=True)
@@ -21,25 +32,89 @@ init(autoreset=True)
 class GitHubAutoCoder:
     """Hauptklasse für GitHub Auto-Coder"""
     
-    def __init__(self, config_path: str = 'config.json'):
+    def __init__(self, config_path: str = 'config.json',
+                 trace_file: Optional[str] = None,
+                 otlp_endpoint: Optional[str] = None,
+                 upload_mode: Optional[str] = None,
+                 content_store: Optional[str] = None):
         """
         Initialisiert den Auto-Coder
         
         Args:
             config_path: Pfad zur Konfigurationsdatei
+            trace_file: Optional: JSONL-Datei, an die jeder Trace angehängt wird
+            otlp_endpoint: Optional: OpenTelemetry Collector (OTLP/HTTP), z.B. http://localhost:4318
+            upload_mode: Optional: 'api' oder 'push' (überschreibt upload_mode aus der Config)
+            content_store: Optional: Verzeichnis eines ContentStore; Projektdateien werden dann
+                           als Links auf deduplizierte Objekte gespeichert
         """
         self.config_path = config_path
+        self.upload_mode = upload_mode
+        self.trace_exporters = []
+        if trace_file:
+            self.trace_exporters.append(JsonFileExporter(trace_file))
+        if otlp_endpoint:
+            self.trace_exporters.append(OTLPExporter(otlp_endpoint))
         self.parser = TaskParser()
         self.generator = CodeGenerator()
-        self.round_table = RoundTable()  # Initialisiere Runden Tisch
+        self.content_store = ContentStore(content_store) if content_store else None
         
-        try:
-            self.github = GitHubClient(config_path)
-            self.authenticated = True
-        except Exception as e:
-            print(f"{Fore.YELLOW}⚠️  GitHub-Verbindung fehlgeschlagen: {e}")
-            print(f"{Fore.YELLOW}💡 Lokaler Modus aktiviert (kein GitHub-Push)")
-            self.authenticated = False
+        # GitHub-Client und Runder Tisch entstehen beim ersten Zugriff
+        self._github: Optional['GitHubClient'] = None
+        self._authenticated: Optional[bool] = None
+        self._round_table: Optional['RoundTable'] = None
+        self._lazy_lock = threading.Lock()
+    
+    @property
+    def github(self) -> Optional['GitHubClient']:
+        """GitHub-Client (verbindet sich beim ersten Zugriff)"""
+        self._connect_github()
+        return self._github
+    
+    @github.setter
+    def github(self, client: 'GitHubClient') -> None:
+        self._github = client
+        self._authenticated = client is not None
+    
+    @property
+    def authenticated(self) -> bool:
+        """Ob ein GitHub-Client verfügbar ist (verbindet sich beim ersten Zugriff)"""
+        self._connect_github()
+        return bool(self._authenticated)
+    
+    @authenticated.setter
+    def authenticated(self, value: bool) -> None:
+        self._authenticated = value
+    
+    @property
+    def round_table(self) -> 'RoundTable':
+        """Runder Tisch (wird beim ersten Zugriff initialisiert)"""
+        if self._round_table is None:
+            with self._lazy_lock:
+                if self._round_table is None:
+                    from round_table import RoundTable
+                    self._round_table = RoundTable()
+        return self._round_table
+    
+    @round_table.setter
+    def round_table(self, table: 'RoundTable') -> None:
+        self._round_table = table
+    
+    def _connect_github(self) -> None:
+        """Importiert PyGithub und verbindet sich (nur einmal)"""
+        if self._authenticated is not None:
+            return
+        with self._lazy_lock:
+            if self._authenticated is not None:
+                return
+            try:
+                from github_client import GitHubClient
+                self._github = GitHubClient(self.config_path)
+                self._authenticated = True
+            except Exception as e:
+                print(f"{Fore.YELLOW}⚠️  GitHub-Verbindung fehlgeschlagen: {e}")
+                print(f"{Fore.YELLOW}💡 Lokaler Modus aktiviert (kein GitHub-Push)")
+                self._authenticated = False
     
     def create_project(self, 
                       task_description: str,
@@ -60,50 +135,97 @@ class GitHubAutoCoder:
         Returns:
             Dictionary mit Projekt-Informationen
         """
-        print(f"{Fore.CYAN}{'='*60}")
-        print(f"{Fore.CYAN}🤖 GitHub Auto-Coder gestartet")
-        print(f"{Fore.CYAN}{'='*60}\n")
-        
-        # 1. Task parsen
-        print(f"{Fore.YELLOW}📋 Analysiere Aufgabe...")
-        plan = self.parser.parse_task(task_description)
+        trace = Trace('create_project', task=task_description, local_only=local_only,
+                      round_table=use_round_table)
+        with trace.activate():
+            result = self._create_project(task_description, repo_name, local_only,
+                                          private, use_round_table)
         
-        # Optional: Repository-Name überschreiben
-        if repo_name:
-            plan.repo_name = repo_name
+        result['timings'] = trace.summary()
+        self._export_trace(trace)
+        print(f"{Fore.CYAN}⏱️  Laufzeit: {trace.duration * 1000:.0f} ms")
+        print(format_trace(trace) + "\n")
         
-        print(f"{Fore.GREEN}✅ Projekt geplant:")
-        print(f"   📦 Repository: {plan.repo_name}")
-        print(f"   💻 Sprache: {plan.language}")
-        print(f"   🎯 Typ: {plan.project_type}")
-        print(f"   📁 Ordner: {len(plan.folders)}")
-        print(f"   📦 Dependencies: {len(plan.dependencies)}\n")
+        return result
+    
+    def generate_project(self,
+                         task_description: str,
+                         repo_name: Optional[str] = None,
+                         use_round_table: bool = False) -> ProjectPlan:
+        """
+        Plant und generiert ein Projekt, ohne es zu speichern oder hochzuladen
         
-        # 2. Code generieren
-        print(f"{Fore.YELLOW}🔨 Generiere Code-Dateien...")
-        files = self.generator.generate_files(plan)
+        Args:
+            task_description: Natürlichsprachliche Aufgabenbeschreibung
+            repo_name: Optional: Spezifischer Repository-Name
+            use_round_table: Nutze Runden Tisch für erweiterte Code-Generierung
+            
+        Returns:
+            ProjectPlan mit den generierten Dateien in plan.files
+        """
+        trace = Trace('generate_project', task=task_description, round_table=use_round_table)
+        with trace.activate():
+            plan = self._generate(task_description, repo_name, use_round_table)
+        self._export_trace(trace)
+        return plan
+    
+    def create_archive(self,
+                       task_description: str,
+                       output: str,
+                       repo_name: Optional[str] = None,
+                       use_round_table: bool = False) -> Dict:
+        """
+        Generiert ein Projekt direkt in ein Archiv (ohne lokalen Ordner und GitHub)
         
-        # 2.1 Optional: Runder Tisch für verbesserte Code-Generierung
-        if use_round_table:
-            print(f"{Fore.CYAN}🤝 Starte Runden Tisch Diskussion...\n")
-            round_table_result = asyncio.run(self._use_round_table(task_description, plan))
+        Args:
+            task_description: Natürlichsprachliche Aufgabenbeschreibung
+            output: Zieldatei, Format aus der Endung (.zip oder .tar.zst)
+            repo_name: Optional: Spezifischer Repository-Name (= Ordner im Archiv)
+            use_round_table: Nutze Runden Tisch für erweiterte Code-Generierung
             
-            # Füge Runder Tisch Code hinzu
-            if round_table_result:
-                rt_filename = f"round_table_{plan.language}_module.{self._get_file_extension(plan.language)}"
-                files[rt_filename] = round_table_result.consensus_code
-                
-                # Erstelle Diskussions-Dokumentation
-                files['ROUND_TABLE_DISCUSSION.md'] = self._format_round_table_docs(round_table_result)
-                
-                print(f"{Fore.GREEN}✅ Runder Tisch Code generiert: {rt_filename}\n")
+        Returns:
+            Dictionary mit Projekt-Informationen
+            
+        Raises:
+            ValueError: Bei unbekannter Dateiendung
+        """
+        fmt = format_from_filename(output)
+        trace = Trace('create_archive', task=task_description, format=fmt, round_table=use_round_table)
+        with trace.activate():
+            plan = self._generate(task_description, repo_name, use_round_table)
+            with span('write_archive', format=fmt) as stage:
+                size = write_archive(plan.files, output, fmt, root=plan.repo_name)
+                stage.set(bytes=size)
+        print(f"{Fore.GREEN}📦 Archiv geschrieben: {output} ({size / 1024:.1f} KB)\n")
         
-        plan.files = files
+        self._export_trace(trace)
+        return {
+            'repo_name': plan.repo_name,
+            'archive': output,
+            'archive_bytes': size,
+            'files': list(plan.files.keys()),
+            'language': plan.language,
+            'project_type': plan.project_type,
+            'timings': trace.summary()
+        }
+    
+    def _create_project(self,
+                        task_description: str,
+                        repo_name: Optional[str],
+                        local_only: bool,
+                        private: bool,
+                        use_round_table: bool) -> Dict:
+        """Führt die einzelnen Schritte von create_project innerhalb des Traces aus"""
+        print(f"{Fore.CYAN}{'='*60}")
+        print(f"{Fore.CYAN}🤖 GitHub Auto-Coder gestartet")
+        print(f"{Fore.CYAN}{'='*60}\n")
         
-        print(f"{Fore.GREEN}✅ {len(files)} Dateien generiert\n")
+        plan = self._generate(task_description, repo_name, use_round_table)
+        files = plan.files
         
         # 3. Lokal speichern
-        local_path = self._save_locally(plan)
+        with span('save_locally'):
+            local_path = self._save_locally(plan)
         print(f"{Fore.GREEN}✅ Lokal gespeichert: {local_path}\n")
         
         result = {
@@ -116,16 +238,19 @@ class GitHubAutoCoder:
         
         # 4. Auf GitHub pushen (wenn authentifiziert und gewünscht)
         if not local_only and self.authenticated:
+            journal = None
             try:
                 print(f"{Fore.YELLOW}🚀 Erstelle GitHub Repository...")
-                repo = self.github.create_repository(
-                    repo_name=plan.repo_name,
-                    description=plan.description,
-                    private=private
-                )
+                with span('create_repository'):
+                    repo, upload, template = self._create_repository(plan, files, private)
+                if template:
+                    result['template'] = template
                 
                 print(f"{Fore.YELLOW}📤 Uploade Dateien zu GitHub...")
-                self.github.create_multiple_files(repo, files)
+                upload_mode = self.upload_mode or self.github.upload_mode
+                journal = UploadJournal.for_project(local_path)
+                journal.start(repo.full_name, upload_mode, list(upload))
+                self._upload(repo, upload, local_path, upload_mode, journal)
                 
                 print(f"{Fore.GREEN}✅ Erfolgreich auf GitHub erstellt!")
                 print(f"{Fore.CYAN}🔗 URL: {repo.html_url}\n")
@@ -140,6 +265,8 @@ class GitHubAutoCoder:
             except Exception as e:
                 print(f"{Fore.RED}❌ GitHub-Upload fehlgeschlagen: {e}")
                 print(f"{Fore.YELLOW}💡 Projekt wurde lokal gespeichert: {local_path}")
+                if journal is not None:
+                    print(f"{Fore.YELLOW}💡 Fortsetzen mit: python auto_coder.py --resume {local_path}")
                 result['github_success'] = False
                 result['error'] = str(e)
         else:
@@ -152,6 +279,243 @@ class GitHubAutoCoder:
         
         return result
     
+    def _generate(self, task_description: str, repo_name: Optional[str],
+                  use_round_table: bool) -> ProjectPlan:
+        """Plant das Projekt und generiert die Dateien (Ergebnis in plan.files)"""
+        # 1. Task parsen
+        print(f"{Fore.YELLOW}📋 Analysiere Aufgabe...")
+        with span('parse_task'):
+            plan = self.parser.parse_task(task_description)
+        
+        # Optional: Repository-Name überschreiben
+        if repo_name:
+            plan.repo_name = repo_name
+        
+        print(f"{Fore.GREEN}✅ Projekt geplant:")
+        print(f"   📦 Repository: {plan.repo_name}")
+        print(f"   💻 Sprache: {plan.language}")
+        print(f"   🎯 Typ: {plan.project_type}")
+        print(f"   📁 Ordner: {len(plan.folders)}")
+        print(f"   📦 Dependencies: {len(plan.dependencies)}\n")
+        
+        # 2. Code generieren
+        print(f"{Fore.YELLOW}🔨 Generiere Code-Dateien...")
+        with span('generate_files') as stage:
+            files = self.generator.generate_files(plan)
+            generated_bytes = sum(len(c.encode('utf-8')) for c in files.values())
+            stage.set(files=len(files), bytes=generated_bytes)
+        GENERATED_FILES.inc(len(files))
+        GENERATED_BYTES.inc(generated_bytes)
+        
+        # 2.1 Optional: Runder Tisch für verbesserte Code-Generierung
+        if use_round_table:
+            print(f"{Fore.CYAN}🤝 Starte Runden Tisch Diskussion...\n")
+            import asyncio
+            with span('round_table'):
+                round_table_result = asyncio.run(self._use_round_table(task_description, plan))
+            
+            # Füge Runder Tisch Code hinzu
+            if round_table_result:
+                rt_filename = f"round_table_{plan.language}_module.{self._get_file_extension(plan.language)}"
+                files[rt_filename] = round_table_result.consensus_code
+                
+                # Erstelle Diskussions-Dokumentation
+                files['ROUND_TABLE_DISCUSSION.md'] = self._format_round_table_docs(round_table_result)
+                
+                print(f"{Fore.GREEN}✅ Runder Tisch Code generiert: {rt_filename}\n")
+        
+        plan.files = files
+        
+        print(f"{Fore.GREEN}✅ {len(files)} Dateien generiert\n")
+        
+        return plan
+    
+    def _upload(self, repo: 'Repository.Repository', files: Dict[str, str], local_path: str,
+                upload_mode: str, journal: UploadJournal) -> None:
+        """Lädt die Dateien hoch (API oder git push) und führt das Upload-Journal"""
+        try:
+            with span('upload_files', files=len(files), mode=upload_mode):
+                if upload_mode == 'push':
+                    commit = self.github.push_files(repo, local_path)
+                else:
+                    self.github.create_multiple_files(repo, files, journal=journal)
+                    commit = None
+            journal.finish(commit)
+        finally:
+            journal.close()
+    
+    def resume_upload(self, local_path: str) -> Dict:
+        """
+        Setzt einen abgebrochenen Upload anhand des Upload-Journals fort
+        
+        Bereits hochgeladene Dateien werden nicht erneut angefragt; das Repository
+        wird nur gelesen, nicht neu angelegt.
+        
+        Args:
+            local_path: Lokaler Projektordner (Standard: Repository-Name)
+            
+        Returns:
+            Dictionary mit Upload-Informationen
+        """
+        journal = UploadJournal.for_project(local_path)
+        state = journal.load()
+        if state.repo is None:
+            raise FileNotFoundError(f"Kein Upload-Journal für {local_path} gefunden ({journal.path})")
+        
+        result = {
+            'repo_name': state.repo.split('/', 1)[1],
+            'local_path': os.path.abspath(local_path),
+            'files': state.pending,
+            'github_success': False
+        }
+        if state.finished:
+            print(f"{Fore.GREEN}✅ Upload nach {state.repo} ist bereits abgeschlossen")
+            result['github_success'] = True
+            return result
+        if not self.authenticated:
+            raise RuntimeError("Keine GitHub-Verbindung, Upload kann nicht fortgesetzt werden")
+        
+        print(f"{Fore.YELLOW}🔁 Setze Upload nach {state.repo} fort: "
+              f"{len(state.uploaded)} erledigt, {len(state.pending)} offen")
+        trace = Trace('resume_upload', repo=state.repo, pending=len(state.pending))
+        with trace.activate():
+            repo = self.github.get_repository(result['repo_name'])
+            files = {}
+            for path in ([] if state.mode == 'push' else state.pending):
+                with open(os.path.join(local_path, path), 'r', encoding='utf-8') as f:
+                    files[path] = f.read()
+            journal.resume()
+            self._upload(repo, files, local_path, state.mode, journal)
+        self._export_trace(trace)
+        
+        print(f"{Fore.GREEN}✅ Upload abgeschlossen: {repo.html_url}")
+        result['repo_url'] = repo.html_url
+        result['github_success'] = True
+        result['timings'] = trace.summary()
+        return result
+    
+    def _create_repository(self, plan: ProjectPlan, files: Dict[str, str],
+                           private: bool) -> Tuple['Repository.Repository', Dict[str, str], Optional[str]]:
+        """
+        Legt das GitHub Repository an, wenn möglich aus einem Template-Repository
+        
+        Returns:
+            (Repository, noch hochzuladende Dateien, Name des Templates oder None)
+        """
+        if (plan.language, plan.project_type) in template_combos(self.github.template_repos):
+            template_files = static_files(self.generator, plan)
+            delta = plan_delta(files, template_files)
+            if delta is not None:
+                name = template_name(plan.language, plan.project_type, template_files)
+                try:
+                    with span('ensure_template', template=name):
+                        template = self.github.ensure_template_repository(
+                            name, template_files,
+                            f"Template für {plan.language}/{plan.project_type} (GitHub Auto-Coder)"
+                        )
+                    repo = self.github.create_repository_from_template(
+                        template, plan.repo_name, plan.description, private
+                    )
+                    print(f"{Fore.GREEN}🧩 Aus Template erstellt, {len(delta)} von {len(files)} Dateien verbleiben")
+                    return repo, delta, name
+                except Exception as e:
+                    print(f"{Fore.YELLOW}⚠️  Template nicht nutzbar ({e}), lade alle Dateien hoch")
+        
+        repo = self.github.create_repository(
+            repo_name=plan.repo_name,
+            description=plan.description,
+            private=private
+        )
+        return repo, files, None
+    
+    def create_batch(self,
+                     tasks: List[str],
+                     on_conflict: str = 'suffix',
+                     local_only: bool = False,
+                     private: bool = False,
+                     use_round_table: bool = False) -> List[Dict]:
+        """
+        Erstellt mehrere Projekte; Namenskonflikte werden vor dem ersten Schreibzugriff gelöst
+        
+        Die eigenen Repositories werden einmal (paginiert) in ein Set geladen, jeder
+        geplante Name wird dagegen und gegen die übrigen Namen des Batches geprüft.
+        
+        Args:
+            tasks: Aufgabenbeschreibungen
+            on_conflict: 'suffix' (name-2, name-3, ...), 'skip' oder 'reuse' (bisheriges Verhalten)
+            local_only: Nur lokal generieren, nicht auf GitHub pushen
+            private: Ob die Repositories privat sein sollen
+            use_round_table: Nutze Runden Tisch für erweiterte Code-Generierung
+            
+        Returns:
+            Liste der Ergebnis-Dictionaries in Reihenfolge der Aufgaben
+        """
+        if on_conflict not in ('suffix', 'skip', 'reuse'):
+            raise ValueError(f"Unbekannte Konfliktstrategie: {on_conflict}")
+        
+        # Pre-Flight: Namen planen und gegen vorhandene Repositories prüfen
+        planned_names = [self.parser.parse_task(task).repo_name for task in tasks]
+        taken: Set[str] = set()
+        if not local_only and self.authenticated:
+            print(f"{Fore.YELLOW}🔎 Prüfe Repository-Namen...")
+            taken = set(self.github.list_repository_names())
+        resolved = self._resolve_repo_names(planned_names, taken, on_conflict)
+        
+        results = []
+        for task, planned, name in zip(tasks, planned_names, resolved):
+            if name is None:
+                print(f"{Fore.YELLOW}⏭️  Übersprungen (Name vergeben): {planned}")
+                results.append({
+                    'task': task,
+                    'repo_name': planned,
+                    'skipped': True,
+                    'github_success': False,
+                    'error': f"Repository-Name bereits vergeben: {planned}"
+                })
+                continue
+            if name != planned:
+                print(f"{Fore.YELLOW}✏️  {planned} ist vergeben, verwende {name}")
+            result = self.create_project(task, repo_name=name, local_only=local_only,
+                                         private=private, use_round_table=use_round_table)
+            result['task'] = task
+            result['renamed_from'] = planned if name != planned else None
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def _resolve_repo_names(names: Iterable[str], taken: Set[str], on_conflict: str) -> List[Optional[str]]:
+        """
+        Löst Namenskonflikte gegen `taken` und innerhalb des Batches
+        
+        Returns:
+            Pro Name den zu verwendenden Namen oder None (übersprungen)
+        """
+        used = set(taken)
+        resolved: List[Optional[str]] = []
+        for name in names:
+            key = name.lower()
+            if key not in used or on_conflict == 'reuse':
+                used.add(key)
+                resolved.append(name)
+            elif on_conflict == 'skip':
+                resolved.append(None)
+            else:
+                suffix = 2
+                while f"{key}-{suffix}" in used:
+                    suffix += 1
+                candidate = f"{name}-{suffix}"
+                used.add(candidate.lower())
+                resolved.append(candidate)
+        return resolved
+    
+    def _export_trace(self, trace: Trace) -> None:
+        """Gibt den Trace an alle konfigurierten Exporter weiter (Fehler brechen den Lauf nicht ab)"""
+        for exporter in self.trace_exporters:
+            try:
+                exporter.export(trace)
+            except Exception as e:
+                print(f"{Fore.YELLOW}⚠️  Trace-Export fehlgeschlagen ({exporter.__class__.__name__}): {e}")
+    
     def _save_locally(self, plan: ProjectPlan) -> str:
         """
         Speichert Projekt lokal
@@ -172,6 +536,13 @@ class GitHubAutoCoder:
             folder_path = os.path.join(project_dir, folder)
             os.makedirs(folder_path, exist_ok=True)
         
+        # Identische Inhalte nur einmal speichern und verlinken
+        if self.content_store:
+            with span('content_store') as stage:
+                stats = self.content_store.materialize(plan.files, project_dir)
+                stage.set(new_objects=stats['new_objects'], bytes_written=stats['bytes_written'])
+            return os.path.abspath(project_dir)
+        
         # Erstelle alle Dateien
         for file_path, content in plan.files.items():
             full_path = os.path.join(project_dir, file_path)
@@ -350,6 +721,12 @@ Beispiele:
   python auto_coder.py "Erstelle eine React Todo-App" --repo-name my-todo-app
   python auto_coder.py "Erstelle eine FastAPI" --local-only
   python auto_coder.py --interactive
+  python auto_coder.py --batch aufgaben.txt --on-conflict suffix
+  python auto_coder.py --resume flask-web-app
+  python auto_coder.py "Erstelle eine FastAPI" --archive fastapi.tar.zst
+  python auto_coder.py --batch aufgaben.txt --local-only --content-store ~/.auto-coder/store
+  python auto_coder.py --gc-store ~/.auto-coder/store
+  python auto_coder.py "Erstelle eine Flask Web-App" --local-only --trace traces.jsonl
         """
     )
     
@@ -400,8 +777,72 @@ Beispiele:
         help='Nutze Runden Tisch für erweiterte Code-Generierung mit KI-Modellen'
     )
     
+    parser.add_argument(
+        '--batch',
+        '-b',
+        metavar='DATEI',
+        help='Mehrere Projekte erstellen: eine Aufgabe pro Zeile (# für Kommentare)'
+    )
+    
+    parser.add_argument(
+        '--on-conflict',
+        choices=['suffix', 'skip', 'reuse'],
+        default='suffix',
+        help='Batch: vergebene Repository-Namen umbenennen, überspringen oder wiederverwenden (Standard: suffix)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='PROJEKT',
+        help='Abgebrochenen Upload eines lokal gespeicherten Projekts fortsetzen (Ordner/Repository-Name)'
+    )
+    
+    parser.add_argument(
+        '--push',
+        action='store_true',
+        help='Dateien mit einem git push statt über die Contents-API hochladen (benötigt git)'
+    )
+    
+    parser.add_argument(
+        '--archive',
+        '-a',
+        metavar='DATEI',
+        help='Projekt nur als Archiv schreiben (.zip oder .tar.zst), ohne lokalen Ordner und GitHub'
+    )
+    
+    parser.add_argument(
+        '--content-store',
+        metavar='DIR',
+        help='Identische Dateien projektübergreifend nur einmal speichern (Reflinks/Hardlinks in DIR)'
+    )
+    
+    parser.add_argument(
+        '--gc-store',
+        metavar='DIR',
+        help='Content Store aufräumen: Objekte ohne vorhandenes Projekt löschen'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        metavar='DATEI',
+        help='Trace jedes Laufs als JSON-Zeile an DATEI anhängen'
+    )
+    
+    parser.add_argument(
+        '--otlp-endpoint',
+        metavar='URL',
+        help='Trace an einen OpenTelemetry Collector senden (z.B. http://localhost:4318)'
+    )
+    
     args = parser.parse_args()
     
+    # Content Store aufräumen (braucht keine Config)
+    if args.gc_store:
+        stats = ContentStore(args.gc_store).gc()
+        print(f"{Fore.GREEN}🧹 Content Store: {stats['objects_removed']} Objekte "
+              f"({stats['bytes_freed'] / 1024:.1f} KB) und {stats['projects_removed']} Projekt-Vermerke entfernt")
+        sys.exit(0)
+    
     # Prüfe ob Config existiert
     if not os.path.exists(args.config):
         print(f"{Fore.RED}❌ Konfigurationsdatei nicht gefunden: {args.config}")
@@ -409,18 +850,59 @@ Beispiele:
         sys.exit(1)
     
     # Initialisiere Auto-Coder
-    coder = GitHubAutoCoder(config_path=args.config)
+    coder = GitHubAutoCoder(config_path=args.config, trace_file=args.trace,
+                            otlp_endpoint=args.otlp_endpoint,
+                            upload_mode='push' if args.push else None,
+                            content_store=args.content_store)
     
     # Interaktiver Modus
     if args.interactive:
         coder.interactive_mode()
         return
     
+    # Abgebrochenen Upload fortsetzen
+    if args.resume:
+        try:
+            result = coder.resume_upload(args.resume)
+        except Exception as e:
+            print(f"{Fore.RED}❌ Fortsetzen fehlgeschlagen: {e}")
+            sys.exit(1)
+        sys.exit(0 if result.get('github_success') else 1)
+    
+    # Batch-Modus
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            tasks = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+        results = coder.create_batch(
+            tasks,
+            on_conflict=args.on_conflict,
+            local_only=args.local_only,
+            private=args.private,
+            use_round_table=args.round_table
+        )
+        skipped = sum(1 for r in results if r.get('skipped'))
+        renamed = sum(1 for r in results if r.get('renamed_from'))
+        uploaded = sum(1 for r in results if r.get('github_success'))
+        print(f"{Fore.CYAN}📦 Batch: {len(results)} Aufgaben, {uploaded} auf GitHub, "
+              f"{renamed} umbenannt, {skipped} übersprungen")
+        ok = all(r.get('github_success') or args.local_only for r in results if not r.get('skipped'))
+        sys.exit(0 if ok else 1)
+    
     # Prüfe ob Task angegeben wurde
     if not args.task:
         parser.print_help()
         sys.exit(1)
     
+    # Nur Archiv
+    if args.archive:
+        try:
+            coder.create_archive(args.task, args.archive, repo_name=args.repo_name,
+                                 use_round_table=args.round_table)
+        except Exception as e:
+            print(f"{Fore.RED}❌ Fehler: {e}")
+            sys.exit(1)
+        sys.exit(0)
+    
     # Erstelle Projekt
     try:
         result = coder.create_project(
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Validierung und Laden von RoundTable-Erweiterungen
+
+Vergleicht den bisherigen ast.walk/isinstance-Ansatz mit dem
+ExtensionValidator (ein Durchlauf) sowie kalten und warmen Cache.
+
+Verwendung:
+  python benchmarks/bench_extension_validator.py
+  python benchmarks/bench_extension_validator.py --snippets 20000 --unique 500
+"""
+import argparse
+import ast
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from roundtable_safe import BANNED_NODES, RoundTable, compile_extension, extension_cache  # noqa: E402
+
+
+VALID_TEMPLATE = (
+    "def mitigate_weakness_{n}(self):\n"
+    "    print('Mitigating {text} with self-optimization extension.')\n"
+)
+
+INVALID_TEMPLATES = [
+    "def bad_{n}(self):\n    import os\n    print('{text}')\n",
+    "def bad_{n}(self):\n    x = {n}\n    print('{text}')\n",
+    "def bad_{n}(self):\n    open('{text}')\n",
+    "def bad_{n}(self):\n    self.extensions.clear()\n",
+    "def bad_{n}(self):\n    for i in range({n}):\n        print('{text}')\n",
+    "def bad_{n}(self)\n    print('{text}')\n",
+    "print('{text}')\n",
+]
+
+
+def build_snippets(count: int, unique: int, invalid_ratio: float, seed: int = 42) -> List[str]:
+    """Erzeugt `count` Snippets aus `unique` verschiedenen Quelltexten"""
+    rng = random.Random(seed)
+    pool = []
+    for n in range(unique):
+        text = f"weakness {n} in business plan"
+        if rng.random() < invalid_ratio:
+            pool.append(rng.choice(INVALID_TEMPLATES).format(n=n, text=text))
+        else:
+            pool.append(VALID_TEMPLATE.format(n=n, text=text))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def legacy_validate(code_snippet: str) -> bool:
+    """Referenz: bisherige Validierung (ast.walk + isinstance über ein Tupel)"""
+    try:
+        parsed = ast.parse(code_snippet)
+    except SyntaxError:
+        return False
+    if len(parsed.body) != 1 or not isinstance(parsed.body[0], ast.FunctionDef):
+        return False
+    banned = tuple(BANNED_NODES)
+    for node in ast.walk(parsed.body[0]):
+        if isinstance(node, banned):
+            return False
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id != "print":
+                return False
+    compiled = compile(parsed, filename="<safe_ext>", mode="exec")
+    exec(compiled, {"__builtins__": {}, "print": print}, {})
+    return True
+
+
+def _time(label: str, snippets: List[str], fn: Callable[[str], object]) -> Dict:
+    started = time.perf_counter()
+    for snippet in snippets:
+        fn(snippet)
+    elapsed = time.perf_counter() - started
+    return {
+        "name": label,
+        "snippets": len(snippets),
+        "total_s": elapsed,
+        "per_snippet_us": elapsed / len(snippets) * 1e6,
+    }
+
+
+def run(count: int = 5000, unique: int = 250, invalid_ratio: float = 0.3) -> List[Dict]:
+    """Führt alle Varianten aus und gibt die Ergebnisse zurück"""
+    snippets = build_snippets(count, unique, invalid_ratio)
+    table = RoundTable()
+    results = [
+        _time("legacy_walk", snippets, legacy_validate),
+        _time("visitor_uncached", snippets, compile_extension),
+    ]
+
+    extension_cache.clear()
+    extension_cache.maxsize = max(extension_cache.maxsize, unique)
+    results.append(_time("load_extension_cached", snippets, table._validate_and_load_extension))
+    results[-1]["cache"] = extension_cache.info()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für die Erweiterungs-Validierung")
+    parser.add_argument("--snippets", type=int, default=5000, help="Anzahl der Snippets")
+    parser.add_argument("--unique", type=int, default=250, help="Anzahl verschiedener Quelltexte")
+    parser.add_argument("--invalid-ratio", type=float, default=0.3, help="Anteil ungültiger Snippets")
+    args = parser.parse_args()
+
+    # Die demonstrativen print()-Aufrufe der Erweiterungen werden nicht ausgeführt,
+    # exec definiert nur die Funktion.
+    for result in run(args.snippets, args.unique, args.invalid_ratio):
+        line = f"{result['name']:<24} {result['total_s'] * 1000:9.1f} ms  {result['per_snippet_us']:8.1f} µs/Snippet"
+        if "cache" in result:
+            line += f"  (Hit-Ratio {result['cache']['hit_ratio']:.0%})"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
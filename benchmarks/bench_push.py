@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Upload per Contents-API vs. git push
+
+Lädt dasselbe generierte Projekt einmal mit GitHubClient.create_multiple_files
+(ein PUT pro Datei) und einmal mit GitHubClient.push_files (ein git push über
+Smart HTTP) in fake_github_server.py hoch. Beide Wege sehen dieselbe simulierte
+Latenz pro Request.
+
+Verwendung:
+  python benchmarks/bench_push.py
+  python benchmarks/bench_push.py --files 10 --files 200 --latency 0.05 --repeat 5
+  python benchmarks/bench_push.py --json push.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_FILE_COUNTS = [10, 50, 200]
+
+
+def _write_project(path: str, count: int) -> Dict[str, str]:
+    """
+    Erzeugt count Dateien (überwiegend Python, je ~2 KB) auf der Platte und als
+    Dictionary; wie bei generierten Projekten ignoriert die .gitignore dist/,
+    dist/.gitkeep gehört trotzdem zum Upload
+    """
+    files = {'README.md': '# Benchmark\n', '.gitignore': 'dist/\n', 'dist/.gitkeep': ''}
+    for i in range(count - len(files)):
+        files[f'src/module_{i}.py'] = ''.join(f'def function_{i}_{j}():\n    return {j}\n\n' for j in range(60))
+    for relative, content in files.items():
+        target = os.path.join(path, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+    return files
+
+
+def _check_tree(server, repo, files: Dict[str, str]) -> None:
+    """Beide Upload-Wege müssen im Repository genau die Pfade aus files hinterlassen"""
+    owner, name = repo.full_name.split('/', 1)
+    with server.state.lock:
+        uploaded = server.state.repos[(owner.lower(), name.lower())]
+        paths = set(uploaded.head_tree(uploaded.default_branch))
+    if paths != set(files):
+        raise RuntimeError(f"{repo.full_name}: fehlend {sorted(set(files) - paths)}, "
+                           f"zusätzlich {sorted(paths - set(files))}")
+
+
+def run(file_counts: List[int] = None, repeat: int = 3, latency: float = 0.02) -> Dict[str, Dict]:
+    """
+    Misst beide Upload-Wege pro Dateianzahl
+
+    Returns:
+        {'api[N]': {...}, 'push[N]': {...}} mit Sekunden pro Upload und Requests
+    """
+    from fake_github_server import FakeGitHubServer
+    from github_client import GitHubClient, close_shared_clients
+
+    workdir = tempfile.mkdtemp(prefix='autocoder-push-bench-')
+    results: Dict[str, Dict] = {}
+    try:
+        with FakeGitHubServer(latency=latency, git_root=os.path.join(workdir, 'git')) as server:
+            config_path = os.path.join(workdir, 'config.json')
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump({'github_token': 'bench', 'base_url': server.base_url, 'rate_limit_delay': 0,
+                           'seconds_between_requests': 0, 'seconds_between_writes': 0,
+                           'http_cache_dir': os.path.join(workdir, 'http_cache')}, f)
+            client = GitHubClient(config_path)
+
+            for count in file_counts or DEFAULT_FILE_COUNTS:
+                project = os.path.join(workdir, f'project-{count}')
+                files = _write_project(project, count)
+                for mode in ('api', 'push'):
+                    samples = []
+                    requests = 0
+                    for attempt in range(repeat):
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            repo = client.create_repository(f'{mode}-{count}-{attempt}')
+                            before = server.state.request_count
+                            started = time.perf_counter()
+                            if mode == 'api':
+                                client.create_multiple_files(repo, files)
+                            else:
+                                client.push_files(repo, project)
+                            samples.append(time.perf_counter() - started)
+                        requests = server.state.request_count - before
+                        _check_tree(server, repo, files)
+                    results[f'{mode}[{count}]'] = {
+                        'files': len(files),
+                        'bytes': sum(len(content.encode('utf-8')) for content in files.values()),
+                        'requests': requests,
+                        'median_s': statistics.median(samples),
+                        'samples_s': samples,
+                    }
+        close_shared_clients()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upload per Contents-API vs. git push')
+    parser.add_argument('--files', type=int, action='append', help='Dateianzahl (mehrfach möglich)')
+    parser.add_argument('--repeat', type=int, default=3, help='Uploads pro Modus und Dateianzahl')
+    parser.add_argument('--latency', type=float, default=0.02, help='Simulierte Latenz pro Request (Sekunden)')
+    parser.add_argument('--json', help='Ergebnis zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    results = run(args.files, args.repeat, args.latency)
+    print(f"{'Modus':<12} {'Dateien':>8} {'KB':>8} {'Requests':>9} {'Median':>10}")
+    for name, result in results.items():
+        print(f"{name:<12} {result['files']:>8} {result['bytes'] // 1024:>8} {result['requests']:>9} "
+              f"{result['median_s'] * 1000:>8.0f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
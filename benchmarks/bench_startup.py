@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Kaltstart der CLI-Einstiegspunkte
+
+Misst für die häufigsten Aufrufe von auto_coder.py und round_table_cli.py
+die Startzeit (eigener Python-Prozess pro Lauf) und wertet
+`python -X importtime` aus. Schwere Module (PyGithub, Round Table, asyncio),
+die ein Kommando nicht braucht, gelten als Regression (Exit-Code 1).
+
+Verwendung:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py --runs 20 --top 5
+  python benchmarks/bench_startup.py --json startup.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+
+TASK = 'Erstelle eine Flask Web-App'
+
+# Module, die für das jeweilige Kommando nicht geladen werden dürfen
+HEAVY = ['github', 'github_client', 'round_table', 'roundtable_safe', 'extension_sandbox', 'asyncio']
+
+COMMANDS: Dict[str, Tuple[List[str], List[str]]] = {
+    'auto_coder --help': (['auto_coder.py', '--help'], HEAVY),
+    'auto_coder --local-only': (['auto_coder.py', TASK, '--local-only', '--repo-name', 'startup-project'], HEAVY),
+    'round_table_cli --help': (['round_table_cli.py', '--help'], ['round_table', 'roundtable_safe', 'asyncio']),
+    'round_table_cli TASK': (['round_table_cli.py', TASK], []),
+}
+
+
+def _run(argv: List[str], workdir: str, importtime: bool = False) -> Tuple[float, str]:
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else [])
+    command += [os.path.join(REPO_ROOT, argv[0])] + argv[1:]
+    started = time.perf_counter()
+    completed = subprocess.run(command, cwd=workdir, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - started
+    # --help beendet sich mit 0, andere Kommandos ggf. mit 1 (kein GitHub); nur Abstürze zählen
+    if completed.returncode not in (0, 1):
+        raise RuntimeError(f"{' '.join(argv)} fehlgeschlagen:\n{completed.stderr[-2000:]}")
+    return elapsed, completed.stderr
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Wertet die Ausgabe von -X importtime aus
+
+    Returns:
+        {Modul: (self_us, cumulative_us, Tiefe)}
+    """
+    modules: Dict[str, Tuple[int, int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Ein Leerzeichen nach dem Trenner, dann zwei pro Verschachtelungsebene
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def _prepare_workdir() -> str:
+    workdir = tempfile.mkdtemp(prefix='autocoder-startup-')
+    # auto_coder.py bricht ohne config.json ab; ein leerer Token reicht für --local-only
+    with open(os.path.join(workdir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump({}, f)
+    return workdir
+
+
+def measure_command(name: str, runs: int, workdir: str) -> Dict:
+    """Kaltstart-Zeiten und Import-Profil eines Kommandos"""
+    argv, forbidden = COMMANDS[name]
+    _run(argv, workdir)  # Bytecode-Cache anwärmen
+    samples = [_run(argv, workdir)[0] for _ in range(runs)]
+    _, stderr = _run(argv, workdir, importtime=True)
+    modules = parse_importtime(stderr)
+
+    top_level = sorted(((cumulative, module) for module, (_, cumulative, depth) in modules.items() if depth == 0),
+                       reverse=True)
+    return {
+        'samples_s': samples,
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'import_total_s': sum(self_us for self_us, _, _ in modules.values()) / 1e6,
+        'modules': len(modules),
+        'top_imports': [(module, cumulative / 1e6) for cumulative, module in top_level],
+        'forbidden': sorted(module for module in forbidden if module in modules),
+    }
+
+
+def run(runs: int = 10, commands: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """Misst alle (oder die angegebenen) Kommandos"""
+    workdir = _prepare_workdir()
+    try:
+        return {name: measure_command(name, runs, workdir) for name in (commands or list(COMMANDS))}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kaltstart-Benchmark der CLI-Einstiegspunkte')
+    parser.add_argument('--runs', type=int, default=10, help='Prozessstarts pro Kommando')
+    parser.add_argument('--top', type=int, default=3, help='Anzahl der teuersten Imports pro Kommando')
+    parser.add_argument('--only', action='append', choices=sorted(COMMANDS), help='Nur diese Kommandos')
+    parser.add_argument('--json', help='Ergebnis zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    results = run(args.runs, args.only)
+    failures = 0
+    for name, result in results.items():
+        print(f"{name:<26} {result['median_s'] * 1000:8.1f} ms  "
+              f"(Imports {result['import_total_s'] * 1000:.1f} ms, {result['modules']} Module)")
+        for module, seconds in result['top_imports'][:args.top]:
+            print(f"   {module:<30} {seconds * 1000:8.1f} ms")
+        if result['forbidden']:
+            failures += 1
+            print(f"   ❌ Unnötig geladen: {', '.join(result['forbidden'])}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Lasttest - N parallele create_project-Aufrufe gegen den Fake GitHub Server
+
+Startet fake_github_server.py im Hintergrund (oder nutzt --base-url) und
+misst Durchsatz sowie p50/p95/p99-Latenz des kompletten Upload-Pfads.
+
+Verwendung:
+  python benchmarks/load_github.py --projects 50 --concurrency 8
+  python benchmarks/load_github.py --latency 0.02 --error-rate 0.01 --secondary-limit 200
+  python benchmarks/load_github.py --base-url http://127.0.0.1:8765 --json load.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from fake_github_server import FakeGitHubServer  # noqa: E402
+
+TASKS = [
+    'Erstelle eine Flask Web-App mit Login',
+    'Erstelle eine React Todo-App',
+    'Erstelle eine FastAPI REST API',
+    'Erstelle ein Python CLI-Tool für Backups',
+    'Erstelle einen Go Microservice',
+]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Perzentil einer sortierten Liste (nächster Rang)"""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def run_load(base_url: str, projects: int, concurrency: int, rate_limit_delay: float = 0.0,
+             workdir: Optional[str] = None) -> Dict:
+    """
+    Führt `projects` create_project-Aufrufe mit `concurrency` Threads aus
+
+    Returns:
+        Dictionary mit Durchsatz, Latenz-Perzentilen und Fehlern
+    """
+    from auto_coder import GitHubAutoCoder
+
+    own_workdir = workdir is None
+    workdir = workdir or tempfile.mkdtemp(prefix='autocoder-load-')
+    config_path = os.path.join(workdir, 'config.json')
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump({'github_token': 'load-test', 'base_url': base_url,
+                   'rate_limit_delay': rate_limit_delay,
+                   'seconds_between_requests': 0, 'seconds_between_writes': 0,
+                   'pool_size': max(concurrency, 10),
+                   'http_cache_dir': os.path.join(workdir, 'http_cache')}, f)
+
+    local = threading.local()
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def coder() -> 'GitHubAutoCoder':
+        # Ein Auto-Coder pro Thread, wie bei mehreren Web-Workern
+        if not hasattr(local, 'coder'):
+            local.coder = GitHubAutoCoder(config_path=config_path)
+        return local.coder
+
+    def one(index: int) -> None:
+        started = time.perf_counter()
+        result = coder().create_project(TASKS[index % len(TASKS)], repo_name=f'load-project-{index}')
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if not result.get('github_success'):
+                key = str(result.get('error', 'unbekannt'))[:80]
+                errors[key] = errors.get(key, 0) + 1
+
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        # Fortschrittsausgaben aller Threads verwerfen
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = [pool.submit(one, i) for i in range(projects)]
+                for future in as_completed(futures):
+                    future.result()
+            wall = time.perf_counter() - started
+    finally:
+        os.chdir(previous_cwd)
+        if own_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    ordered = sorted(latencies)
+    return {
+        'projects': projects,
+        'concurrency': concurrency,
+        'wall_s': wall,
+        'throughput_per_s': projects / wall if wall else 0.0,
+        'latency_s': {
+            'p50': percentile(ordered, 0.50),
+            'p95': percentile(ordered, 0.95),
+            'p99': percentile(ordered, 0.99),
+            'mean': statistics.fmean(ordered) if ordered else 0.0,
+            'max': ordered[-1] if ordered else 0.0,
+        },
+        'failed': sum(errors.values()),
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lasttest für den GitHub-Upload-Pfad')
+    parser.add_argument('--projects', '-n', type=int, default=20, help='Anzahl create_project-Aufrufe')
+    parser.add_argument('--concurrency', '-c', type=int, default=4, help='Parallele Aufrufe')
+    parser.add_argument('--base-url', help='Vorhandenen Server nutzen statt einen zu starten')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server-Latenz pro Request (Sekunden)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Zusätzliche zufällige Latenz (Sekunden)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Anteil injizierter 502-Fehler')
+    parser.add_argument('--rate-limit', type=int, default=100000, help='Primäres Rate Limit')
+    parser.add_argument('--secondary-limit', type=int, help='Sekundäres Limit (schreibende Requests pro Fenster)')
+    parser.add_argument('--secondary-window', type=float, default=60.0)
+    parser.add_argument('--delay', type=float, default=0.0, help='rate_limit_delay des Clients')
+    parser.add_argument('--json', help='Ergebnis zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server = FakeGitHubServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                  rate_limit=args.rate_limit, secondary_limit=args.secondary_limit,
+                                  secondary_window=args.secondary_window, seed=1).start()
+        base_url = server.base_url
+
+    try:
+        result = run_load(base_url, args.projects, args.concurrency, args.delay)
+    finally:
+        if server:
+            result_server = server.state.stats()
+            server.stop()
+        else:
+            result_server = None
+
+    result['server'] = result_server
+    latency = result['latency_s']
+    print(f"📦 {result['projects']} Projekte, {result['concurrency']} parallel, {result['wall_s']:.2f} s")
+    print(f"🚀 Durchsatz: {result['throughput_per_s']:.2f} Projekte/s")
+    print(f"⏱️  Latenz p50 {latency['p50'] * 1000:.0f} ms | p95 {latency['p95'] * 1000:.0f} ms | "
+          f"p99 {latency['p99'] * 1000:.0f} ms | max {latency['max'] * 1000:.0f} ms")
+    if result['failed']:
+        print(f"❌ Fehlgeschlagen: {result['failed']}")
+        for message, count in result['errors'].items():
+            print(f"   {count}× {message}")
+    if result_server:
+        print(f"🧪 Server: {result_server['requests']} Requests, "
+              f"{result_server['injected_errors']} injizierte Fehler, {result_server['rate_limited']} rate-limitiert")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite - End-to-End Messungen der Auto-Coder Pipeline
+
+Misst:
+- TaskParser.parse_task
+- CodeGenerator.generate_files pro Sprache/Projekttyp
+- GitHubAutoCoder._save_locally auf tmpfs und Festplatte
+- RoundTable.discuss (Simulationsmodus)
+- GitHubAutoCoder.create_project (lokal und gegen fake_github_server.py)
+- Validierung von RoundTable-Erweiterungen
+- Kaltstart der CLI-Einstiegspunkte
+- Upload per Contents-API vs. git push
+
+Ergebnisse werden als JSON gespeichert, damit Commits verglichen werden können.
+
+Verwendung:
+  python benchmarks/run_benchmarks.py
+  python benchmarks/run_benchmarks.py --only generate_files --repeat 10
+  python benchmarks/run_benchmarks.py --output before.json
+  python benchmarks/run_benchmarks.py --compare before.json
+  python benchmarks/run_benchmarks.py --compare before.json after.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+SAMPLE_TASKS = [
+    'Erstelle eine Flask Web-App mit Login und Datenbank',
+    'Erstelle eine React Todo-App mit TypeScript',
+    'Erstelle eine FastAPI REST API für Produktverwaltung',
+    'Erstelle ein Python CLI-Tool für Datei-Backup',
+    'Erstelle einen Go Microservice mit Docker',
+    'Erstelle eine Java Spring Boot API',
+]
+
+GENERATOR_COMBOS = [
+    ('python', 'cli'),
+    ('python', 'web_app'),
+    ('python', 'api'),
+    ('python', 'library'),
+    ('javascript', 'web_app'),
+    ('typescript', 'api'),
+    ('java', 'api'),
+    ('go', 'microservice'),
+]
+
+
+class SkipBenchmark(Exception):
+    """Benchmark kann in dieser Umgebung nicht laufen (z.B. fehlende Dependency)"""
+
+
+def measure(fn: Callable[[], object], repeat: int, number: int = 1,
+            setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Führt fn `repeat` Mal aus (je `number` Aufrufe) und liefert Statistiken pro Aufruf
+
+    Returns:
+        Dictionary mit min/median/mean/p95/stdev in Sekunden
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+    return summarize(samples, number)
+
+
+def summarize(samples: List[float], number: int = 1) -> Dict:
+    """Statistiken über Einzelmessungen (Sekunden pro Aufruf)"""
+    ordered = sorted(samples)
+    return {
+        'repeat': len(ordered),
+        'number': number,
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'mean': statistics.fmean(ordered),
+        'p95': ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        'stdev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """Unterdrückt die Fortschrittsausgaben der Pipeline"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def working_directory(path: str):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _make_plan(language: str, project_type: str):
+    from task_parser import TaskParser
+    parser = TaskParser()
+    plan = parser.parse_task(f'Erstelle ein {language} {project_type} Projekt')
+    plan.language = language
+    plan.project_type = project_type
+    plan.folders = parser._plan_folder_structure(language, project_type)
+    plan.dependencies = parser._get_dependencies(language, project_type, '')
+    plan.gitignore_template = parser.GITIGNORE_TEMPLATES.get(language, '')
+    return plan
+
+
+def _offline_coder():
+    """GitHubAutoCoder ohne GitHub-Verbindung (lokaler Modus)"""
+    try:
+        from auto_coder import GitHubAutoCoder
+    except ImportError as e:
+        raise SkipBenchmark(f'auto_coder nicht importierbar: {e}')
+    with quiet():
+        return GitHubAutoCoder(config_path=os.path.join(tempfile.gettempdir(), 'nonexistent-config.json'))
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def bench_parse_task(repeat: int) -> Dict[str, Dict]:
+    from task_parser import TaskParser
+    parser = TaskParser()
+
+    def run():
+        for task in SAMPLE_TASKS:
+            parser.parse_task(task)
+
+    return {'parse_task': measure(run, repeat, number=100)}
+
+
+def bench_generate_files(repeat: int) -> Dict[str, Dict]:
+    from code_generator import CodeGenerator
+    generator = CodeGenerator()
+    results = {}
+    for language, project_type in GENERATOR_COMBOS:
+        plan = _make_plan(language, project_type)
+        results[f'generate_files[{language}/{project_type}]'] = measure(
+            lambda: generator.generate_files(plan), repeat, number=50
+        )
+    return results
+
+
+def _storage_targets() -> List[Tuple[str, str]]:
+    targets = []
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        targets.append(('tmpfs', '/dev/shm'))
+    targets.append(('disk', BENCH_DIR))
+    return targets
+
+
+def bench_save_locally(repeat: int) -> Dict[str, Dict]:
+    from code_generator import CodeGenerator
+    coder = _offline_coder()
+    plan = _make_plan('python', 'web_app')
+    plan.files = CodeGenerator().generate_files(plan)
+
+    results = {}
+    for label, base in _storage_targets():
+        workdir = tempfile.mkdtemp(prefix='autocoder-bench-', dir=base)
+        target = os.path.join(workdir, plan.repo_name)
+        try:
+            with working_directory(workdir):
+                results[f'save_locally[{label}]'] = measure(
+                    lambda: coder._save_locally(plan), repeat,
+                    setup=lambda: shutil.rmtree(target, ignore_errors=True)
+                )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def bench_round_table(repeat: int) -> Dict[str, Dict]:
+    from round_table import RoundTable
+    table = RoundTable()
+    context = {'language': 'python', 'project_type': 'api'}
+
+    def run():
+        with quiet():
+            asyncio.run(table.discuss('Erstelle ein User Authentication Modul', context))
+
+    return {'round_table_discuss': measure(run, repeat, number=5)}
+
+
+def bench_create_project(repeat: int) -> Dict[str, Dict]:
+    coder = _offline_coder()
+    workdir = tempfile.mkdtemp(prefix='autocoder-bench-', dir=BENCH_DIR)
+
+    def run():
+        with quiet():
+            coder.create_project(SAMPLE_TASKS[0], repo_name='bench-project', local_only=True)
+
+    try:
+        with working_directory(workdir):
+            return {'create_project[local]': measure(
+                run, repeat,
+                setup=lambda: shutil.rmtree(os.path.join(workdir, 'bench-project'), ignore_errors=True)
+            )}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_create_project_github(repeat: int) -> Dict[str, Dict]:
+    try:
+        from auto_coder import GitHubAutoCoder
+    except ImportError as e:
+        raise SkipBenchmark(f'auto_coder nicht importierbar: {e}')
+    from fake_github_server import FakeGitHubServer
+
+    workdir = tempfile.mkdtemp(prefix='autocoder-bench-', dir=BENCH_DIR)
+    config_path = os.path.join(workdir, 'config.json')
+    counter = iter(range(1_000_000))
+
+    with FakeGitHubServer() as server:
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({'github_token': 'bench', 'base_url': server.base_url, 'rate_limit_delay': 0,
+                       'seconds_between_requests': 0, 'seconds_between_writes': 0,
+                       'http_cache_dir': os.path.join(workdir, 'http_cache')}, f)
+        with quiet():
+            coder = GitHubAutoCoder(config_path=config_path)
+            # GitHub-Client wird lazy verbunden; Import von PyGithub nicht mitmessen
+            coder.authenticated
+
+        def run():
+            with quiet():
+                result = coder.create_project(SAMPLE_TASKS[0], repo_name=f'bench-project-{next(counter)}')
+            if not result.get('github_success'):
+                raise RuntimeError(f"GitHub-Upload fehlgeschlagen: {result.get('error')}")
+
+        try:
+            with working_directory(workdir):
+                return {'create_project[fake_github]': measure(run, repeat)}
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_extension_validator(repeat: int) -> Dict[str, Dict]:
+    import bench_extension_validator
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        for result in bench_extension_validator.run(count=2000, unique=200):
+            samples.setdefault(f"extension_validator[{result['name']}]", []).append(
+                result['total_s'] / result['snippets']
+            )
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+def bench_startup(repeat: int) -> Dict[str, Dict]:
+    import bench_startup
+    results = {}
+    for name, result in bench_startup.run(runs=max(repeat, 3)).items():
+        if result['forbidden']:
+            print(f"   ❌ {name}: unnötig geladen: {', '.join(result['forbidden'])}")
+        results[f'startup[{name}]'] = summarize(result['samples_s'])
+    return results
+
+
+def bench_upload(repeat: int) -> Dict[str, Dict]:
+    if shutil.which('git') is None:
+        raise SkipBenchmark('git nicht installiert')
+    try:
+        import bench_push
+        results = bench_push.run(repeat=max(repeat, 1))
+    except ImportError as e:
+        raise SkipBenchmark(f'github_client nicht importierbar: {e}')
+    return {f'upload_{name}': summarize(result['samples_s']) for name, result in results.items()}
+
+
+BENCHMARKS: Dict[str, Callable[[int], Dict[str, Dict]]] = {
+    'parse_task': bench_parse_task,
+    'generate_files': bench_generate_files,
+    'save_locally': bench_save_locally,
+    'round_table': bench_round_table,
+    'create_project': bench_create_project,
+    'create_project_github': bench_create_project_github,
+    'extension_validator': bench_extension_validator,
+    'startup': bench_startup,
+    'upload': bench_upload,
+}
+
+
+# ---------------------------------------------------------------------------
+# Ergebnisse speichern und vergleichen
+# ---------------------------------------------------------------------------
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(selected: List[str], repeat: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    skipped: Dict[str, str] = {}
+    for name in selected:
+        print(f'▶️  {name} ...', flush=True)
+        try:
+            results.update(BENCHMARKS[name](repeat))
+        except (SkipBenchmark, ImportError) as e:
+            skipped[name] = str(e)
+            print(f'   ⚠️  übersprungen: {e}')
+
+    return {
+        'meta': {
+            'revision': _git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'benchmarks': results,
+        'skipped': skipped,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> Tuple[str, int]:
+    """
+    Vergleicht zwei Ergebnisdateien anhand des Medians
+
+    Returns:
+        Tuple (Bericht, Anzahl Regressionen)
+    """
+    base = baseline.get('benchmarks', {})
+    curr = current.get('benchmarks', {})
+    lines = [
+        f"Baseline: {baseline.get('meta', {}).get('revision')}  →  "
+        f"Aktuell: {current.get('meta', {}).get('revision')}",
+        f"{'Benchmark':<45} {'Baseline':>12} {'Aktuell':>12} {'Δ':>8}",
+        '-' * 80,
+    ]
+    regressions = 0
+    for name in sorted(set(base) | set(curr)):
+        if name not in base or name not in curr:
+            lines.append(f"{name:<45} {'nur in ' + ('Baseline' if name in base else 'Aktuell'):>34}")
+            continue
+        before, after = base[name]['median'], curr[name]['median']
+        change = (after - before) / before if before else 0.0
+        marker = ''
+        if change > threshold:
+            marker = '  ❌ Regression'
+            regressions += 1
+        elif change < -threshold:
+            marker = '  ✅ schneller'
+        lines.append(f'{name:<45} {_fmt(before):>12} {_fmt(after):>12} {change:>+7.1%}{marker}')
+    return '\n'.join(lines), regressions
+
+
+def _fmt(seconds: float) -> str:
+    if seconds >= 1:
+        return f'{seconds:.2f} s'
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.2f} ms'
+    return f'{seconds * 1e6:.1f} µs'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark Suite für den GitHub Auto-Coder',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS),
+                        help='Nur diese Benchmarks ausführen (mehrfach möglich)')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen pro Benchmark')
+    parser.add_argument('--output', '-o', help='Ergebnisdatei (Standard: benchmarks/results/<revision>.json)')
+    parser.add_argument('--compare', nargs='+', metavar='JSON',
+                        help='Baseline (und optional aktuelle) Ergebnisdatei vergleichen')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative Verschlechterung, ab der eine Regression gemeldet wird')
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) > 2:
+        parser.error('--compare erwartet eine oder zwei Dateien')
+
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[0], encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.compare[1], encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.only or list(BENCHMARKS), args.repeat)
+        output = args.output or os.path.join(
+            RESULTS_DIR, f"{current['meta']['revision'] or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f'\n💾 Ergebnisse gespeichert: {output}\n')
+        for name, stats in current['benchmarks'].items():
+            print(f"{name:<45} {_fmt(stats['median']):>12}  (p95 {_fmt(stats['p95'])})")
+
+        if not args.compare:
+            return
+        with open(args.compare[0], encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report, regressions = compare(baseline, current, args.threshold)
+    print('\n' + report)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
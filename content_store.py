@@ -0,0 +1,247 @@
+"""
+Content Store - Inhaltsadressierter Speicher für generierte Projektdateien
+
+LICENSE, .gitignore, CI-Workflows und Test-Stubs sind über viele generierte
+Projekte hinweg byte-identisch. Statt jede Datei pro Projekt neu zu schreiben,
+liegt jeder Inhalt genau einmal unter objects/<sha256[:2]>/<sha256[2:]>; die
+Projektordner bekommen Reflinks (Copy-on-Write, btrfs/XFS/APFS) oder Hardlinks
+darauf. Speicherplatz und Schreib-I/O wachsen so mit der Zahl unterschiedlicher
+Inhalte statt mit der Zahl der Projekte.
+
+Objekte sind schreibgeschützt: Hardlinks teilen sich den Inhalt, eine
+Änderung in einem Projekt würde sonst alle anderen mitverändern.
+
+Jeder materialisierte Projektordner wird unter projects/ vermerkt; gc()
+entfernt Vermerke gelöschter Ordner und danach alle Objekte, auf die kein
+Projekt mehr verweist.
+
+Verwendung:
+    store = ContentStore('~/.auto-coder/store')
+    store.materialize({'LICENSE': '...', 'src/main.py': '...'}, './mein-projekt')
+    store.gc()
+"""
+import errno
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from metrics import STORE_FILES
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+LINK_MODES = ('auto', 'reflink', 'hardlink', 'copy')
+
+# ioctl(FICLONE) aus linux/fs.h
+FICLONE = 0x40049409
+
+
+class ContentStore:
+    """Objekt-Speicher mit Links in die Projektordner (thread-sicher)"""
+
+    def __init__(self, root: str, link_mode: str = 'auto'):
+        """
+        Args:
+            root: Verzeichnis des Stores (wird bei Bedarf angelegt)
+            link_mode: 'auto' (Reflink, sonst Hardlink, sonst Kopie), 'reflink', 'hardlink' oder 'copy'
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unbekannter link_mode: {link_mode} (erlaubt: {', '.join(LINK_MODES)})")
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.link_mode = link_mode
+        self.objects_dir = os.path.join(self.root, 'objects')
+        self.projects_dir = os.path.join(self.root, 'projects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.projects_dir, exist_ok=True)
+        # Nach dem ersten Fehlschlag (Dateisystem ohne Reflinks, anderes Device) nicht erneut versuchen
+        self._reflink_ok = link_mode in ('auto', 'reflink') and fcntl is not None
+        self._hardlink_ok = link_mode in ('auto', 'hardlink')
+        self._lock = threading.Lock()
+        # Objekte laufender materialize()-Aufrufe (Digest -> Anzahl); gc() lässt sie stehen,
+        # auch wenn noch kein Projekt-Vermerk auf sie zeigt
+        self._pinned: Dict[str, int] = {}
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put(self, data: bytes) -> str:
+        """
+        Legt einen Inhalt ab, falls er noch nicht vorhanden ist
+
+        Returns:
+            SHA-256 des Inhalts
+        """
+        return self._put(data)[0]
+
+    def _put(self, data: bytes, digest: Optional[str] = None) -> Tuple[str, bool]:
+        digest = digest or hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            STORE_FILES.inc(outcome='deduplicated')
+            return digest, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        STORE_FILES.inc(outcome='new')
+        return digest, True
+
+    def materialize(self, files: Dict[str, str], target_dir: str) -> Dict[str, int]:
+        """
+        Schreibt die Dateien als Links auf Store-Objekte nach target_dir
+
+        Vorhandene Dateien werden ersetzt (auch schreibgeschützte Links eines
+        früheren Laufs).
+
+        Args:
+            files: Dictionary mit {Pfad: Inhalt}
+            target_dir: Projektordner
+
+        Returns:
+            {'files': ..., 'new_objects': ..., 'bytes_written': ...}
+        """
+        target_dir = os.path.abspath(target_dir)
+        digests: Set[str] = set()
+        stats = {'files': 0, 'new_objects': 0, 'bytes_written': 0}
+        try:
+            for relative, content in files.items():
+                data = content.encode('utf-8')
+                digest = hashlib.sha256(data).hexdigest()
+                # Vor _put anheften: ein paralleles gc() darf das Objekt bis zum Vermerk nicht löschen
+                if digest not in digests:
+                    self._pin(digest)
+                    digests.add(digest)
+                digest, created = self._put(data, digest)
+                if created:
+                    stats['new_objects'] += 1
+                    stats['bytes_written'] += len(data)
+
+                destination = os.path.join(target_dir, relative)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                self._link(self.object_path(digest), destination)
+                stats['files'] += 1
+
+            self._register(target_dir, digests)
+        finally:
+            self._unpin(digests)
+        return stats
+
+    def gc(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Entfernt Vermerke gelöschter Projektordner und unreferenzierte Objekte
+
+        Args:
+            dry_run: Nur zählen, nichts löschen
+
+        Returns:
+            {'projects_removed': ..., 'objects_removed': ..., 'bytes_freed': ...}
+        """
+        stats = {'projects_removed': 0, 'objects_removed': 0, 'bytes_freed': 0}
+        with self._lock:
+            live: Set[str] = set(self._pinned)
+            for entry in os.listdir(self.projects_dir):
+                manifest = os.path.join(self.projects_dir, entry)
+                try:
+                    with open(manifest, 'r', encoding='utf-8') as f:
+                        project = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if os.path.isdir(project['path']):
+                    live.update(project['objects'])
+                    continue
+                stats['projects_removed'] += 1
+                if not dry_run:
+                    os.unlink(manifest)
+
+            for digest, path in self._objects():
+                if digest in live:
+                    continue
+                stats['objects_removed'] += 1
+                stats['bytes_freed'] += os.path.getsize(path)
+                if not dry_run:
+                    os.unlink(path)
+        return stats
+
+    def _objects(self) -> Iterator[Tuple[str, str]]:
+        for prefix in os.listdir(self.objects_dir):
+            directory = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(directory):
+                if not name.startswith('.tmp-'):
+                    yield prefix + name, os.path.join(directory, name)
+
+    def _pin(self, digest: str) -> None:
+        with self._lock:
+            self._pinned[digest] = self._pinned.get(digest, 0) + 1
+
+    def _unpin(self, digests: Set[str]) -> None:
+        with self._lock:
+            for digest in digests:
+                if self._pinned[digest] > 1:
+                    self._pinned[digest] -= 1
+                else:
+                    del self._pinned[digest]
+
+    def _register(self, target_dir: str, digests: Set[str]) -> None:
+        """Vermerkt, welche Objekte ein Projektordner nutzt (ersetzt einen früheren Vermerk)"""
+        key = hashlib.sha256(target_dir.encode('utf-8')).hexdigest()[:16]
+        manifest = os.path.join(self.projects_dir, f'{key}.json')
+        with self._lock:
+            tmp = manifest + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'path': target_dir, 'objects': sorted(digests)}, f)
+            os.replace(tmp, manifest)
+
+    def _link(self, source: str, destination: str) -> None:
+        """Reflink, Hardlink oder Kopie; ersetzt destination atomar"""
+        tmp = f'{destination}.tmp-{os.getpid()}-{threading.get_ident()}'
+        try:
+            if not (self._reflink_ok and self._reflink(source, tmp)):
+                if not (self._hardlink_ok and self._hardlink(source, tmp)):
+                    shutil.copyfile(source, tmp)
+            os.replace(tmp, destination)
+        except BaseException:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _reflink(self, source: str, destination: str) -> bool:
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            if os.path.exists(destination):
+                os.unlink(destination)
+            if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                self._reflink_ok = False
+                if self.link_mode == 'reflink':
+                    raise
+                return False
+            raise
+
+    def _hardlink(self, source: str, destination: str) -> bool:
+        try:
+            os.link(source, destination)
+            return True
+        except OSError as e:
+            if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                self._hardlink_ok = False
+                if self.link_mode == 'hardlink':
+                    raise
+                return False
+            raise
+
@@ -3,6 +3,9 @@
 Round Table Dashboard - Web-basiertes Interface für das Round Table System
 """
 from flask import Flask, render_template, request, jsonify, session
+import hashlib
+import hmac
+import math
 import os
 import sys
 import asyncio
@@ -13,9 +16,13 @@ from pathlib import Path
 # Importiere Round Table
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from round_table import RoundTable
+from admission import AdmissionController, AdmissionRejected
+from metrics import IN_FLIGHT, install_flask
+from singleflight import SingleFlight
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
+install_flask(app, 'dashboard')  # GET /metrics
 
 # Initialisiere Round Table
 round_table = RoundTable()
@@ -23,6 +30,71 @@ round_table = RoundTable()
 # Historie speichern
 history = []
 
+# Gleichzeitige identische Diskussionen nur einmal ausführen
+discussions = SingleFlight('discussion')
+
+# Begrenzung für /api/discuss; Startwerte optional als JSON in DASHBOARD_LIMITS,
+# zur Laufzeit über PUT /api/admin/limits änderbar
+admission = AdmissionController('discuss')
+admission.configure(**json.loads(os.environ.get('DASHBOARD_LIMITS') or '{}'))
+
+# Latenz-Budget (Sekunden) pro Diskussion: langsame Modelle werden ersetzt bzw. nach Ablauf
+# abgebrochen; 0 schaltet das Routing ab (voller Tisch), "budget" im Request überschreibt
+LATENCY_BUDGET = float(os.environ.get('DASHBOARD_LATENCY_BUDGET') or 5)
+
+
+def _client_id() -> str:
+    """Client-Schlüssel für das Rate Limit: API-Key (gehasht) oder IP-Adresse"""
+    api_key = request.headers.get('X-API-Key')
+    if api_key:
+        return 'key:' + hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+    return 'ip:' + (request.remote_addr or 'unknown')
+
+
+def _is_admin() -> bool:
+    """X-Admin-Token == DASHBOARD_ADMIN_TOKEN; ohne gesetzten Token nur von localhost"""
+    token = os.environ.get('DASHBOARD_ADMIN_TOKEN')
+    if token:
+        return hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token)
+    return request.remote_addr in ('127.0.0.1', '::1')
+
+
+def _discussion_options(data: dict) -> dict:
+    """Optionale Diskussions-Parameter aus dem Request (models, weights, early_exit, budget)"""
+    options = {}
+    if data.get('models'):
+        models = data['models']
+        options['models'] = [models] if isinstance(models, str) else list(models)
+    if data.get('weights'):
+        options['weights'] = dict(data['weights'])
+    if data.get('early_exit'):
+        options['early_exit'] = True
+    budget = data.get('budget', LATENCY_BUDGET)
+    if budget:
+        options['budget'] = budget
+    return options
+
+
+def _discussion_key(task: str, context: dict, options: dict) -> tuple:
+    """Schlüssel für identische Diskussionen (Leerraum und Reihenfolge im Kontext egal)"""
+    return ' '.join(task.split()), json.dumps(context, sort_keys=True), json.dumps(options, sort_keys=True)
+
+
+def _run_discussion(task: str, context: dict, options: dict):
+    """Führt eine Round Table Diskussion in einer eigenen Event-Loop aus (belegt einen Platz)"""
+    with admission.slot():
+        return _discuss_in_loop(task, context, options)
+
+
+def _discuss_in_loop(task: str, context: dict, options: dict):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        with IN_FLIGHT.track_inprogress(kind='discussion'):
+            return loop.run_until_complete(round_table.discuss(task, context, **options))
+    finally:
+        loop.close()
+
 
 @app.route('/')
 def index():
@@ -47,24 +119,28 @@ def api_discuss():
             'language': language,
             'project_type': project_type
         }
+        try:
+            options = _discussion_options(data)
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': f'Ungültige Optionen: {e}'}), 400
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        result = loop.run_until_complete(
-            round_table.discuss(task, context)
+        # Angehängte Requests belegen keinen eigenen Platz, zählen aber für das Client-Limit
+        admission.check_client(_client_id())
+        result, shared = discussions.do(
+            _discussion_key(task, context, options),
+            lambda: _run_discussion(task, context, options)
         )
         
-        loop.close()
-        
         # Formatiere Ergebnis für JSON
         response_data = {
             'success': True,
+            'coalesced': shared,
             'task': result.task,
             'consensus_code': result.consensus_code,
             'discussion_summary': result.discussion_summary,
             'final_recommendation': result.final_recommendation,
             'timestamp': result.timestamp.isoformat(),
+            'stats': result.stats,
             'individual_responses': [
                 {
                     'model': r.model.value,
@@ -76,21 +152,44 @@ def api_discuss():
             ]
         }
         
-        # Speichere in Historie
-        history.append({
-            'task': task,
-            'language': language,
-            'project_type': project_type,
-            'timestamp': result.timestamp.isoformat(),
-            'code_length': len(result.consensus_code)
-        })
+        # Speichere in Historie (zusammengefasste Requests nur einmal)
+        if not shared:
+            history.append({
+                'task': task,
+                'language': language,
+                'project_type': project_type,
+                'timestamp': result.timestamp.isoformat(),
+                'code_length': len(result.consensus_code)
+            })
         
         return jsonify(response_data)
         
+    except AdmissionRejected as e:
+        response = jsonify({'error': str(e), 'reason': e.reason})
+        response.headers['Retry-After'] = str(math.ceil(e.retry_after))
+        return response, 429
+    except ValueError as e:
+        # Unbekannte Modelle oder ungültige Gewichte
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/admin/limits', methods=['GET', 'PUT'])
+def api_admin_limits():
+    """Limits von /api/discuss lesen bzw. zur Laufzeit ändern"""
+    if not _is_admin():
+        return jsonify({'error': 'Nicht berechtigt'}), 403
+    
+    if request.method == 'GET':
+        return jsonify(admission.limits())
+    
+    try:
+        return jsonify(admission.configure(**(request.json or {})))
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+
+
 @app.route('/api/history')
 def api_history():
     """Gibt die Historie zurück"""
@@ -161,7 +260,8 @@ def api_stats():
         return jsonify({
             'total_tasks': 0,
             'languages': {},
-            'project_types': {}
+            'project_types': {},
+            'coalesced_requests': discussions.coalesced
         })
     
     # Zähle Sprachen
@@ -179,7 +279,8 @@ def api_stats():
     return jsonify({
         'total_tasks': total_tasks,
         'languages': languages,
-        'project_types': project_types
+        'project_types': project_types,
+        'coalesced_requests': discussions.coalesced
     })
 
 
@@ -0,0 +1,281 @@
+"""
+Extension Sandbox - Führt validierte RoundTable-Erweiterungen isoliert aus
+
+Ein Pool vorab gestarteter (warmer) Worker-Prozesse mit Ressourcenlimits:
+- CPU-Zeit pro Aufruf (RLIMIT_CPU, neu gesetzt vor jedem Aufruf)
+- Adressraum (RLIMIT_AS)
+- Wall-Clock-Zeit (Timeout im aufrufenden Event Loop)
+
+Ein Worker, der ein Limit reißt, wird beendet und sofort ersetzt.
+Die Kommunikation läuft über Pipes und blockiert den Event Loop nicht.
+"""
+import asyncio
+import atexit
+import marshal
+import multiprocessing
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import CodeType, SimpleNamespace
+from typing import Any, Deque, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+SANDBOX_AVAILABLE = resource is not None
+
+
+@dataclass
+class SandboxLimits:
+    """Ressourcenlimits für einen einzelnen Erweiterungs-Aufruf"""
+    cpu_seconds: int = 1
+    memory_bytes: int = 1024 * 1024 * 1024
+    wall_seconds: float = 2.0
+    max_output_bytes: int = 64 * 1024
+
+
+@dataclass
+class SandboxResult:
+    """Ergebnis eines Erweiterungs-Aufrufs"""
+    ok: bool
+    output: str = ""
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+def _arm_cpu_limit(cpu_seconds: int) -> None:
+    """Setzt das weiche CPU-Limit auf bisherigen Verbrauch + Budget (RLIMIT_CPU ist kumulativ)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn: Any, limits: SandboxLimits) -> None:
+    """Hauptschleife eines Worker-Prozesses"""
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory_bytes, limits.memory_bytes))
+    except (ValueError, OSError):
+        pass
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        code_bytes, func_name = message
+        output: List[str] = []
+        written = [0]
+
+        def _print(*args: Any, sep: str = " ", end: str = "\n", **_: Any) -> None:
+            text = sep.join(str(a) for a in args) + end
+            remaining = limits.max_output_bytes - written[0]
+            if remaining > 0:
+                output.append(text[:remaining])
+                written[0] += len(text)
+
+        try:
+            _arm_cpu_limit(limits.cpu_seconds)
+            code = marshal.loads(code_bytes)
+            safe_globals = {"__builtins__": {}, "print": _print}
+            local_ns: dict = {}
+            exec(code, safe_globals, local_ns)
+            func = local_ns.get(func_name) or safe_globals.get(func_name)
+            if not callable(func):
+                raise LookupError(f"Funktion nicht gefunden: {func_name}")
+            # Erweiterungen sind als Methoden geschrieben, self ist ein leerer Platzhalter
+            func(SimpleNamespace())
+            reply = ("ok", "".join(output), None)
+        except BaseException as e:
+            reply = ("error", "".join(output), f"{e.__class__.__name__}: {e}")
+
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            break
+
+
+class _Worker:
+    def __init__(self, process: Any, conn: Any) -> None:
+        self.process = process
+        self.conn = conn
+
+
+class ExtensionSandboxPool:
+    """
+    Pool warmer Worker-Prozesse für die Ausführung von Erweiterungen.
+
+    Kann aus beliebigen Event Loops (auch mehreren Threads) genutzt werden.
+    """
+
+    def __init__(self, workers: int = 2, limits: Optional[SandboxLimits] = None,
+                 start_method: Optional[str] = None) -> None:
+        if not SANDBOX_AVAILABLE:
+            raise RuntimeError("Sandbox benötigt das resource-Modul (nur Unix)")
+
+        self.limits = limits or SandboxLimits()
+        self.size = max(1, workers)
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context(start_method or ("fork" if "fork" in methods else "spawn"))
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._closed = False
+        self.restarts = 0
+
+        for _ in range(self.size):
+            self._idle.append(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(target=_worker_main, args=(child_conn, self.limits), daemon=True)
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    async def run(self, code: CodeType, func_name: str) -> SandboxResult:
+        """
+        Führt eine bereits validierte und kompilierte Erweiterung in einem Worker aus
+
+        Args:
+            code: Kompilierter Modul-Code, der genau die Funktion definiert
+            func_name: Name der aufzurufenden Funktion
+
+        Returns:
+            SandboxResult mit gesammelter print()-Ausgabe oder Fehler
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox-Pool wurde bereits beendet")
+
+        payload = (marshal.dumps(code), func_name)
+        worker = await self._acquire()
+        started = time.monotonic()
+        try:
+            worker.conn.send(payload)
+            status, output, error = await asyncio.wait_for(self._receive(worker), self.limits.wall_seconds)
+        except asyncio.TimeoutError:
+            self._replace(worker)
+            return SandboxResult(False, "", f"Zeitlimit überschritten ({self.limits.wall_seconds}s)",
+                                 time.monotonic() - started)
+        except (EOFError, OSError):
+            # Worker wurde vom Kernel beendet (z.B. SIGXCPU nach CPU-Limit)
+            self._replace(worker)
+            return SandboxResult(False, "", "Worker beendet (Ressourcenlimit überschritten)",
+                                 time.monotonic() - started)
+        except BaseException:
+            self._replace(worker)
+            raise
+
+        self._release(worker)
+        return SandboxResult(status == "ok", output, error, time.monotonic() - started)
+
+    async def _receive(self, worker: _Worker) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        fd = worker.conn.fileno()
+
+        def _ready() -> None:
+            if future.done():
+                return
+            try:
+                future.set_result(worker.conn.recv())
+            except BaseException as e:
+                future.set_exception(e)
+
+        loop.add_reader(fd, _ready)
+        try:
+            return await future
+        finally:
+            loop.remove_reader(fd)
+
+    async def _acquire(self) -> _Worker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            if self._closed:
+                self._stop(worker)
+                return
+            while self._waiters:
+                future = self._waiters.popleft()
+                if not future.done():
+                    future.get_loop().call_soon_threadsafe(self._deliver, future, worker)
+                    return
+            self._idle.append(worker)
+
+    def _deliver(self, future: asyncio.Future, worker: _Worker) -> None:
+        if future.done():
+            self._release(worker)
+        else:
+            future.set_result(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        self._stop(worker)
+        if self._closed:
+            return
+        self.restarts += 1
+        self._release(self._spawn())
+
+    @staticmethod
+    def _stop(worker: _Worker) -> None:
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=1)
+
+    def shutdown(self) -> None:
+        """Beendet alle Worker"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle, self._idle = self._idle, []
+            waiters, self._waiters = self._waiters, deque()
+        for future in waiters:
+            if not future.done():
+                future.get_loop().call_soon_threadsafe(future.cancel)
+        for worker in idle:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            self._stop(worker)
+
+
+_default_pool: Optional[ExtensionSandboxPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> Optional[ExtensionSandboxPool]:
+    """Gibt den prozessweiten Pool zurück (None, wenn keine Sandbox verfügbar ist)"""
+    global _default_pool
+    if not SANDBOX_AVAILABLE:
+        return None
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ExtensionSandboxPool()
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
@@ -0,0 +1,912 @@
+#!/usr/bin/env python3
+"""
+Fake GitHub Server - Lokaler Stand-in der GitHub REST API für Offline- und Lasttests
+
+Unterstützt die Endpunkte, die GitHubClient (PyGithub) benutzt:
+- Benutzer:       GET /user, GET /users/{login}, GET /user/repos
+- Repositories:   POST /user/repos, GET/PATCH/DELETE /repos/{owner}/{repo}
+- Templates:      POST /repos/{owner}/{repo}/generate
+- Contents:       GET/PUT /repos/{owner}/{repo}/contents/{path}
+- Git-Daten:      blobs, trees, commits, refs unter /repos/{owner}/{repo}/git/...
+- Rate Limits:    GET /rate_limit und X-RateLimit-* Header
+- GraphQL:        POST /graphql (nur die Repository-Abfragen aus GitHubClient)
+- Git Smart HTTP: /{owner}/{repo}.git/... über `git http-backend` (nur mit --git-root)
+
+Simulierbar: Latenz, zufällige Serverfehler, primäres Rate Limit und
+sekundäres Rate Limit (403 mit Retry-After).
+
+Verwendung:
+  python fake_github_server.py --port 8765 --latency 0.05 --error-rate 0.01
+
+  # config.json
+  {"github_token": "fake", "base_url": "http://127.0.0.1:8765"}
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _git_sha(kind: str, payload: bytes) -> str:
+    return hashlib.sha1(f'{kind} {len(payload)}\0'.encode() + payload).hexdigest()
+
+
+class HTTPError(Exception):
+    """Fehlerantwort im GitHub-Format"""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None,
+                 errors: Optional[List[Dict]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+        self.errors = errors
+
+
+class FakeRepository:
+    """Repository mit flachem Git-Modell (Bäume als {Pfad: Blob-SHA})"""
+
+    def __init__(self, owner: str, name: str, repo_id: int, description: str = '',
+                 private: bool = False, default_branch: str = 'main'):
+        self.owner = owner
+        self.name = name
+        self.id = repo_id
+        self.description = description
+        self.private = private
+        self.default_branch = default_branch
+        self.is_template = False
+        self.created_at = _now()
+        self.pushed_at = self.created_at
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, Dict[str, str]] = {}
+        self.commits: Dict[str, Dict[str, Any]] = {}
+        self.refs: Dict[str, str] = {}
+
+    @property
+    def full_name(self) -> str:
+        return f'{self.owner}/{self.name}'
+
+    @property
+    def empty(self) -> bool:
+        return not self.refs
+
+    def add_blob(self, content: bytes) -> str:
+        sha = _git_sha('blob', content)
+        self.blobs[sha] = content
+        return sha
+
+    def add_tree(self, entries: Dict[str, str]) -> str:
+        payload = json.dumps(sorted(entries.items())).encode()
+        sha = _git_sha('tree', payload)
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def add_commit(self, message: str, tree_sha: str, parents: List[str]) -> str:
+        commit = {
+            'message': message,
+            'tree': tree_sha,
+            'parents': parents,
+            'date': _now(),
+        }
+        sha = _git_sha('commit', json.dumps(commit, sort_keys=True).encode())
+        self.commits[sha] = commit
+        return sha
+
+    def head_tree(self, branch: str) -> Dict[str, str]:
+        head = self.refs.get(f'refs/heads/{branch}')
+        if not head:
+            return {}
+        return self.trees[self.commits[head]['tree']]
+
+    def size_kb(self) -> int:
+        tree = self.head_tree(self.default_branch)
+        return sum(len(self.blobs[sha]) for sha in tree.values()) // 1024
+
+
+class FakeGitHubState:
+    """Gemeinsamer Zustand aller Requests (thread-sicher)"""
+
+    def __init__(self, login: str = 'fake-user', rate_limit: int = 5000,
+                 secondary_limit: Optional[int] = None, secondary_window: float = 60.0,
+                 error_rate: float = 0.0, latency: float = 0.0, jitter: float = 0.0,
+                 seed: Optional[int] = None, git_root: Optional[str] = None):
+        self.login = login
+        self.git_root = git_root
+        self.rate_limit = rate_limit
+        self.secondary_limit = secondary_limit
+        self.secondary_window = secondary_window
+        self.error_rate = error_rate
+        self.latency = latency
+        self.jitter = jitter
+        self.lock = threading.RLock()
+        self.random = random.Random(seed)
+        # Schlüssel klein geschrieben: GitHub vergleicht Owner und Name case-insensitiv
+        self.repos: Dict[Tuple[str, str], FakeRepository] = {}
+        self.next_id = 1
+        self.remaining: Dict[str, int] = {}
+        self.reset_at = int(time.time()) + 3600
+        self.write_times: deque = deque()
+        self.request_count = 0
+        self.route_counts: Dict[str, int] = {}
+        self.injected_errors = 0
+        self.rate_limited = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'requests': self.request_count,
+                'routes': dict(self.route_counts),
+                'injected_errors': self.injected_errors,
+                'rate_limited': self.rate_limited,
+                'repositories': len(self.repos),
+            }
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """HTTP-Handler, der die GitHub-Routen abbildet"""
+
+    server_version = 'FakeGitHub/1.0'
+    protocol_version = 'HTTP/1.1'
+    # Header und Body werden getrennt geschrieben; ohne TCP_NODELAY kostet Keep-Alive ~40 ms pro Request
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ('GET', r'/rate_limit', 'rate_limit'),
+        ('POST', r'/graphql', 'graphql'),
+        ('GET', r'/user', 'get_user'),
+        ('GET', r'/users/(?P<login>[^/]+)', 'get_user'),
+        ('GET', r'/user/repos', 'list_repos'),
+        ('POST', r'/user/repos', 'create_repo'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)', 'get_repo'),
+        ('PATCH', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)', 'edit_repo'),
+        ('DELETE', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)', 'delete_repo'),
+        ('POST', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/generate', 'generate_repo'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/contents/(?P<path>.+)', 'get_content'),
+        ('PUT', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/contents/(?P<path>.+)', 'put_content'),
+        ('POST', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/blobs', 'create_blob'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/blobs/(?P<sha>\w+)', 'get_blob'),
+        ('POST', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/trees', 'create_tree'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/trees/(?P<sha>\w+)', 'get_tree'),
+        ('POST', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/commits', 'create_commit'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/commits/(?P<sha>\w+)', 'get_commit'),
+        ('GET', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/refs?/(?P<ref>.+)', 'get_ref'),
+        ('POST', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/refs', 'create_ref'),
+        ('PATCH', r'/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/git/refs/(?P<ref>.+)', 'update_ref'),
+    ]
+    COMPILED_ROUTES = [(method, re.compile(f'^{pattern}/?$'), name) for method, pattern, name in ROUTES]
+    GRAPHQL_ALIAS = re.compile(r'(\w+): repository\(owner: ("(?:[^"\\]|\\.)*"), name: ("(?:[^"\\]|\\.)*")\)')
+    GRAPHQL_CONNECTION = re.compile(r'repositories\(first: (\d+)')
+    GIT_PATH = re.compile(r'^/(?P<owner>[^/]+)/(?P<repo>[^/]+?)\.git(?P<path_info>/.*)$')
+
+    @property
+    def state(self) -> FakeGitHubState:
+        return self.server.state  # type: ignore[attr-defined]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]  # type: ignore[attr-defined]
+        return f'http://{host}:{port}'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keine Zugriffslogs auf stderr (Lasttests)
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_PUT(self) -> None:
+        self._dispatch('PUT')
+
+    def do_PATCH(self) -> None:
+        self._dispatch('PATCH')
+
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+
+    # ------------------------------------------------------------------
+    # Infrastruktur
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            raw = self._read_chunked()
+        else:
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+        state = self.state
+
+        if state.latency or state.jitter:
+            time.sleep(state.latency + state.random.uniform(0, state.jitter))
+
+        git_match = self.GIT_PATH.match(parsed.path)
+        if git_match and state.git_root:
+            with state.lock:
+                state.request_count += 1
+                state.route_counts['git'] = state.route_counts.get('git', 0) + 1
+            self._handle_git(method, parsed.query, raw, **git_match.groupdict())
+            return
+
+        token = (self.headers.get('Authorization') or '').split(' ')[-1] or 'anonymous'
+        path = parsed.path.rstrip('/') or '/'
+        handler, params = self._match(method, path)
+
+        with state.lock:
+            state.request_count += 1
+            state.route_counts[handler or 'unknown'] = state.route_counts.get(handler or 'unknown', 0) + 1
+
+        try:
+            if handler is None:
+                raise HTTPError(404, 'Not Found')
+            self._check_limits(method, token, handler)
+            body = json.loads(raw) if raw else {}
+            status, payload, headers = getattr(self, f'_handle_{handler}')(body, **params)
+            if method == 'GET' and status == 200:
+                etag = 'W/"%s"' % hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+                headers['ETag'] = etag
+                if self.headers.get('If-None-Match') == etag:
+                    # 304 zählt wie bei GitHub nicht gegen das Rate Limit
+                    self._refund(token, handler)
+                    self._send(304, None, headers, token)
+                    return
+            self._send(status, payload, headers, token)
+        except HTTPError as e:
+            payload = {'message': e.message, 'documentation_url': 'https://docs.github.com/rest'}
+            if e.errors:
+                payload['errors'] = e.errors
+            self._send(e.status, payload, e.headers, token)
+
+    def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _match(self, method: str, path: str) -> Tuple[Optional[str], Dict[str, str]]:
+        for route_method, pattern, name in self.COMPILED_ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return name, {k: unquote(v) for k, v in match.groupdict().items()}
+        return None, {}
+
+    def _check_limits(self, method: str, token: str, handler: str) -> None:
+        state = self.state
+        with state.lock:
+            if state.error_rate and state.random.random() < state.error_rate:
+                state.injected_errors += 1
+                raise HTTPError(502, 'Server Error')
+
+            if handler == 'rate_limit':
+                return
+
+            now = time.monotonic()
+            if state.secondary_limit and method != 'GET':
+                while state.write_times and now - state.write_times[0] > state.secondary_window:
+                    state.write_times.popleft()
+                if len(state.write_times) >= state.secondary_limit:
+                    state.rate_limited += 1
+                    retry_after = max(1, int(state.secondary_window - (now - state.write_times[0])) + 1)
+                    raise HTTPError(403, 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.',
+                                    {'Retry-After': str(retry_after)})
+                state.write_times.append(now)
+
+            remaining = state.remaining.get(token, state.rate_limit)
+            if remaining <= 0:
+                state.rate_limited += 1
+                raise HTTPError(403, 'API rate limit exceeded for user ID 1.')
+            state.remaining[token] = remaining - 1
+
+    def _refund(self, token: str, handler: str) -> None:
+        with self.state.lock:
+            self.state.remaining[token] = self.state.remaining.get(token, self.state.rate_limit) + 1
+
+    def _send(self, status: int, payload: Any, headers: Dict[str, str], token: str) -> None:
+        state = self.state
+        body = b'' if payload is None or status in (204, 304) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        with state.lock:
+            remaining = state.remaining.get(token, state.rate_limit)
+        self.send_header('X-RateLimit-Limit', str(state.rate_limit))
+        self.send_header('X-RateLimit-Remaining', str(max(remaining, 0)))
+        self.send_header('X-RateLimit-Reset', str(state.reset_at))
+        self.send_header('X-RateLimit-Used', str(state.rate_limit - max(remaining, 0)))
+        self.send_header('X-RateLimit-Resource', 'core')
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    # ------------------------------------------------------------------
+    # JSON-Darstellungen
+    # ------------------------------------------------------------------
+
+    def _user_json(self, login: str) -> Dict[str, Any]:
+        return {
+            'login': login,
+            'id': 1,
+            'node_id': 'U_fake',
+            'type': 'User',
+            'url': f'{self.base_url}/users/{login}',
+            'html_url': f'{self.base_url}/{login}',
+            'repos_url': f'{self.base_url}/users/{login}/repos',
+            'name': login,
+            'site_admin': False,
+        }
+
+    def _repo_json(self, repo: FakeRepository) -> Dict[str, Any]:
+        api = f'{self.base_url}/repos/{repo.full_name}'
+        return {
+            'id': repo.id,
+            'node_id': f'R_fake{repo.id}',
+            'name': repo.name,
+            'full_name': repo.full_name,
+            'owner': self._user_json(repo.owner),
+            'private': repo.private,
+            'visibility': 'private' if repo.private else 'public',
+            'description': repo.description,
+            'url': api,
+            'html_url': f'{self.base_url}/{repo.full_name}',
+            'clone_url': f'{self.base_url}/{repo.full_name}.git',
+            'git_url': f'{self.base_url}/{repo.full_name}.git',
+            'default_branch': repo.default_branch,
+            'is_template': repo.is_template,
+            'created_at': repo.created_at,
+            'updated_at': repo.pushed_at,
+            'pushed_at': repo.pushed_at,
+            'size': repo.size_kb(),
+            'language': None,
+            'fork': False,
+        }
+
+    def _commit_json(self, repo: FakeRepository, sha: str) -> Dict[str, Any]:
+        commit = repo.commits[sha]
+        api = f'{self.base_url}/repos/{repo.full_name}/git'
+        return {
+            'sha': sha,
+            'url': f'{api}/commits/{sha}',
+            'html_url': f'{self.base_url}/{repo.full_name}/commit/{sha}',
+            'message': commit['message'],
+            'tree': {'sha': commit['tree'], 'url': f"{api}/trees/{commit['tree']}"},
+            'parents': [{'sha': p, 'url': f'{api}/commits/{p}'} for p in commit['parents']],
+            'author': {'name': self.state.login, 'email': 'fake@example.com', 'date': commit['date']},
+            'committer': {'name': self.state.login, 'email': 'fake@example.com', 'date': commit['date']},
+        }
+
+    def _ref_json(self, repo: FakeRepository, ref: str) -> Dict[str, Any]:
+        sha = repo.refs[ref]
+        return {
+            'ref': ref,
+            'url': f'{self.base_url}/repos/{repo.full_name}/git/{ref}',
+            'object': {'sha': sha, 'type': 'commit',
+                       'url': f'{self.base_url}/repos/{repo.full_name}/git/commits/{sha}'},
+        }
+
+    def _repo_graphql(self, repo: FakeRepository) -> Dict[str, Any]:
+        head = repo.refs.get(f'refs/heads/{repo.default_branch}')
+        branch = None
+        if head:
+            commit = repo.commits[head]
+            branch = {'name': repo.default_branch, 'target': {
+                'oid': head,
+                'messageHeadline': commit['message'].split('\n', 1)[0],
+                'committedDate': commit['date'],
+            }}
+        return {
+            'name': repo.name,
+            'nameWithOwner': repo.full_name,
+            'url': f'{self.base_url}/{repo.full_name}',
+            'description': repo.description or None,
+            'isPrivate': repo.private,
+            'createdAt': repo.created_at,
+            'diskUsage': repo.size_kb(),
+            'primaryLanguage': None,
+            'defaultBranchRef': branch,
+        }
+
+    def _repo(self, owner: str, repo: str) -> FakeRepository:
+        found = self.state.repos.get((owner.lower(), repo.lower()))
+        if found is None:
+            raise HTTPError(404, 'Not Found')
+        return found
+
+    def _require_git(self, repo: FakeRepository) -> None:
+        if repo.empty:
+            raise HTTPError(409, 'Git Repository is empty.')
+
+    # ------------------------------------------------------------------
+    # Routen
+    # ------------------------------------------------------------------
+
+    def _handle_rate_limit(self, body: Dict) -> Tuple[int, Any, Dict]:
+        token = (self.headers.get('Authorization') or '').split(' ')[-1] or 'anonymous'
+        with self.state.lock:
+            remaining = self.state.remaining.get(token, self.state.rate_limit)
+        core = {'limit': self.state.rate_limit, 'remaining': max(remaining, 0),
+                'reset': self.state.reset_at, 'used': self.state.rate_limit - max(remaining, 0)}
+        other = {'limit': 5000, 'remaining': 5000, 'reset': self.state.reset_at, 'used': 0}
+        return 200, {'resources': {'core': core, 'search': other, 'graphql': other}, 'rate': core}, {}
+
+    def _handle_get_user(self, body: Dict, login: Optional[str] = None) -> Tuple[int, Any, Dict]:
+        return 200, self._user_json(login or self.state.login), {}
+
+    def _handle_list_repos(self, body: Dict) -> Tuple[int, Any, Dict]:
+        per_page = min(int(self.query.get('per_page', 30)), 100)
+        page = max(int(self.query.get('page', 1)), 1)
+        with self.state.lock:
+            repos = sorted((r for r in self.state.repos.values() if r.owner == self.state.login),
+                           key=lambda r: r.id)
+            items = [self._repo_json(r) for r in repos[(page - 1) * per_page:page * per_page]]
+        headers = {}
+        last = max(1, -(-len(repos) // per_page))
+        links = []
+        if page < last:
+            links.append(f'<{self.base_url}/user/repos?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{self.base_url}/user/repos?per_page={per_page}&page={last}>; rel="last"')
+        if links:
+            headers['Link'] = ', '.join(links)
+        return 200, items, headers
+
+    def _handle_create_repo(self, body: Dict) -> Tuple[int, Any, Dict]:
+        name = body.get('name')
+        if not name:
+            raise HTTPError(422, 'Repository creation failed.',
+                            errors=[{'resource': 'Repository', 'code': 'missing_field', 'field': 'name'}])
+        state = self.state
+        with state.lock:
+            key = (state.login.lower(), name.lower())
+            if key in state.repos:
+                raise HTTPError(422, 'Repository creation failed.', errors=[{
+                    'resource': 'Repository', 'code': 'custom', 'field': 'name',
+                    'message': 'name already exists on this account'}])
+            repo = FakeRepository(state.login, name, state.next_id, body.get('description') or '',
+                                  bool(body.get('private')))
+            state.next_id += 1
+            if body.get('auto_init'):
+                blob = repo.add_blob(f'# {name}\n'.encode())
+                tree = repo.add_tree({'README.md': blob})
+                repo.refs[f'refs/heads/{repo.default_branch}'] = repo.add_commit('Initial commit', tree, [])
+            state.repos[key] = repo
+            return 201, self._repo_json(repo), {}
+
+    def _handle_generate_repo(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        state = self.state
+        with state.lock:
+            template = self._repo(owner, repo)
+            if not template.is_template:
+                raise HTTPError(422, f'{template.full_name} is not a template repository')
+            name = body.get('name')
+            new_owner = body.get('owner') or state.login
+            if not name:
+                raise HTTPError(422, 'Invalid request.',
+                                errors=[{'resource': 'Repository', 'code': 'missing_field', 'field': 'name'}])
+            if (new_owner.lower(), name.lower()) in state.repos:
+                raise HTTPError(422, 'Could not clone: Name already exists on this account')
+            generated = FakeRepository(new_owner, name, state.next_id, body.get('description') or '',
+                                       bool(body.get('private')), template.default_branch)
+            state.next_id += 1
+            # Wie bei GitHub: Inhalt des Default-Branches als ein einzelner neuer Commit
+            tree = {path: generated.add_blob(template.blobs[sha])
+                    for path, sha in template.head_tree(template.default_branch).items()}
+            if tree:
+                generated.refs[f'refs/heads/{generated.default_branch}'] = generated.add_commit(
+                    'Initial commit', generated.add_tree(tree), [])
+            state.repos[(new_owner.lower(), name.lower())] = generated
+            return 201, self._repo_json(generated), {}
+
+    def _handle_get_repo(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            return 200, self._repo_json(self._repo(owner, repo)), {}
+
+    def _handle_edit_repo(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            if 'description' in body:
+                found.description = body['description'] or ''
+            if 'private' in body:
+                found.private = bool(body['private'])
+            if 'is_template' in body:
+                found.is_template = bool(body['is_template'])
+            if 'default_branch' in body:
+                found.default_branch = body['default_branch']
+            return 200, self._repo_json(found), {}
+
+    def _handle_delete_repo(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            self._repo(owner, repo)
+            del self.state.repos[(owner.lower(), repo.lower())]
+        return 204, None, {}
+
+    def _handle_get_content(self, body: Dict, owner: str, repo: str, path: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            branch = self.query.get('ref', found.default_branch)
+            sha = found.head_tree(branch).get(path)
+            if sha is None:
+                raise HTTPError(404, 'Not Found')
+            content = found.blobs[sha]
+            return 200, self._content_json(found, path, sha, content), {}
+
+    def _content_json(self, repo: FakeRepository, path: str, sha: str, content: Optional[bytes] = None) -> Dict:
+        data = {
+            'type': 'file',
+            'name': path.rsplit('/', 1)[-1],
+            'path': path,
+            'sha': sha,
+            'size': len(repo.blobs[sha]),
+            'url': f'{self.base_url}/repos/{repo.full_name}/contents/{path}',
+            'html_url': f'{self.base_url}/{repo.full_name}/blob/{repo.default_branch}/{path}',
+        }
+        if content is not None:
+            data['encoding'] = 'base64'
+            data['content'] = base64.b64encode(content).decode()
+        return data
+
+    def _handle_put_content(self, body: Dict, owner: str, repo: str, path: str) -> Tuple[int, Any, Dict]:
+        if 'message' not in body or 'content' not in body:
+            raise HTTPError(422, 'Invalid request.')
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            branch = body.get('branch') or found.default_branch
+            ref = f'refs/heads/{branch}'
+            tree = dict(found.head_tree(branch))
+            existing = tree.get(path)
+            if existing and body.get('sha') != existing:
+                raise HTTPError(422, 'Invalid request.\n\n"sha" wasn\'t supplied.')
+            if ref not in found.refs and not found.empty:
+                raise HTTPError(404, f'Branch {branch} not found')
+            blob = found.add_blob(base64.b64decode(body['content']))
+            tree[path] = blob
+            tree_sha = found.add_tree(tree)
+            parents = [found.refs[ref]] if ref in found.refs else []
+            commit_sha = found.add_commit(body['message'], tree_sha, parents)
+            found.refs[ref] = commit_sha
+            found.pushed_at = _now()
+            status = 200 if existing else 201
+            return status, {
+                'content': self._content_json(found, path, blob),
+                'commit': self._commit_json(found, commit_sha),
+            }, {}
+
+    def _handle_create_blob(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            self._require_git(found)
+            content = body.get('content', '')
+            data = base64.b64decode(content) if body.get('encoding') == 'base64' else content.encode()
+            sha = found.add_blob(data)
+            return 201, {'sha': sha, 'url': f'{self.base_url}/repos/{found.full_name}/git/blobs/{sha}'}, {}
+
+    def _handle_get_blob(self, body: Dict, owner: str, repo: str, sha: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            if sha not in found.blobs:
+                raise HTTPError(404, 'Not Found')
+            data = found.blobs[sha]
+            return 200, {'sha': sha, 'size': len(data), 'encoding': 'base64',
+                         'content': base64.b64encode(data).decode(),
+                         'url': f'{self.base_url}/repos/{found.full_name}/git/blobs/{sha}'}, {}
+
+    def _tree_json(self, repo: FakeRepository, sha: str) -> Dict[str, Any]:
+        return {
+            'sha': sha,
+            'url': f'{self.base_url}/repos/{repo.full_name}/git/trees/{sha}',
+            'truncated': False,
+            'tree': [{'path': path, 'mode': '100644', 'type': 'blob', 'sha': blob,
+                      'size': len(repo.blobs[blob])} for path, blob in sorted(repo.trees[sha].items())],
+        }
+
+    def _handle_create_tree(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            self._require_git(found)
+            base = body.get('base_tree')
+            if base and base not in found.trees:
+                raise HTTPError(422, 'Invalid tree info')
+            entries = dict(found.trees[base]) if base else {}
+            for item in body.get('tree', []):
+                path = item['path']
+                if 'content' in item:
+                    entries[path] = found.add_blob(item['content'].encode())
+                elif item.get('sha') is None:
+                    entries.pop(path, None)
+                elif item['sha'] in found.blobs:
+                    entries[path] = item['sha']
+                else:
+                    raise HTTPError(422, 'Invalid tree info', errors=[{'message': f'unknown sha for {path}'}])
+            sha = found.add_tree(entries)
+            return 201, self._tree_json(found, sha), {}
+
+    def _handle_get_tree(self, body: Dict, owner: str, repo: str, sha: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            if sha not in found.trees:
+                raise HTTPError(404, 'Not Found')
+            return 200, self._tree_json(found, sha), {}
+
+    def _handle_create_commit(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            self._require_git(found)
+            tree = body.get('tree')
+            parents = body.get('parents', [])
+            if tree not in found.trees or any(p not in found.commits for p in parents):
+                raise HTTPError(422, 'Invalid tree or parent sha')
+            sha = found.add_commit(body.get('message', ''), tree, parents)
+            return 201, self._commit_json(found, sha), {}
+
+    def _handle_get_commit(self, body: Dict, owner: str, repo: str, sha: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            if sha not in found.commits:
+                raise HTTPError(404, 'Not Found')
+            return 200, self._commit_json(found, sha), {}
+
+    def _handle_get_ref(self, body: Dict, owner: str, repo: str, ref: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            full_ref = ref if ref.startswith('refs/') else f'refs/{ref}'
+            if full_ref not in found.refs:
+                raise HTTPError(404, 'Not Found')
+            return 200, self._ref_json(found, full_ref), {}
+
+    def _handle_create_ref(self, body: Dict, owner: str, repo: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            ref, sha = body.get('ref', ''), body.get('sha')
+            if not ref.startswith('refs/') or sha not in found.commits:
+                raise HTTPError(422, 'Invalid request.')
+            if ref in found.refs:
+                raise HTTPError(422, 'Reference already exists')
+            found.refs[ref] = sha
+            found.pushed_at = _now()
+            return 201, self._ref_json(found, ref), {}
+
+    def _handle_update_ref(self, body: Dict, owner: str, repo: str, ref: str) -> Tuple[int, Any, Dict]:
+        with self.state.lock:
+            found = self._repo(owner, repo)
+            full_ref = ref if ref.startswith('refs/') else f'refs/{ref}'
+            sha = body.get('sha')
+            if full_ref not in found.refs:
+                raise HTTPError(422, 'Reference does not exist')
+            if sha not in found.commits:
+                raise HTTPError(422, 'Object does not exist')
+            if not body.get('force') and found.refs[full_ref] not in found.commits[sha]['parents']:
+                raise HTTPError(422, 'Update is not a fast forward')
+            found.refs[full_ref] = sha
+            found.pushed_at = _now()
+            return 200, self._ref_json(found, full_ref), {}
+
+    def _handle_graphql(self, body: Dict) -> Tuple[int, Any, Dict]:
+        # Kein echter GraphQL-Parser: erkennt die Alias-Abfrage (get_repos_info)
+        # und viewer.repositories mit Cursor (list_repositories_info)
+        query = body.get('query') or ''
+        variables = body.get('variables') or {}
+        data: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        with self.state.lock:
+            if 'viewer' in query:
+                first = int(self.GRAPHQL_CONNECTION.search(query).group(1))
+                if first > 100:
+                    raise HTTPError(422, 'Requesting more than 100 records on the connection is not allowed.')
+                repos = sorted((r for r in self.state.repos.values() if r.owner == self.state.login),
+                               key=lambda r: r.id)
+                cursor = variables.get('cursor')
+                offset = int(base64.b64decode(cursor)) if cursor else 0
+                page = repos[offset:offset + first]
+                end = offset + len(page)
+                data['viewer'] = {'repositories': {
+                    'pageInfo': {'hasNextPage': end < len(repos),
+                                 'endCursor': base64.b64encode(str(end).encode()).decode()},
+                    'nodes': [self._repo_graphql(r) for r in page],
+                }}
+            else:
+                for alias, owner, name in self.GRAPHQL_ALIAS.findall(query):
+                    owner, name = json.loads(owner), json.loads(name)
+                    found = self.state.repos.get((owner.lower(), name.lower()))
+                    data[alias] = self._repo_graphql(found) if found else None
+                    if found is None:
+                        errors.append({'type': 'NOT_FOUND', 'path': [alias],
+                                       'message': f"Could not resolve to a Repository with the name '{owner}/{name}'."})
+        payload: Dict[str, Any] = {'data': data}
+        if errors:
+            payload['errors'] = errors
+        return 200, payload, {}
+
+    # ------------------------------------------------------------------
+    # Git Smart HTTP (git http-backend als CGI)
+    # ------------------------------------------------------------------
+
+    def _handle_git(self, method: str, query: str, raw: bytes, owner: str, repo: str, path_info: str) -> None:
+        with self.state.lock:
+            found = self.state.repos.get((owner.lower(), repo.lower()))
+            if found is None:
+                self._send(404, {'message': 'Repository not found.'}, {}, 'git')
+                return
+            bare = self._bare_repository(found)
+
+        env = {
+            'PATH': os.environ.get('PATH', ''),
+            'GIT_PROJECT_ROOT': os.path.dirname(bare),
+            'GIT_HTTP_EXPORT_ALL': '1',
+            'PATH_INFO': f'/{os.path.basename(bare)}{path_info}',
+            'REQUEST_METHOD': method,
+            'QUERY_STRING': query,
+            'CONTENT_TYPE': self.headers.get('Content-Type', ''),
+            'CONTENT_LENGTH': str(len(raw)),
+            'REMOTE_USER': owner,  # aktiviert receive-pack
+            'REMOTE_ADDR': self.client_address[0],
+        }
+        for header, variable in (('Content-Encoding', 'HTTP_CONTENT_ENCODING'), ('Git-Protocol', 'GIT_PROTOCOL')):
+            if self.headers.get(header):
+                env[variable] = self.headers[header]
+        completed = subprocess.run(['git', 'http-backend'], input=raw, env=env, capture_output=True)
+
+        head, _, body = completed.stdout.partition(b'\r\n\r\n')
+        status = 200
+        headers = []
+        for line in head.decode('latin-1').split('\r\n'):
+            key, _, value = line.partition(':')
+            if key.lower() == 'status':
+                status = int(value.split()[0])
+            elif key:
+                headers.append((key, value.strip()))
+        # Vor der Antwort übernehmen: nach einem fertigen Push sieht die REST-API den neuen Stand
+        if path_info == '/git-receive-pack' and status == 200:
+            self._import_from_git(found, bare)
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _bare_repository(self, repo: FakeRepository) -> str:
+        """Legt das Bare-Repository beim ersten Zugriff an (inkl. bisher per API geschriebener Dateien)"""
+        bare = os.path.join(self.state.git_root, repo.owner, f'{repo.name}.git')
+        if os.path.isdir(bare):
+            return bare
+        subprocess.run(['git', 'init', '--quiet', '--bare', '-b', repo.default_branch, bare], check=True)
+        tree = repo.head_tree(repo.default_branch)
+        if tree:
+            index = {**os.environ, 'GIT_INDEX_FILE': os.path.join(bare, 'seed-index')}
+            for path, sha in tree.items():
+                blob = subprocess.run(['git', '--git-dir', bare, 'hash-object', '-w', '--stdin'],
+                                      input=repo.blobs[sha], capture_output=True, check=True).stdout.decode().strip()
+                subprocess.run(['git', '--git-dir', bare, 'update-index', '--add', '--cacheinfo',
+                                f'100644,{blob},{path}'], env=index, check=True)
+            tree_sha = subprocess.run(['git', '--git-dir', bare, 'write-tree'], env=index,
+                                      capture_output=True, check=True).stdout.decode().strip()
+            commit = subprocess.run(['git', '--git-dir', bare, '-c', f'user.name={repo.owner}',
+                                     '-c', 'user.email=fake@example.com', 'commit-tree', tree_sha, '-m', 'Import'],
+                                    capture_output=True, check=True).stdout.decode().strip()
+            subprocess.run(['git', '--git-dir', bare, 'update-ref', f'refs/heads/{repo.default_branch}', commit],
+                           check=True)
+            os.remove(os.path.join(bare, 'seed-index'))
+        return bare
+
+    def _import_from_git(self, repo: FakeRepository, bare: str) -> None:
+        """Übernimmt gepushte Branches ins REST-Modell (SHAs unterscheiden sich von git)"""
+        refs = subprocess.run(['git', '--git-dir', bare, 'for-each-ref', '--format=%(refname)', 'refs/heads'],
+                              capture_output=True, text=True, check=True).stdout.split()
+        for ref in refs:
+            listing = subprocess.run(['git', '--git-dir', bare, 'ls-tree', '-r', '-z', ref],
+                                     capture_output=True, check=True).stdout.decode()
+            entries = [line.split('\t', 1) for line in listing.split('\0') if line]
+            message = subprocess.run(['git', '--git-dir', bare, 'log', '-1', '--format=%B', ref],
+                                     capture_output=True, text=True, check=True).stdout.strip()
+            batch = subprocess.run(['git', '--git-dir', bare, 'cat-file', '--batch'],
+                                   input=''.join(f'{meta.split()[2]}\n' for meta, _ in entries).encode(),
+                                   capture_output=True, check=True).stdout
+            contents = {}
+            offset = 0
+            for _, path in entries:
+                header_end = batch.index(b'\n', offset)
+                size = int(batch[offset:header_end].split()[2])
+                contents[path] = batch[header_end + 1:header_end + 1 + size]
+                offset = header_end + 2 + size
+            with self.state.lock:
+                tree = {path: repo.add_blob(content) for path, content in contents.items()}
+                parents = [repo.refs[ref]] if ref in repo.refs else []
+                repo.refs[ref] = repo.add_commit(message, repo.add_tree(tree), parents)
+                repo.pushed_at = _now()
+
+
+class FakeGitHubServer:
+    """
+    Startet den Fake-Server in einem Hintergrund-Thread
+
+    Beispiel:
+        with FakeGitHubServer(latency=0.01) as server:
+            config = {'github_token': 'fake', 'base_url': server.base_url}
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **state_options: Any):
+        self.state = FakeGitHubState(**state_options)
+        self.httpd = ThreadingHTTPServer((host, port), FakeGitHubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeGitHubServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> 'FakeGitHubServer':
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lokaler Fake GitHub API Server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--login', default='fake-user', help='Login des authentifizierten Benutzers')
+    parser.add_argument('--latency', type=float, default=0.0, help='Feste Latenz pro Request (Sekunden)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Zusätzliche zufällige Latenz (Sekunden)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Anteil zufälliger 502-Fehler (0.0-1.0)')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Primäres Rate Limit pro Token')
+    parser.add_argument('--secondary-limit', type=int, help='Max. schreibende Requests pro Fenster')
+    parser.add_argument('--secondary-window', type=float, default=60.0, help='Fenster für das sekundäre Limit')
+    parser.add_argument('--seed', type=int, help='Seed für Fehlerinjektion und Jitter')
+    parser.add_argument('--git-root', help='Verzeichnis für Bare-Repositories (aktiviert git push über HTTP)')
+    args = parser.parse_args()
+
+    server = FakeGitHubServer(
+        args.host, args.port, login=args.login, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, rate_limit=args.rate_limit, secondary_limit=args.secondary_limit,
+        secondary_window=args.secondary_window, seed=args.seed, git_root=args.git_root,
+    )
+    print(f'🧪 Fake GitHub API läuft auf {server.base_url} (Strg+C zum Beenden)')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.state.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
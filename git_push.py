@@ -0,0 +1,116 @@
+"""
+Git Push - Generierte Projekte per Git-Protokoll statt Contents-API hochladen
+
+Baut aus dem lokal gespeicherten Projekt (GitHubAutoCoder._save_locally)
+einen Commit in einem temporären Git-Verzeichnis und überträgt ihn mit einem
+einzigen `git push` (ein komprimiertes Packfile statt einem base64-JSON-Request
+pro Datei). Das Arbeitsverzeichnis bekommt kein .git.
+
+Benötigt das `git`-Binary. Ziel kann jedes Git-Remote sein: GitHub über HTTPS,
+ein lokales Bare-Repository (file://) oder fake_github_server.py mit git_root.
+
+Verwendung:
+    sha = push_directory('./mein-projekt', 'https://github.com/user/mein-projekt.git',
+                         token='ghp_...', message='Add project files')
+"""
+import base64
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import List, Optional, Tuple
+
+from tracing import span
+
+
+DEFAULT_AUTHOR = ('GitHub Auto-Coder', 'auto-coder@users.noreply.github.com')
+
+
+class GitPushError(Exception):
+    """git-Aufruf fehlgeschlagen"""
+
+    def __init__(self, command: List[str], returncode: int, stderr: str):
+        super().__init__(f"git {command[0]} fehlgeschlagen ({returncode}): {stderr.strip()}")
+        self.command = command
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+def _git(git_dir: Optional[str], work_tree: Optional[str], args: List[str], config: List[str], git: str = 'git',
+         check: bool = True) -> subprocess.CompletedProcess:
+    command = [git]
+    if git_dir:
+        command += [f'--git-dir={git_dir}', f'--work-tree={work_tree}']
+    for option in config:
+        command += ['-c', option]
+    completed = subprocess.run(command + args, capture_output=True, text=True,
+                               env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'})
+    if check and completed.returncode != 0:
+        raise GitPushError(args, completed.returncode, completed.stderr)
+    return completed
+
+
+def push_directory(local_path: str,
+                   remote_url: str,
+                   branch: str = 'main',
+                   message: str = 'Add project files',
+                   token: Optional[str] = None,
+                   author: Tuple[str, str] = DEFAULT_AUTHOR,
+                   git: str = 'git') -> str:
+    """
+    Committet den Inhalt von local_path und pusht ihn auf branch
+
+    Ist der Branch auf dem Remote schon vorhanden (z.B. README durch auto_init),
+    wird auf dessen Stand aufgesetzt: vorhandene Dateien bleiben erhalten,
+    gleichnamige werden überschrieben.
+
+    Args:
+        local_path: Verzeichnis mit den generierten Dateien
+        remote_url: Ziel (https://..., file://... oder Pfad zu einem Bare-Repository)
+        branch: Ziel-Branch
+        message: Commit-Nachricht
+        token: GitHub Token für HTTPS (wird als Header übergeben, nicht in der URL)
+        author: (Name, E-Mail) für Autor und Committer
+        git: Pfad zum git-Binary
+
+    Returns:
+        SHA des gepushten Commits
+
+    Raises:
+        GitPushError: Wenn ein git-Aufruf fehlschlägt
+    """
+    if shutil.which(git) is None:
+        raise GitPushError(['--version'], 127, f"'{git}' nicht gefunden")
+
+    name, email = author
+    config = [f'user.name={name}', f'user.email={email}', 'core.autocrlf=false', 'commit.gpgsign=false']
+    if token and remote_url.startswith(('http://', 'https://')):
+        credentials = base64.b64encode(f'x-access-token:{token}'.encode('utf-8')).decode('ascii')
+        config.append(f'http.extraHeader=Authorization: Basic {credentials}')
+
+    git_dir = tempfile.mkdtemp(prefix='autocoder-push-')
+    try:
+        with span('git.commit'):
+            _git(None, None, ['init', '--quiet', '--bare', git_dir], config, git)
+            # Vorhandenen Remote-Stand holen; fehlt der Branch, ist das Repository leer
+            fetched = _git(git_dir, local_path, ['fetch', '--quiet', '--depth=1', remote_url, branch],
+                           config, git, check=False).returncode == 0
+            # --force: .gitignore des Projekts gilt nicht, gepusht wird genau das, was
+            # auch per Contents-API hochgeladen würde (z.B. dist/.gitkeep)
+            if fetched:
+                _git(git_dir, local_path, ['read-tree', 'FETCH_HEAD'], config, git)
+                _git(git_dir, local_path, ['add', '--force', '--ignore-removal', '.'], config, git)
+                parents = ['-p', 'FETCH_HEAD']
+            else:
+                _git(git_dir, local_path, ['add', '--force', '--all', '.'], config, git)
+                parents = []
+            tree = _git(git_dir, local_path, ['write-tree'], config, git).stdout.strip()
+            commit = _git(git_dir, local_path, ['commit-tree', tree, *parents, '-m', message],
+                          config, git).stdout.strip()
+
+        with span('git.push', remote=remote_url.split('@')[-1]):
+            _git(git_dir, local_path, ['push', '--quiet', remote_url, f'{commit}:refs/heads/{branch}'],
+                 config, git)
+        return commit
+    finally:
+        shutil.rmtree(git_dir, ignore_errors=True)
@@ -0,0 +1,199 @@
+"""
+GitHub HTTP Cache - Bedingte GET-Requests mit ETag-Cache auf der Festplatte
+
+Speichert Antworten lesender GitHub-Aufrufe samt ETag/Last-Modified.
+Innerhalb der TTL wird ohne Request geantwortet, danach mit If-None-Match
+bzw. If-Modified-Since revalidiert. 304-Antworten zählen bei GitHub nicht
+gegen das primäre Rate Limit.
+
+Verwendung:
+    cache = GitHubHTTPCache('https://api.github.com', token, ttl=60)
+    response = cache.get('/repos/octocat/hello-world')
+    response.data, response.source        # dict, 'hit' | 'revalidated' | 'miss'
+    cache.invalidate('/repos/octocat/hello-world')   # nach Schreibzugriffen
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import requests
+
+from metrics import counter
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'github-auto-coder', 'http')
+
+CACHE_LOOKUPS = counter('autocoder_github_cache_total', 'GitHub GET-Cache: hit, revalidated (304) oder miss',
+                        ['result'])
+
+
+class GitHubCacheError(Exception):
+    """GET lieferte einen Fehlerstatus"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class CachedResponse:
+    """Antwort eines (ggf. gecachten) GET-Requests"""
+    data: Any
+    source: str
+    headers: Dict[str, str]
+
+    @property
+    def rate_limit_remaining(self) -> Optional[int]:
+        value = self.headers.get('X-RateLimit-Remaining')
+        return int(value) if value is not None else None
+
+
+class GitHubHTTPCache:
+    """ETag-Cache für GitHub GETs (thread-sicher, ein JSON-File pro URL)"""
+
+    def __init__(self, base_url: str, token: str, directory: Optional[str] = None, ttl: float = 60.0,
+                 timeout: float = 15.0, session: Optional[requests.Session] = None):
+        """
+        Args:
+            base_url: API-URL (https://api.github.com oder fake_github_server.py)
+            token: GitHub Token; fließt in die Cache-Schlüssel ein, damit Tokens nichts teilen
+            directory: Cache-Verzeichnis (Standard: ~/.cache/github-auto-coder/http)
+            ttl: Sekunden, in denen ein Eintrag ohne Revalidierung gilt (0 = immer revalidieren)
+            timeout: Timeout pro Request in Sekunden
+            session: Optional: eigene requests.Session
+        """
+        self.base_url = base_url.rstrip('/')
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.timeout = timeout
+        self._token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+        self._session = session or requests.Session()
+        self._session.headers.update({
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'github-auto-coder',
+        })
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _url(self, path: str) -> str:
+        return path if path.startswith('http') else f'{self.base_url}/{path.lstrip("/")}'
+
+    @staticmethod
+    def _normalize(url: str) -> str:
+        """GitHub-Pfade (Owner/Repo) sind case-insensitiv; Query bleibt wie sie ist"""
+        path, sep, query = url.partition('?')
+        return path.lower() + sep + query
+
+    def _entry_path(self, url: str) -> str:
+        key = hashlib.sha256(f'{self._token_hash} {self._normalize(url)}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _read(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if self._normalize(entry.get('url', '')) == self._normalize(url) else None
+
+    def _write(self, url: str, entry: Dict[str, Any]) -> None:
+        path = self._entry_path(url)
+        # Atomar ersetzen, parallele Leser sehen nie eine halbe Datei
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            # Platte voll, Rechte oder Verzeichnis weg: Antwort ungecacht ausliefern
+            print(f"⚠️  GitHub HTTP-Cache: Eintrag nicht gespeichert ({e})")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def get(self, path: str, max_age: Optional[float] = None) -> CachedResponse:
+        """
+        GET mit Cache
+
+        Args:
+            path: API-Pfad (z.B. /repos/owner/name) oder volle URL
+            max_age: Überschreibt die TTL für diesen Aufruf (0 = immer revalidieren)
+
+        Returns:
+            CachedResponse; source ist 'hit' (ohne Request), 'revalidated' (304) oder 'miss'
+
+        Raises:
+            GitHubCacheError: Bei Fehlerstatus (z.B. 404)
+        """
+        url = self._url(path)
+        ttl = self.ttl if max_age is None else max_age
+        entry = self._read(url)
+
+        if entry is not None and time.time() - entry['stored_at'] < ttl:
+            CACHE_LOOKUPS.inc(result='hit')
+            return CachedResponse(entry['data'], 'hit', entry.get('headers', {}))
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._session.get(url, headers=headers, timeout=self.timeout)
+        rate_headers = {key: value for key, value in response.headers.items() if key.startswith('X-RateLimit-')}
+
+        if response.status_code == 304 and entry is not None:
+            entry['stored_at'] = time.time()
+            entry['headers'] = rate_headers
+            self._write(url, entry)
+            CACHE_LOOKUPS.inc(result='revalidated')
+            return CachedResponse(entry['data'], 'revalidated', rate_headers)
+
+        if response.status_code != 200:
+            try:
+                message = response.json().get('message', response.reason)
+            except ValueError:
+                message = response.reason
+            raise GitHubCacheError(response.status_code, message)
+
+        data = response.json()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified or ttl > 0:
+            self._write(url, {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'stored_at': time.time(),
+                'headers': rate_headers,
+                'data': data,
+            })
+        CACHE_LOOKUPS.inc(result='miss')
+        return CachedResponse(data, 'miss', rate_headers)
+
+    def invalidate(self, *paths: str) -> None:
+        """Entfernt die Einträge der angegebenen Pfade (Hook nach Schreibzugriffen)"""
+        for path in paths:
+            try:
+                os.remove(self._entry_path(self._url(path)))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> int:
+        """Löscht alle Einträge dieses Verzeichnisses; gibt die Anzahl zurück"""
+        removed = 0
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
@@ -4,10 +4,113 @@ GitHub Client - Verwaltet alle Interaktionen mit der GitHub API
 import os
 import json
 import base64
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from github import Github, GithubException, Repository
-from datetime import datetime
+from datetime import datetime, timezone
+import threading
 import time
+from contextlib import contextmanager
+
+import requests
+
+from git_push import GitPushError, push_directory
+from upload_journal import UploadJournal
+from github_cache import GitHubCacheError, GitHubHTTPCache
+from metrics import GITHUB_API_CALLS, GITHUB_API_DURATION, GITHUB_RATE_LIMIT_REMAINING
+from tracing import span
+
+
+REPO_LIST_PAGE_SIZE = 100
+
+# GitHub erlaubt höchstens 100 Knoten pro Verbindung; gilt hier auch für Aliase pro Query
+GRAPHQL_BATCH_SIZE = 100
+
+REPO_GRAPHQL_FIELDS = """
+    name
+    nameWithOwner
+    url
+    description
+    isPrivate
+    createdAt
+    diskUsage
+    primaryLanguage { name }
+    defaultBranchRef {
+      name
+      target { ... on Commit { oid messageHeadline committedDate } }
+    }
+"""
+
+
+class SharedGitHub:
+    """Ein Github-Objekt (eine gepoolte requests.Session) samt lazy geladenem Benutzer"""
+    
+    def __init__(self, client: Github, pool_size: Optional[int] = None):
+        self.client = client
+        self.pool_size = pool_size
+        self._user = None
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def user(self):
+        """Authentifizierter Benutzer; wird einmal angelegt und von allen Instanzen geteilt"""
+        if self._user is None:
+            with self._lock:
+                if self._user is None:
+                    self._user = self.client.get_user()
+        return self._user
+    
+    @property
+    def session(self) -> requests.Session:
+        """Gepoolte Session für die gecachten GET-Requests (github_cache.py)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    if self.pool_size:
+                        adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_size,
+                                                                pool_maxsize=self.pool_size)
+                        session.mount('https://', adapter)
+                        session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+
+_shared_clients: Dict[tuple, SharedGitHub] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_github(token: str, **github_options) -> SharedGitHub:
+    """
+    Gibt den prozessweiten Client für Token und Optionen zurück (thread-sicher)
+    
+    Args:
+        token: GitHub Token
+        **github_options: Weitere Github()-Argumente (base_url, pool_size, Drosselung)
+        
+    Returns:
+        SharedGitHub, das sich alle GitHubClient-Instanzen mit gleicher Konfiguration teilen
+    """
+    key = (token,) + tuple(sorted(github_options.items()))
+    shared = _shared_clients.get(key)
+    if shared is None:
+        with _shared_clients_lock:
+            shared = _shared_clients.get(key)
+            if shared is None:
+                shared = SharedGitHub(Github(token, **github_options), github_options.get('pool_size'))
+                _shared_clients[key] = shared
+    return shared
+
+
+def close_shared_clients() -> None:
+    """Schließt alle geteilten Verbindungen (z.B. nach Token-Wechsel oder in Tests)"""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for shared in clients:
+        shared.client.close()
+        if shared._session is not None:
+            shared._session.close()
 
 
 class GitHubClient:
@@ -27,10 +130,73 @@ class GitHubClient:
         if not self.token:
             raise ValueError("GitHub Token nicht in config.json gefunden!")
         
-        self.client = Github(self.token)
-        self.user = self.client.get_user()
+        # Optional: alternative API-URL (GitHub Enterprise oder lokaler fake_github_server.py)
+        self.base_url = self.config.get('base_url')
+        github_options = {'base_url': self.base_url.rstrip('/')} if self.base_url else {}
+        
+        # Optional: PyGithub-Drosselung überschreiben (z.B. 0 für Lasttests gegen den Fake-Server)
+        # und Größe des Verbindungspools (Standard von requests: 10)
+        for option in ('seconds_between_requests', 'seconds_between_writes', 'pool_size'):
+            if option in self.config:
+                github_options[option] = self.config[option]
+        
+        # Alle Instanzen mit gleichem Token teilen sich Session, Pool und Benutzer-Objekt
+        if self.config.get('shared_session', True):
+            self._shared = get_shared_github(self.token, **github_options)
+        else:
+            self._shared = SharedGitHub(Github(self.token, **github_options), github_options.get('pool_size'))
+        self.client = self._shared.client
         self.rate_limit_delay = self.config.get('rate_limit_delay', 1.0)
         
+        # ETag-Cache für lesende Aufrufe (304 zählt nicht gegen das Rate Limit)
+        self.http_cache: Optional[GitHubHTTPCache] = None
+        if self.config.get('http_cache', True):
+            try:
+                self.http_cache = GitHubHTTPCache(
+                    self.base_url or 'https://api.github.com',
+                    self.token,
+                    directory=self.config.get('http_cache_dir'),
+                    ttl=self.config.get('http_cache_ttl', 60),
+                    session=self._shared.session
+                )
+            except OSError as e:
+                # Der Cache ist optional: ohne schreibbares Verzeichnis direkt gegen die API
+                print(f"⚠️  GitHub HTTP-Cache deaktiviert ({e})")
+        
+        # GraphQL-Endpunkt: api.github.com/graphql bzw. <host>/api/graphql bei GitHub Enterprise
+        api_url = (self.base_url or 'https://api.github.com').rstrip('/')
+        if api_url.endswith('/api/v3'):
+            api_url = api_url[:-len('/v3')]
+        self.graphql_url = f'{api_url}/graphql'
+        
+        # Upload-Weg: 'api' (eine Contents-API-Anfrage pro Datei) oder 'push' (ein git push)
+        self.upload_mode = self.config.get('upload_mode', 'api')
+        # Optional: Push-Ziel statt clone_url, z.B. file:///srv/git/{name}.git
+        self.push_url = self.config.get('push_url')
+        
+        # Template-Repositories für häufige Sprache/Projekttyp-Kombinationen (project_templates.py)
+        self.template_repos = self.config.get('template_repos', False)
+        self._templates: Dict[str, Repository.Repository] = {}
+        self._template_lock = threading.Lock()
+        
+        # Namen der eigenen Repositories für den Batch-Pre-Flight (lazy geladen)
+        self._repo_names: Optional[Set[str]] = None
+        self._repo_list_paths: List[str] = []
+        
+    @property
+    def user(self):
+        """Authentifizierter Benutzer (lazy, geteilt)"""
+        return self._shared.user
+    
+    @property
+    def login(self) -> str:
+        """Login des authentifizierten Benutzers (aus Config oder gecachtem GET /user)"""
+        if self.username:
+            return self.username
+        if self.http_cache is not None:
+            return self._cached_get('get_user', '/user')['login']
+        return self.user.login
+    
     def _load_config(self, config_path: str) -> Dict:
         """Lädt Konfiguration aus JSON-Datei"""
         if not os.path.exists(config_path):
@@ -58,30 +224,124 @@ class GitHubClient:
         """
         try:
             print(f"📦 Erstelle Repository: {repo_name}")
-            repo = self.user.create_repo(
-                name=repo_name,
-                description=description,
-                private=private,
-                auto_init=auto_init
-            )
+            with self._api_call('create_repo', repo=repo_name):
+                repo = self.user.create_repo(
+                    name=repo_name,
+                    description=description,
+                    private=private,
+                    auto_init=auto_init
+                )
             print(f"✅ Repository erstellt: {repo.html_url}")
-            time.sleep(self.rate_limit_delay)
+            self.invalidate_cache(f'/repos/{repo.full_name}', *self._repo_list_paths)
+            if self._repo_names is not None:
+                self._repo_names.add(repo_name.lower())
+            self._throttle()
             return repo
             
         except GithubException as e:
             if e.status == 422:
                 print(f"⚠️  Repository '{repo_name}' existiert bereits")
                 # Versuche existierendes Repo zu holen
-                repo = self.user.get_repo(repo_name)
-                return repo
+                return self.get_repository(repo_name)
             else:
                 raise Exception(f"Fehler beim Erstellen des Repositories: {e}")
     
+    def create_repository_from_template(self,
+                                        template: Repository.Repository,
+                                        repo_name: str,
+                                        description: str = "",
+                                        private: bool = False) -> Repository.Repository:
+        """
+        Erstellt ein Repository über "Generate from template"
+        
+        GitHub kopiert die Dateien asynchron; es wird gewartet, bis der
+        Default-Branch existiert.
+        
+        Args:
+            template: Template-Repository
+            repo_name: Name des neuen Repositories
+            description: Beschreibung des Repositories
+            private: Ob das Repo privat sein soll
+            
+        Returns:
+            Repository-Objekt
+        """
+        try:
+            print(f"📦 Erstelle Repository aus Template {template.name}: {repo_name}")
+            with self._api_call('create_repo_from_template', repo=repo_name, template=template.name):
+                repo = self.user.create_repo_from_template(repo_name, template, description=description,
+                                                           private=private)
+        except GithubException as e:
+            if e.status == 422:
+                print(f"⚠️  Repository '{repo_name}' existiert bereits")
+                return self.get_repository(repo_name)
+            raise Exception(f"Fehler beim Erstellen aus Template: {e}")
+        
+        for attempt in range(10):
+            try:
+                with self._api_call('get_ref', repo=repo_name):
+                    repo.get_git_ref(f'heads/{template.default_branch}')
+                break
+            except GithubException as e:
+                if e.status not in (404, 409):
+                    raise Exception(f"Fehler beim Erstellen aus Template: {e}")
+                time.sleep(0.5 * (attempt + 1))
+        else:
+            raise Exception(f"Template-Inhalt ist nach 25 s noch nicht in {repo_name} angekommen")
+        
+        print(f"✅ Repository erstellt: {repo.html_url}")
+        self.invalidate_cache(f'/repos/{repo.full_name}', *self._repo_list_paths)
+        if self._repo_names is not None:
+            self._repo_names.add(repo_name.lower())
+        self._throttle()
+        return repo
+    
+    def ensure_template_repository(self,
+                                   template_name: str,
+                                   files: Dict[str, str],
+                                   description: str = "") -> Repository.Repository:
+        """
+        Gibt das Template-Repository zurück und legt es beim ersten Mal an
+        
+        Ein Repository wird erst nach vollständigem Upload als Template markiert;
+        ein abgebrochener Upload wird beim nächsten Aufruf fortgesetzt.
+        
+        Args:
+            template_name: Name des Templates (enthält einen Fingerprint der Inhalte)
+            files: Dictionary mit {Pfad: Inhalt}
+            description: Beschreibung des Templates
+            
+        Returns:
+            Repository-Objekt des Templates
+        """
+        template = self._templates.get(template_name)
+        if template is not None:
+            return template
+        
+        with self._template_lock:
+            template = self._templates.get(template_name)
+            if template is not None:
+                return template
+            try:
+                template = self.get_repository(template_name)
+            except Exception:
+                template = self.create_repository(template_name, description=description, private=True)
+            
+            if not template.is_template:
+                print(f"🧩 Richte Template ein: {template_name}")
+                self.create_multiple_files(template, files, "Add template files")
+                with self._api_call('edit_repo', repo=template_name):
+                    template.edit(is_template=True)
+                self.invalidate_cache(f'/repos/{template.full_name}')
+            
+            self._templates[template_name] = template
+            return template
+    
     def create_file(self, 
                    repo: Repository.Repository,
                    file_path: str,
                    content: str,
-                   commit_message: str = None) -> None:
+                   commit_message: str = None) -> Optional[str]:
         """
         Erstellt eine neue Datei im Repository
         
@@ -90,30 +350,39 @@ class GitHubClient:
             file_path: Pfad der Datei im Repo
             content: Inhalt der Datei
             commit_message: Commit-Nachricht
+            
+        Returns:
+            SHA des Commits oder None, wenn die Datei bereits existierte
         """
         if commit_message is None:
             commit_message = f"Add {file_path}"
         
         try:
-            repo.create_file(
-                path=file_path,
-                message=commit_message,
-                content=content,
-                branch=self.config.get('default_branch', 'main')
-            )
+            with self._api_call('create_file', path=file_path, bytes=len(content)):
+                created = repo.create_file(
+                    path=file_path,
+                    message=commit_message,
+                    content=content,
+                    branch=self.config.get('default_branch', 'main')
+                )
             print(f"  ✅ Datei erstellt: {file_path}")
-            time.sleep(self.rate_limit_delay)
+            # Größe und pushed_at des Repos haben sich geändert
+            self.invalidate_cache(f'/repos/{repo.full_name}')
+            self._throttle()
+            return created['commit'].sha
             
         except GithubException as e:
             if e.status == 422:
                 print(f"  ⚠️  Datei existiert bereits: {file_path}")
+                return None
             else:
                 raise Exception(f"Fehler beim Erstellen der Datei: {e}")
     
     def create_multiple_files(self,
                              repo: Repository.Repository,
                              files: Dict[str, str],
-                             commit_message: str = "Add project files") -> None:
+                             commit_message: str = "Add project files",
+                             journal: Optional[UploadJournal] = None) -> None:
         """
         Erstellt mehrere Dateien auf einmal
         
@@ -121,11 +390,48 @@ class GitHubClient:
             repo: Repository-Objekt
             files: Dictionary mit {Pfad: Inhalt}
             commit_message: Commit-Nachricht
+            journal: Optional: geöffnetes UploadJournal; jede Datei wird nach dem
+                Upload vermerkt, damit ein Abbruch fortgesetzt werden kann
         """
         print(f"📝 Erstelle {len(files)} Dateien...")
         
         for file_path, content in files.items():
-            self.create_file(repo, file_path, content, f"Add {file_path}")
+            commit = self.create_file(repo, file_path, content, f"Add {file_path}")
+            if journal is not None:
+                journal.record_file(file_path, commit)
+    
+    def push_files(self,
+                   repo: Repository.Repository,
+                   local_path: str,
+                   commit_message: str = "Add project files") -> str:
+        """
+        Lädt ein lokal gespeichertes Projekt mit einem einzigen git push hoch
+        
+        Args:
+            repo: Repository-Objekt
+            local_path: Verzeichnis mit den generierten Dateien
+            commit_message: Commit-Nachricht
+            
+        Returns:
+            SHA des gepushten Commits
+        """
+        owner, name = repo.full_name.split('/', 1)
+        remote_url = self.push_url.format(owner=owner, name=name, full_name=repo.full_name) \
+            if self.push_url else repo.clone_url
+        print(f"📤 Pushe {local_path} nach {remote_url}...")
+        
+        try:
+            with self._api_call('git_push', update_remaining=False, repo=name):
+                sha = push_directory(local_path, remote_url,
+                                     branch=self.config.get('default_branch', 'main'),
+                                     message=commit_message,
+                                     token=self.token)
+        except GitPushError as e:
+            raise Exception(f"Fehler beim Git-Push: {e}")
+        
+        print(f"  ✅ Commit {sha[:7]} gepusht")
+        self.invalidate_cache(f'/repos/{repo.full_name}')
+        return sha
     
     def get_repository(self, repo_name: str) -> Repository.Repository:
         """
@@ -138,10 +444,149 @@ class GitHubClient:
             Repository-Objekt
         """
         try:
-            return self.user.get_repo(repo_name)
-        except GithubException as e:
+            if self.http_cache is None:
+                with self._api_call('get_repo', repo=repo_name):
+                    return self.user.get_repo(repo_name)
+            data = self._cached_get('get_repo', f'/repos/{self.login}/{repo_name}', repo=repo_name)
+            return self.client.create_from_raw_data(Repository.Repository, data)
+        except (GithubException, GitHubCacheError) as e:
             raise Exception(f"Repository nicht gefunden: {repo_name}")
     
+    def list_repository_names(self, refresh: bool = False) -> Set[str]:
+        """
+        Lädt die Namen aller eigenen Repositories einmal (paginiert, über den Cache)
+        
+        GitHub vergleicht Repository-Namen ohne Groß-/Kleinschreibung, daher
+        enthält das Set nur klein geschriebene Namen.
+        
+        Args:
+            refresh: Set neu laden statt die vorhandene Kopie zu nutzen
+            
+        Returns:
+            Set der Repository-Namen (klein geschrieben)
+        """
+        if self._repo_names is not None and not refresh:
+            return self._repo_names
+        
+        names: Set[str] = set()
+        if self.http_cache is not None:
+            paths = []
+            page = 1
+            while True:
+                path = f'/user/repos?affiliation=owner&per_page={REPO_LIST_PAGE_SIZE}&page={page}'
+                paths.append(path)
+                items = self._cached_get('list_repos', path, page=page)
+                names.update(item['name'].lower() for item in items)
+                if len(items) < REPO_LIST_PAGE_SIZE:
+                    break
+                page += 1
+            self._repo_list_paths = paths
+        else:
+            with self._api_call('list_repos'):
+                names = {repo.name.lower() for repo in self.user.get_repos(affiliation='owner')}
+        
+        self._repo_names = names
+        return names
+    
+    def get_repos_info(self, repo_names: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Holt die Informationen vieler Repositories per GraphQL (bis zu 100 pro Request)
+        
+        Ersetzt einen get_repo_info-Aufruf pro Repository: jede Query fragt bis zu
+        GRAPHQL_BATCH_SIZE Repositories über Aliase ab.
+        
+        Args:
+            repo_names: Namen der Repositories (des authentifizierten Benutzers)
+            
+        Returns:
+            Dictionary {Name: Informationen wie get_repo_info plus last_commit},
+            None für nicht gefundene Repositories
+        """
+        owner = self.login
+        names = list(dict.fromkeys(repo_names))
+        infos: Dict[str, Optional[Dict]] = {}
+        
+        for start in range(0, len(names), GRAPHQL_BATCH_SIZE):
+            batch = names[start:start + GRAPHQL_BATCH_SIZE]
+            aliases = '\n'.join(
+                f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ ...RepoFields }}'
+                for i, name in enumerate(batch)
+            )
+            query = f'query {{\n{aliases}\n}}\nfragment RepoFields on Repository {{{REPO_GRAPHQL_FIELDS}}}'
+            data = self._graphql('graphql_repos', query, repos=len(batch))
+            for i, name in enumerate(batch):
+                node = data.get(f'r{i}')
+                infos[name] = self._graphql_repo_info(node) if node else None
+        
+        return infos
+    
+    def list_repositories_info(self) -> List[Dict]:
+        """
+        Holt die Informationen aller eigenen Repositories per GraphQL (Cursor-Paginierung)
+        
+        Returns:
+            Liste von Dictionaries wie bei get_repos_info, nach Erstellung sortiert
+        """
+        query = (
+            'query($cursor: String) {\n'
+            f'  viewer {{ repositories(first: {GRAPHQL_BATCH_SIZE}, after: $cursor, ownerAffiliations: OWNER, '
+            'orderBy: {field: CREATED_AT, direction: ASC}) {\n'
+            f'    pageInfo {{ hasNextPage endCursor }}\n    nodes {{{REPO_GRAPHQL_FIELDS}}}\n  }} }}\n'
+            '}'
+        )
+        infos: List[Dict] = []
+        cursor = None
+        page = 1
+        while True:
+            data = self._graphql('graphql_list_repos', query, {'cursor': cursor}, page=page)
+            connection = data['viewer']['repositories']
+            infos.extend(self._graphql_repo_info(node) for node in connection['nodes'])
+            if not connection['pageInfo']['hasNextPage']:
+                break
+            cursor = connection['pageInfo']['endCursor']
+            page += 1
+        return infos
+    
+    def _graphql(self, call: str, query: str, variables: Optional[Dict] = None, **attributes) -> Dict:
+        """Führt eine GraphQL-Query aus; NOT_FOUND-Fehler einzelner Aliase liefern None in den Daten"""
+        with self._api_call(call, update_remaining=False, **attributes):
+            response = self._shared.session.post(
+                self.graphql_url,
+                json={'query': query, 'variables': variables or {}},
+                headers={'Authorization': f'bearer {self.token}'},
+                timeout=30
+            )
+            if response.status_code != 200:
+                raise Exception(f"GraphQL-Fehler {response.status_code}: {response.text[:200]}")
+            payload = response.json()
+            errors = [e for e in payload.get('errors') or [] if e.get('type') != 'NOT_FOUND']
+            if errors or payload.get('data') is None:
+                messages = '; '.join(e.get('message', str(e)) for e in errors) or 'keine Daten'
+                raise Exception(f"GraphQL-Fehler: {messages}")
+        return payload['data']
+    
+    @staticmethod
+    def _graphql_repo_info(node: Dict) -> Dict:
+        """Wandelt einen GraphQL-Repository-Knoten in das Format von get_repo_info um"""
+        branch = node.get('defaultBranchRef') or {}
+        commit = branch.get('target') or {}
+        return {
+            'name': node['name'],
+            'full_name': node['nameWithOwner'],
+            'url': node['url'],
+            'description': node['description'],
+            'private': node['isPrivate'],
+            'created_at': datetime.fromisoformat(node['createdAt'].replace('Z', '+00:00')),
+            'default_branch': branch.get('name'),
+            'size': node['diskUsage'],
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'last_commit': {
+                'sha': commit['oid'],
+                'message': commit['messageHeadline'],
+                'date': commit['committedDate'],
+            } if commit.get('oid') else None
+        }
+    
     def delete_repository(self, repo_name: str) -> None:
         """
         Löscht ein Repository (Vorsicht!)
@@ -149,9 +594,13 @@ class GitHubClient:
         Args:
             repo_name: Name des Repositories
         """
+        repo = self.get_repository(repo_name)
         try:
-            repo = self.user.get_repo(repo_name)
-            repo.delete()
+            with self._api_call('delete_repo', repo=repo_name):
+                repo.delete()
+            self.invalidate_cache(f'/repos/{repo.full_name}', *self._repo_list_paths)
+            if self._repo_names is not None:
+                self._repo_names.discard(repo_name.lower())
             print(f"🗑️  Repository gelöscht: {repo_name}")
         except GithubException as e:
             raise Exception(f"Fehler beim Löschen: {e}")
@@ -163,8 +612,20 @@ class GitHubClient:
         Returns:
             Dictionary mit Rate Limit Informationen
         """
-        rate_limit = self.client.get_rate_limit()
+        if self.http_cache is not None:
+            # Immer revalidieren: unverändert -> 304, verändert -> aktuelle Werte
+            core = self._cached_get('rate_limit', '/rate_limit', max_age=0)['resources']['core']
+            GITHUB_RATE_LIMIT_REMAINING.set(core['remaining'])
+            return {
+                'limit': core['limit'],
+                'remaining': core['remaining'],
+                'reset_time': datetime.fromtimestamp(core['reset'], tz=timezone.utc)
+            }
+        
+        with self._api_call('rate_limit'):
+            rate_limit = self.client.get_rate_limit()
         core = rate_limit.core
+        GITHUB_RATE_LIMIT_REMAINING.set(core.remaining)
         
         return {
             'limit': core.limit,
@@ -172,16 +633,57 @@ class GitHubClient:
             'reset_time': core.reset
         }
     
-    def get_repo_info(self, repo: Repository.Repository) -> Dict:
+    @contextmanager
+    def _api_call(self, call: str, update_remaining: bool = True, **attributes):
+        """Misst einen GitHub API Aufruf (Trace-Span und Prometheus-Metriken)"""
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            with span(f'github.{call}', **attributes):
+                yield
+            outcome = 'ok'
+        finally:
+            GITHUB_API_CALLS.inc(call=call, outcome=outcome)
+            GITHUB_API_DURATION.observe(time.perf_counter() - started, call=call)
+            if outcome == 'ok' and update_remaining:
+                self._update_remaining()
+    
+    def _cached_get(self, call: str, path: str, max_age: Optional[float] = None, **attributes):
+        """GET über den ETag-Cache; liefert die JSON-Daten"""
+        with self._api_call(call, update_remaining=False, path=path, **attributes):
+            response = self.http_cache.get(path, max_age=max_age)
+        if response.source != 'hit' and response.rate_limit_remaining is not None:
+            GITHUB_RATE_LIMIT_REMAINING.set(response.rate_limit_remaining)
+        return response.data
+    
+    def invalidate_cache(self, *paths: str) -> None:
+        """Verwirft gecachte GET-Antworten (nach Schreibzugriffen aufrufen)"""
+        if self.http_cache is not None:
+            self.http_cache.invalidate(*paths)
+    
+    def _update_remaining(self) -> None:
+        """Übernimmt das Rate Limit aus den X-RateLimit-Headern der letzten Antwort"""
+        remaining, _ = self.client.rate_limiting
+        GITHUB_RATE_LIMIT_REMAINING.set(remaining)
+    
+    def _throttle(self) -> None:
+        """Wartet rate_limit_delay Sekunden (im Trace separat ausgewiesen)"""
+        if self.rate_limit_delay > 0:
+            with span('github.rate_limit_delay'):
+                time.sleep(self.rate_limit_delay)
+    
+    def get_repo_info(self, repo) -> Dict:
         """
         Holt Informationen über ein Repository
         
         Args:
-            repo: Repository-Objekt
+            repo: Repository-Objekt oder Name (wird dann über den Cache geladen)
             
         Returns:
             Dictionary mit Repository-Informationen
         """
+        if isinstance(repo, str):
+            repo = self.get_repository(repo)
         return {
             'name': repo.name,
             'full_name': repo.full_name,
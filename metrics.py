@@ -0,0 +1,356 @@
+"""
+Metrics - Prometheus-Metriken für Dashboard und Web-Interface
+
+Counter, Gauges und Histogramme im Prometheus-Textformat (0.0.4), ohne
+zusätzliche Dependency. Schreibzugriffe landen in einem Shard pro Thread
+und brauchen damit keinen Lock; erst render() summiert alle Shards.
+
+Verwendung:
+    REQUESTS = counter('autocoder_things_total', 'Beschreibung', ['kind'])
+    REQUESTS.inc(kind='a')
+    LATENCY = histogram('autocoder_step_seconds', 'Beschreibung', ['step'])
+    LATENCY.observe(0.012, step='parse')
+    print(REGISTRY.render())
+
+    install_flask(app, 'dashboard')   # Latenz pro Route + GET /metrics
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Basis: verwaltet Labels und die Shards pro Thread"""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[LabelKey, object]]] = []
+        self._retired: Dict[LabelKey, object] = {}
+        self._shards_lock = threading.Lock()
+        self._function: Optional[Callable[[], float]] = None
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: Labels {self.labelnames} erwartet, erhalten {tuple(labels)}")
+        try:
+            return tuple(map(labels.__getitem__, self.labelnames))
+        except KeyError as e:
+            raise ValueError(f"{self.name}: Label {e} fehlt") from None
+
+    def _shard(self) -> Dict[LabelKey, object]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[LabelKey, object] = {}
+            self._local.shard = shard
+            # Nur beim ersten Zugriff eines Threads wird gesperrt
+            with self._shards_lock:
+                self._retire_dead()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _retire_dead(self) -> None:
+        # Shards beendeter Threads (z.B. Request-Threads von Flask) zusammenfassen,
+        # damit die Liste nicht mit jedem Thread wächst. Aufrufer hält _shards_lock.
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                for key, value in shard.items():
+                    self._retired[key] = self._merge(self._retired.get(key), value)
+        self._shards = alive
+
+    @staticmethod
+    def _merge(total: Optional[object], value: object) -> object:
+        return (total or 0.0) + value  # type: ignore[operator]
+
+    def _snapshot(self) -> Dict[LabelKey, object]:
+        """Summe über alle Shards"""
+        with self._shards_lock:
+            self._retire_dead()
+            merged = {key: self._merge(None, value) for key, value in self._retired.items()}
+            # dict() kopiert atomar unter dem GIL, auch wenn der Besitzer-Thread gerade schreibt
+            shards = [dict(shard) for _, shard in self._shards]
+        for shard in shards:
+            for key, value in shard.items():
+                merged[key] = self._merge(merged.get(key), value)
+        return merged
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Liest den (label-losen) Wert beim Rendern aus einer Funktion, z.B. aus Cache-Statistiken"""
+        if self.labelnames:
+            raise ValueError(f"{self.name}: set_function nur für Metriken ohne Labels")
+        self._function = function
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        for suffix, labels, value in self.samples():
+            lines.append(f'{self.name}{suffix}{labels} {_format_value(value)}')
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Monoton steigender Zähler"""
+
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def values(self) -> Dict[LabelKey, float]:
+        if self._function is not None:
+            return {(): float(self._function())}
+        return self._snapshot()  # type: ignore[return-value]
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [('', _format_labels(self.labelnames, key), value)
+                for key, value in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """Wert, der steigen und fallen kann (inc/dec je Thread, set global)"""
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._set_values: Dict[LabelKey, float] = {}
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        # Einzelne Zuweisung, kein Lock nötig. Für absolute Werte gedacht; inc/dec-Deltas
+        # derselben Labels würden darauf addiert, also pro Gauge nur eines von beiden nutzen.
+        self._set_values[self._key(labels)] = float(value)
+
+    def track_inprogress(self, **labels: str) -> '_InProgress':
+        """Context Manager: erhöht den Gauge für die Dauer des Blocks"""
+        return _InProgress(self, labels)
+
+    def values(self) -> Dict[LabelKey, float]:
+        merged = super().values()
+        if self._function is None:
+            for key, value in list(self._set_values.items()):
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+
+class _InProgress:
+    def __init__(self, gauge: Gauge, labels: Dict[str, str]):
+        self.gauge = gauge
+        self.labels = labels
+
+    def __enter__(self) -> None:
+        self.gauge.inc(**self.labels)
+
+    def __exit__(self, *exc_info) -> None:
+        self.gauge.dec(**self.labels)
+
+
+class Histogram(_Metric):
+    """Verteilung von Beobachtungen in festen Buckets"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        state = shard.get(key)
+        if state is None:
+            # [Bucket-Zähler..., +Inf, Summe]
+            state = [0.0] * (len(self.buckets) + 2)
+            shard[key] = state
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def time(self, **labels: str) -> '_Timer':
+        """Context Manager: misst die Dauer des Blocks"""
+        return _Timer(self, labels)
+
+    @staticmethod
+    def _merge(total: Optional[object], value: object) -> object:
+        state = list(value)  # type: ignore[call-overload]
+        if total is None:
+            return state
+        return [a + b for a, b in zip(total, state)]  # type: ignore[call-overload]
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        merged: Dict[LabelKey, List[float]] = self._snapshot()  # type: ignore[assignment]
+        samples = []
+        bounds = self.buckets + (float('inf'),)
+        for key, state in sorted(merged.items()):
+            cumulative = 0.0
+            for bound, count in zip(bounds, state):
+                cumulative += count
+                samples.append(('_bucket', _format_labels(self.labelnames, key, ('le', _format_value(bound))),
+                                cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append(('_sum', labels, state[-1]))
+            samples.append(('_count', labels, cumulative))
+        return samples
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class Registry:
+    """Sammlung aller Metriken eines Prozesses"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Registriert eine Metrik; gleicher Name liefert die bestehende Instanz"""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metrik {metric.name} ist bereits anders registriert")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Alle Metriken im Prometheus-Textformat"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def gauge(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def histogram(name: str, documentation: str, labelnames: Iterable[str] = (),
+              buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+
+# -- Gemeinsame Metriken der Auto-Coder Module --
+
+HTTP_REQUEST_DURATION = histogram(
+    'autocoder_http_request_duration_seconds', 'Dauer der HTTP-Requests pro Route',
+    ['app', 'method', 'route', 'status'])
+IN_FLIGHT = gauge(
+    'autocoder_in_flight', 'Laufende Round-Table-Diskussionen bzw. Projekt-Jobs', ['kind'])
+ROUND_TABLE_MODEL_LATENCY = histogram(
+    'autocoder_round_table_model_latency_seconds', 'Antwortzeit pro Round-Table-Modell/Agent', ['model'])
+ROUND_TABLE_BREAKER_STATE = gauge(
+    'autocoder_round_table_breaker_state', 'Circuit Breaker pro Modell (0 = geschlossen, 1 = halb offen, 2 = offen)',
+    ['model'])
+ROUND_TABLE_HEDGES = counter(
+    'autocoder_round_table_hedges_total', 'Zweite (gehedgte) Modell-Aufrufe nach Gewinner', ['model', 'winner'])
+GITHUB_API_CALLS = counter(
+    'autocoder_github_api_calls_total', 'GitHub API Aufrufe', ['call', 'outcome'])
+GITHUB_API_DURATION = histogram(
+    'autocoder_github_api_duration_seconds', 'Dauer der GitHub API Aufrufe', ['call'])
+GITHUB_RATE_LIMIT_REMAINING = gauge(
+    'autocoder_github_rate_limit_remaining', 'Verbleibende GitHub API Requests laut letzter Antwort')
+GENERATED_FILES = counter(
+    'autocoder_generated_files_total', 'Generierte Projektdateien')
+GENERATED_BYTES = counter(
+    'autocoder_generated_bytes_total', 'Generierte Bytes (UTF-8) über alle Projektdateien')
+ADMISSION_QUEUE_DEPTH = gauge(
+    'autocoder_admission_queue_depth', 'Requests in der Warteschlange vor einem begrenzten Endpunkt', ['endpoint'])
+ADMISSION_REJECTED = counter(
+    'autocoder_admission_rejected_total', 'Mit 429 abgelehnte Requests pro Endpunkt und Grund', ['endpoint', 'reason'])
+SINGLEFLIGHT_COALESCED = counter(
+    'autocoder_singleflight_coalesced_total', 'Requests, die auf einen laufenden identischen Aufruf gewartet haben', ['kind'])
+STORE_FILES = counter(
+    'autocoder_content_store_files_total', 'Dateien im Content Store: neu geschrieben oder dedupliziert', ['outcome'])
+
+
+def install_flask(app, app_name: str, path: str = '/metrics') -> None:
+    """
+    Instrumentiert eine Flask-App: Latenz-Histogramm pro Route und GET /metrics
+
+    Args:
+        app: Flask-Anwendung
+        app_name: Wert des Labels `app` (z.B. 'dashboard')
+        path: Pfad des Metrik-Endpunkts
+    """
+    from flask import Response, g, request
+
+    @app.before_request
+    def _metrics_start():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _metrics_observe(response):
+        started = getattr(g, '_metrics_started', None)
+        if started is not None:
+            # Route-Template statt konkretem Pfad, damit die Label-Anzahl begrenzt bleibt
+            route = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, app=app_name,
+                                          method=request.method, route=route,
+                                          status=str(response.status_code))
+        return response
+
+    def _metrics_endpoint():
+        return Response(REGISTRY.render(), mimetype=None, content_type=CONTENT_TYPE)
+
+    app.add_url_rule(path, 'metrics', _metrics_endpoint)
@@ -0,0 +1,318 @@
+"""
+Model Router - Latenz- und kostenbewusste Modellauswahl für den Round Table
+
+Führt pro Modell laufende Statistiken (Latenz-Perzentil, Fehlerquote,
+Tokens pro Aufruf). Mit path werden sie als JSON geladen und gespeichert,
+damit sie Neustarts überleben; ohne path bleiben sie im Speicher. Für ein Budget (maximale Latenz und/oder Kostendecke pro
+Diskussion) entscheidet plan(), welche Modelle befragt werden und welches
+Modell einen Fokusbereich ersatzweise übernimmt:
+
+    1. Ein Modell, dessen p95 über dem Latenzbudget liegt (oder dessen
+       Circuit Breaker offen ist), wird für seinen Fokusbereich durch das
+       zuverlässigste, günstigste Modell im Budget ersetzt.
+    2. Liegt die geschätzte Summe über der Kostendecke, wird der teuerste
+       Platz durch ein günstigeres Modell ersetzt oder weggelassen.
+
+Ohne Budget wird nichts umgeleitet (voller Tisch, z.B. für nächtliche Jobs).
+Modelle ohne Messwerte gelten als passend, damit sie Statistiken sammeln.
+
+Kosten = Tokens pro Aufruf / 1000 * Preis des Modells (prices, Standard 1.0;
+ohne Preise entspricht max_cost also tausend Tokens).
+
+Verwendung:
+    router = ModelRouter(path=DEFAULT_STATS_PATH, prices={'gpt': 0.01, 'claude': 0.015})
+    plan = router.plan(['grok', 'claude', 'gpt', 'gemini'], available, Budget(latency_s=5))
+    for seat, model in plan.assignments: ...
+    router.record('gpt', latency=1.2, tokens=850)
+    router.save()
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+from resilience import LatencyWindow
+
+
+# Vorschlag für path; ohne Angabe wird nichts gelesen oder geschrieben
+DEFAULT_STATS_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'github-auto-coder', 'model_stats.json')
+
+
+@dataclass
+class Budget:
+    """Budget einer Diskussion; None = keine Grenze"""
+    latency_s: Optional[float] = None
+    max_cost: Optional[float] = None
+
+    @classmethod
+    def coerce(cls, value: Union['Budget', Dict, float, int, None]) -> Optional['Budget']:
+        """
+        Budget aus Budget, Dict ({'latency_s': 5, 'max_cost': 0.1}) oder Zahl (= latency_s)
+
+        Raises:
+            ValueError: Bei unbekannten Schlüsseln oder nicht positiven Werten
+        """
+        if value is None or isinstance(value, Budget):
+            budget = value
+        elif isinstance(value, dict):
+            unknown = set(value) - {'latency_s', 'max_cost'}
+            if unknown:
+                raise ValueError(f"Unbekannte Budget-Angaben: {', '.join(sorted(unknown))}")
+            budget = cls(**value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            budget = cls(latency_s=float(value))
+        else:
+            raise ValueError(f"Ungültiges Budget: {value!r}")
+        if budget is not None:
+            for name in ('latency_s', 'max_cost'):
+                limit = getattr(budget, name)
+                if limit is not None and limit <= 0:
+                    raise ValueError(f"{name} muss größer als 0 sein")
+        return budget
+
+    @property
+    def unlimited(self) -> bool:
+        return self.latency_s is None and self.max_cost is None
+
+
+@dataclass
+class RoutingPlan:
+    """Ergebnis von ModelRouter.plan()"""
+    assignments: List[Tuple[str, str]]          # (Fokusbereich/Platz, befragtes Modell)
+    dropped: List[str] = field(default_factory=list)
+    estimated_latency_s: Optional[float] = None
+    estimated_cost: float = 0.0
+    over_budget: bool = False
+
+    @property
+    def substitutions(self) -> Dict[str, str]:
+        return {seat: model for seat, model in self.assignments if seat != model}
+
+
+class _ModelStats:
+    """Laufende Statistik eines Modells; Aufrufer hält den Lock des Routers"""
+
+    def __init__(self, window_size: int):
+        self.window = LatencyWindow(window_size)
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.tokens: Optional[float] = None
+        self.calls = 0
+        self.failures = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            'latencies': self.window.samples(),
+            'latency': self.latency,
+            'error_rate': self.error_rate,
+            'tokens': self.tokens,
+            'calls': self.calls,
+            'failures': self.failures,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, window_size: int) -> '_ModelStats':
+        stats = cls(window_size)
+        for latency in data.get('latencies', []):
+            stats.window.add(float(latency))
+        stats.latency = data.get('latency')
+        stats.error_rate = float(data.get('error_rate', 0.0))
+        stats.tokens = data.get('tokens')
+        stats.calls = int(data.get('calls', 0))
+        stats.failures = int(data.get('failures', 0))
+        return stats
+
+
+class ModelRouter:
+    """Wählt Modelle pro Diskussion nach Latenz, Fehlerquote und Kosten (thread-sicher)"""
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 prices: Optional[Dict[str, float]] = None,
+                 percentile: float = 0.95,
+                 min_samples: int = 5,
+                 alpha: float = 0.2,
+                 window_size: int = 100):
+        """
+        Args:
+            path: JSON-Datei für die Statistiken (z.B. DEFAULT_STATS_PATH); None = nur im Speicher
+            prices: Preis pro 1000 Tokens je Modell ({'gpt': 0.01, ...}), fehlende Modelle: 1.0
+            percentile: Latenz-Perzentil, das gegen das Budget geprüft wird
+            min_samples: Messwerte, ab denen das Perzentil statt des Mittelwerts gilt
+            alpha: Glättung der gleitenden Mittelwerte (Latenz, Fehlerquote, Tokens)
+            window_size: Anzahl der Latenzen, über die das Perzentil gebildet wird
+        """
+        self.path = path
+        self.prices = dict(prices or {})
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.alpha = alpha
+        self.window_size = window_size
+        self._stats: Dict[str, _ModelStats] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def record(self, model: str, latency: float, tokens: Optional[int] = None, ok: bool = True) -> None:
+        """
+        Erfasst einen Aufruf
+
+        Args:
+            model: Modellname (z.B. 'gpt')
+            latency: Dauer in Sekunden (bei Abbruch wegen Budget: Dauer bis zum Abbruch)
+            tokens: Prompt- plus Antwort-Tokens, None = unbekannt
+            ok: False bei fehlgeschlagenem Aufruf
+        """
+        with self._lock:
+            stats = self._stats.setdefault(model, _ModelStats(self.window_size))
+            stats.calls += 1
+            stats.error_rate = self._smooth(stats.error_rate, 0.0 if ok else 1.0)
+            if not ok:
+                stats.failures += 1
+                return
+            stats.window.add(latency)
+            stats.latency = self._smooth(stats.latency, latency)
+            if tokens is not None:
+                stats.tokens = self._smooth(stats.tokens, float(tokens))
+
+    def estimate(self, model: str) -> Dict:
+        """Geschätzte Latenz (Perzentil bzw. Mittelwert, None ohne Messwerte), Fehlerquote und Kosten"""
+        with self._lock:
+            stats = self._stats.get(model)
+            if stats is None:
+                return {'latency_s': None, 'error_rate': 0.0, 'cost': 0.0, 'samples': 0}
+            latency = (stats.window.percentile(self.percentile)
+                       if len(stats.window) >= self.min_samples else stats.latency)
+            return {
+                'latency_s': latency,
+                'error_rate': stats.error_rate,
+                'cost': (stats.tokens or 0.0) / 1000 * self.prices.get(model, 1.0),
+                'samples': len(stats.window),
+            }
+
+    def plan(self, seats: List[str], available: List[str], budget: Optional[Budget] = None) -> RoutingPlan:
+        """
+        Verteilt die Fokusbereiche (seats) auf verfügbare Modelle innerhalb des Budgets
+
+        Args:
+            seats: Angefragte Modelle in Tisch-Reihenfolge; jedes steht für seinen Fokusbereich
+            available: Modelle, die befragt werden dürfen (z.B. Circuit Breaker geschlossen)
+            budget: Latenz- und Kostengrenze; None bzw. ohne Grenzen = keine Umleitung
+
+        Returns:
+            RoutingPlan; mindestens eine Zuordnung, solange ein Modell verfügbar ist
+            (over_budget, wenn selbst das schnellste Modell das Latenzbudget reißt)
+        """
+        estimates = {model: self.estimate(model) for model in set(seats) | set(available)}
+
+        if budget is None or budget.unlimited:
+            assignments = [(seat, seat) for seat in seats if seat in available]
+            return self._finish(assignments, [seat for seat in seats if seat not in available], estimates)
+
+        def fits(model: str) -> bool:
+            latency = estimates[model]['latency_s']
+            return budget.latency_s is None or latency is None or latency <= budget.latency_s
+
+        def rank(model: str) -> Tuple:
+            estimate = estimates[model]
+            return estimate['error_rate'], estimate['cost'], estimate['latency_s'] or 0.0
+
+        candidates = sorted((model for model in available if fits(model)), key=rank)
+        load = {model: 0 for model in candidates}
+        assignments: List[Tuple[str, str]] = []
+        dropped: List[str] = []
+
+        # 1. Latenz: zu langsame bzw. nicht verfügbare Plätze ersetzen, Ersatz gleichmäßig verteilen
+        for seat in seats:
+            if seat in load:
+                model = seat
+            elif candidates:
+                model = min(candidates, key=lambda m: (load[m], rank(m)))
+            else:
+                dropped.append(seat)
+                continue
+            load[model] += 1
+            assignments.append((seat, model))
+
+        over_budget = False
+        if not assignments and available:
+            # Kein Modell im Latenzbudget: lieber eine späte Antwort als keine
+            fastest = min(available, key=lambda m: estimates[m]['latency_s'] or 0.0)
+            assignments.append((dropped.pop(0), fastest))
+            over_budget = True
+
+        # 2. Kosten: teuersten Platz ersetzen oder weglassen, bis die Decke hält
+        if budget.max_cost is not None:
+            while len(assignments) > 1 and self._cost(assignments, estimates) > budget.max_cost:
+                index = max(range(len(assignments)),
+                            key=lambda i: (estimates[assignments[i][1]]['cost'], i))
+                seat, model = assignments[index]
+                cheaper = [m for m in candidates if estimates[m]['cost'] < estimates[model]['cost']]
+                if cheaper:
+                    assignments[index] = (seat, min(cheaper, key=lambda m: (estimates[m]['cost'], rank(m))))
+                else:
+                    dropped.append(assignments.pop(index)[0])
+            over_budget = over_budget or self._cost(assignments, estimates) > budget.max_cost
+
+        dropped.sort(key=seats.index)
+        plan = self._finish(assignments, dropped, estimates)
+        plan.over_budget = over_budget
+        return plan
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Aktuelle Schätzungen plus Aufruf-/Fehlerzähler aller bekannten Modelle"""
+        with self._lock:
+            counts = {model: (stats.calls, stats.failures) for model, stats in self._stats.items()}
+        return {
+            model: {**self.estimate(model), 'calls': calls, 'failures': failures}
+            for model, (calls, failures) in sorted(counts.items())
+        }
+
+    def save(self) -> None:
+        """
+        Schreibt die Statistiken atomar nach self.path (ohne path: nichts)
+
+        Raises:
+            OSError: Wenn die Datei nicht geschrieben werden kann
+        """
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': 1, 'models': {model: stats.to_dict() for model, stats in self._stats.items()}}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+
+    def _load(self) -> None:
+        """Liest gespeicherte Statistiken; ohne path, fehlende oder defekte Datei = leerer Start"""
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._stats = {
+                model: _ModelStats.from_dict(entry, self.window_size)
+                for model, entry in data.get('models', {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            self._stats = {}
+
+    def _smooth(self, previous: Optional[float], value: float) -> float:
+        return value if previous is None else self.alpha * value + (1 - self.alpha) * previous
+
+    @staticmethod
+    def _cost(assignments: List[Tuple[str, str]], estimates: Dict[str, Dict]) -> float:
+        return sum(estimates[model]['cost'] for _, model in assignments)
+
+    def _finish(self, assignments: List[Tuple[str, str]], dropped: List[str],
+                estimates: Dict[str, Dict]) -> RoutingPlan:
+        latencies = [estimates[model]['latency_s'] for _, model in assignments
+                     if estimates[model]['latency_s'] is not None]
+        return RoutingPlan(
+            assignments=assignments,
+            dropped=dropped,
+            estimated_latency_s=max(latencies) if latencies else None,
+            estimated_cost=self._cost(assignments, estimates),
+        )
@@ -0,0 +1,186 @@
+"""
+Project Archive - Generierte Projekte als ZIP oder tar.zst streamen
+
+Baut das Archiv direkt aus dem {Pfad: Inhalt}-Dictionary von CodeGenerator,
+ohne Zwischendateien und ohne das fertige Archiv im Speicher zu halten: die
+Archiv-Bibliotheken schreiben in einen kleinen Puffer, der nach jedem
+Datei-Stück als Chunk ausgegeben und geleert wird.
+
+    zip      zipfile (Deflate, Data Descriptors, da der Ausgabestrom nicht seekbar ist)
+    tar.zst  tarfile im Stream-Modus + zstandard (optional: pip install zstandard)
+
+Verwendung:
+    for chunk in stream_archive(files, 'zip', root='mein-projekt'):
+        response.write(chunk)
+
+    write_archive(files, 'mein-projekt.tar.zst', root='mein-projekt')
+"""
+import io
+import tarfile
+import time
+import zipfile
+from typing import Dict, Iterator, List, Optional
+
+
+# Format -> MIME-Type
+ARCHIVE_FORMATS: Dict[str, str] = {
+    'zip': 'application/zip',
+    'tar.zst': 'application/zstd',
+}
+
+CHUNK_SIZE = 64 * 1024
+ZSTD_LEVEL = 3
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Nicht seekbarer Schreibpuffer, den der Generator nach jedem Schritt leert"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if len(data):
+            self._chunks.append(bytes(data))
+            self._size += len(data)
+        return len(data)
+
+    def drain(self, minimum: int = 1) -> Iterator[bytes]:
+        """Gibt den Puffer als einen Chunk aus, sobald er minimum Bytes enthält"""
+        if self._size >= minimum:
+            data = b''.join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
+            yield data
+
+
+def format_from_filename(filename: str) -> str:
+    """
+    Leitet das Archivformat aus der Dateiendung ab
+
+    Raises:
+        ValueError: Wenn die Endung zu keinem Format passt
+    """
+    for fmt in ARCHIVE_FORMATS:
+        if filename.endswith('.' + fmt):
+            return fmt
+    raise ValueError(f"Unbekanntes Archivformat: {filename} (erlaubt: {', '.join(ARCHIVE_FORMATS)})")
+
+
+def check_format(fmt: str) -> None:
+    """
+    Prüft vorab, ob fmt erzeugt werden kann (vor Projekt-Generierung und Response-Headern)
+
+    Raises:
+        ValueError: Bei unbekanntem Format
+        ImportError: Wenn für tar.zst das Paket zstandard fehlt
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unbekanntes Archivformat: {fmt} (erlaubt: {', '.join(ARCHIVE_FORMATS)})")
+    if fmt == 'tar.zst':
+        _zstandard()
+
+
+def stream_archive(files: Dict[str, str],
+                   fmt: str,
+                   root: Optional[str] = None,
+                   chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Erzeugt das Archiv stückweise
+
+    Args:
+        files: Dictionary mit {Pfad: Inhalt}
+        fmt: 'zip' oder 'tar.zst'
+        root: Optional: Ordnername, unter dem die Dateien im Archiv liegen
+        chunk_size: Nach so vielen unkomprimierten Bytes wird spätestens ein Chunk ausgegeben
+
+    Yields:
+        Archiv-Bytes (leere Chunks werden nicht ausgegeben)
+
+    Raises:
+        ValueError: Bei unbekanntem Format
+        ImportError: Wenn für tar.zst das Paket zstandard fehlt
+    """
+    check_format(fmt)
+    prefix = f"{root.strip('/')}/" if root else ''
+    if fmt == 'zip':
+        return _stream_zip(files, prefix, chunk_size)
+    # Import hier statt im Generator: Fehler kommen beim Aufruf, nicht erst beim ersten Chunk
+    return _stream_tar_zst(files, prefix, chunk_size, _zstandard())
+
+
+def write_archive(files: Dict[str, str], output: str, fmt: Optional[str] = None,
+                  root: Optional[str] = None) -> int:
+    """
+    Schreibt das Archiv in eine Datei
+
+    Args:
+        files: Dictionary mit {Pfad: Inhalt}
+        output: Zieldatei
+        fmt: Optional: Format (sonst aus der Dateiendung)
+        root: Optional: Ordnername im Archiv
+
+    Returns:
+        Größe des Archivs in Bytes
+    """
+    chunks = stream_archive(files, fmt or format_from_filename(output), root)
+    size = 0
+    with open(output, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def _stream_zip(files: Dict[str, str], prefix: str, chunk_size: int) -> Iterator[bytes]:
+    buffer = _ChunkBuffer()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, content in files.items():
+            data = content.encode('utf-8')
+            info = zipfile.ZipInfo(prefix + path, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            with archive.open(info, 'w') as entry:
+                for offset in range(0, len(data), chunk_size):
+                    entry.write(data[offset:offset + chunk_size])
+                    yield from buffer.drain(chunk_size)
+            yield from buffer.drain(chunk_size)
+    # Central Directory
+    yield from buffer.drain()
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("tar.zst benötigt das Paket zstandard (pip install zstandard)")
+    return zstandard
+
+
+def _stream_tar_zst(files: Dict[str, str], prefix: str, chunk_size: int, zstandard) -> Iterator[bytes]:
+    buffer = _ChunkBuffer()
+    mtime = int(time.time())
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(buffer, closefd=False)
+    pending = 0
+    with tarfile.open(fileobj=compressor, mode='w|', format=tarfile.PAX_FORMAT) as archive:
+        for path, content in files.items():
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(prefix + path)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+            # zstd puffert sonst bis zum Frame-Ende; Blöcke erst ab chunk_size abschließen,
+            # damit viele kleine Dateien nicht die Kompressionsrate verschlechtern
+            pending += len(data)
+            if pending >= chunk_size:
+                compressor.flush(zstandard.FLUSH_BLOCK)
+                pending = 0
+                yield from buffer.drain()
+    compressor.close()
+    yield from buffer.drain()
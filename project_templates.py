@@ -0,0 +1,102 @@
+"""
+Project Templates - Template-Repositories für häufige Sprache/Projekttyp-Kombinationen
+
+Ein Großteil der generierten Dateien (LICENSE, .gitignore, Hauptcode, Tests,
+CI-Workflow, .gitkeep) hängt nur von Sprache und Projekttyp ab. Diese Dateien
+liegen einmal in einem Template-Repository; neue Repositories entstehen über
+GitHubs "Generate from template" und bekommen nur noch die planabhängigen
+Dateien (README, requirements.txt/package.json/pom.xml/go.mod, ...) committet.
+
+Welche Dateien planabhängig sind, wird nicht von Hand gepflegt: der Generator
+läuft für zwei Varianten des Plans (anderer Name, andere Beschreibung, andere
+Dependencies), nur identische Dateien kommen ins Template.
+
+Konfiguration (config.json):
+    "template_repos": false                         # aus (Standard)
+    "template_repos": true                          # POPULAR_COMBOS
+    "template_repos": ["python/web_app", "go/api"]  # eigene Liste
+"""
+import dataclasses
+import hashlib
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from code_generator import CodeGenerator
+from task_parser import ProjectPlan
+
+
+TEMPLATE_PREFIX = 'auto-coder-template'
+
+POPULAR_COMBOS: Set[Tuple[str, str]] = {
+    ('python', 'cli'),
+    ('python', 'web_app'),
+    ('python', 'api'),
+    ('python', 'library'),
+    ('javascript', 'web_app'),
+    ('javascript', 'api'),
+    ('typescript', 'web_app'),
+    ('typescript', 'api'),
+    ('go', 'microservice'),
+    ('java', 'api'),
+}
+
+
+def template_combos(setting: Union[bool, List[str], None]) -> Set[Tuple[str, str]]:
+    """
+    Wertet den Config-Schlüssel template_repos aus
+
+    Args:
+        setting: False/None, True oder Liste von "sprache/projekttyp"
+
+    Returns:
+        Set der (Sprache, Projekttyp)-Kombinationen mit Template
+    """
+    if not setting:
+        return set()
+    if setting is True:
+        return set(POPULAR_COMBOS)
+    return {tuple(combo.split('/', 1)) for combo in setting}
+
+
+def static_files(generator: CodeGenerator, plan: ProjectPlan) -> Dict[str, str]:
+    """
+    Ermittelt die Dateien, die nur von Sprache und Projekttyp abhängen
+
+    Args:
+        generator: CodeGenerator
+        plan: Projektplan (wird nicht verändert)
+
+    Returns:
+        Dictionary {Pfad: Inhalt} der planunabhängigen Dateien
+    """
+    first = generator.generate_files(dataclasses.replace(
+        plan, repo_name='template-probe-a', description='Probe A', files={}))
+    second = generator.generate_files(dataclasses.replace(
+        plan, repo_name='template-probe-b', description='Probe B', files={},
+        dependencies=list(plan.dependencies) + ['template-probe']))
+    return {path: content for path, content in first.items() if second.get(path) == content}
+
+
+def template_name(language: str, project_type: str, files: Dict[str, str]) -> str:
+    """
+    Name des Template-Repositories; enthält einen Fingerprint der Inhalte
+
+    Ändert sich der Generator, entsteht ein neues Template statt eines
+    veralteten Stands.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.encode('utf-8') + b'\0' + files[path].encode('utf-8') + b'\0')
+    return f"{TEMPLATE_PREFIX}-{language}-{project_type}-{digest.hexdigest()[:8]}".replace('_', '-')
+
+
+def plan_delta(files: Dict[str, str], template_files: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    Dateien, die nach dem Erzeugen aus dem Template noch committet werden müssen
+
+    Returns:
+        Dictionary {Pfad: Inhalt} oder None, wenn das Template Dateien enthält,
+        die im Plan fehlen oder abweichen (dann ohne Template hochladen)
+    """
+    if any(files.get(path) != content for path, content in template_files.items()):
+        return None
+    return {path: content for path, content in files.items() if path not in template_files}
@@ -0,0 +1,271 @@
+"""
+Prompt Builder - Token-Budgets und Kontext-Packing für Round-Table-Prompts
+
+Statt Aufgabe und Kontext-Dict roh an jedes Modell zu hängen:
+
+    - Token-Schätzung lokal (Wörter und Satzzeichen, ohne Tokenizer-Abhängigkeit)
+    - Budget pro Modell (max_tokens, abweichend über model_budgets)
+    - Passt der Kontext ins Budget, geht er unverändert raus (Darstellung wie
+      bisher beim Aufrufer, Standard: JSON); sonst wird er gepackt:
+        - kompakt als JSON; mehrfach vorkommende Werte (z.B. dieselbe Datei
+          unter zwei Schlüsseln) werden nur einmal übertragen
+        - der größte Wert wird in der Mitte gekürzt (Anfang und Ende bleiben),
+          bis das Budget passt; notfalls fallen die letzten Schlüssel weg
+    - Der Kontext wird pro Diskussion einmal gepackt und steht bei allen Modellen
+      als identischer Anfang im Prompt (Prefix-Caching der Anbieter greift)
+    - Verkettete Antworten (Agent -> Agent) werden auf chain_tokens zusammengefasst
+
+Verwendung:
+    builder = PromptBuilder(max_tokens=2000, model_budgets={'gemini': 8000})
+    pack = builder.prepare(task, context)          # pro Diskussion (render=str: Dict-Darstellung)
+    prompt = pack.prompt('gpt', 'Als Best-Practice-Experte ...')
+    next_input = pack.chain(previous_output)
+    pack.stats()   # {'raw_tokens': ..., 'sent_tokens': ..., 'saved_tokens': ...}
+"""
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Tokens des Kürzungs-Markers " … [123 Tokens gekürzt] … "
+MARKER_TOKENS = 7
+
+
+def estimate_tokens(text: str) -> int:
+    """Grobe, lokale Token-Schätzung (Wörter und Satzzeichen)"""
+    return len(TOKEN_PATTERN.findall(text or ''))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Kürzt text auf etwa max_tokens; Anfang (2/3) und Ende (1/3) bleiben erhalten"""
+    spans = [match.span() for match in TOKEN_PATTERN.finditer(text)]
+    if len(spans) <= max_tokens:
+        return text
+    keep = max(max_tokens - MARKER_TOKENS, 2)
+    head = max(keep * 2 // 3, 1)
+    tail = keep - head
+    omitted = len(spans) - head - tail
+    truncated = f"{text[:spans[head - 1][1]]} … [{omitted} Tokens gekürzt] …"
+    if tail:
+        truncated += f" {text[spans[-tail][0]:]}"
+    return truncated
+
+
+def summarize(text: str, max_tokens: int) -> str:
+    """
+    Extraktive Zusammenfassung: ganze Sätze in Reihenfolge (Wiederholungen
+    übersprungen), solange sie ins Budget passen; ist schon der erste Satz
+    zu lang, wird gekürzt
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    kept: List[str] = []
+    seen = set()
+    used = 0
+    for sentence in SENTENCE_END.split(text.strip()):
+        key = ' '.join(sentence.lower().split())
+        if key in seen:
+            continue
+        seen.add(key)
+        tokens = estimate_tokens(sentence)
+        # 3 Tokens für den Auslassungs-Marker " […]" freihalten
+        if used + tokens > max_tokens - 3:
+            break
+        kept.append(sentence)
+        used += tokens
+    if not kept:
+        return truncate_tokens(text, max_tokens)
+    return ' '.join(kept) + ' […]'
+
+
+class PromptBuilder:
+    """Baut Prompts innerhalb eines Token-Budgets pro Modell (zustandslos, thread-sicher)"""
+
+    def __init__(self,
+                 max_tokens: int = 2000,
+                 model_budgets: Optional[Dict[str, int]] = None,
+                 chain_tokens: int = 300,
+                 min_value_tokens: int = 24,
+                 dedupe_min_tokens: int = 8,
+                 instruction_tokens: int = 64):
+        """
+        Args:
+            max_tokens: Budget pro Prompt, wenn model_budgets nichts anderes sagt
+            model_budgets: Budget pro Modell/Agent ({'gemini': 8000, ...})
+            chain_tokens: Budget für eine weitergereichte Antwort eines anderen Agenten
+            min_value_tokens: Kontextwerte werden nicht unter diese Größe gekürzt
+                              (stattdessen fallen die letzten Schlüssel weg)
+            dedupe_min_tokens: Ab dieser Größe werden identische Kontextwerte nur einmal übertragen
+            instruction_tokens: Für die modell-spezifische Anweisung freigehaltene Tokens; bei
+                                kürzeren Anweisungen bleibt der Kontext-Teil über Modelle gleich
+        """
+        self.max_tokens = max_tokens
+        self.model_budgets = dict(model_budgets or {})
+        self.chain_tokens = chain_tokens
+        self.min_value_tokens = min_value_tokens
+        self.dedupe_min_tokens = dedupe_min_tokens
+        self.instruction_tokens = instruction_tokens
+
+    def budget_for(self, model: str) -> int:
+        """Token-Budget eines Modells"""
+        return self.model_budgets.get(model, self.max_tokens)
+
+    def prepare(self, task: str, context: Optional[Dict[str, Any]],
+                render: Optional[Callable[[Dict[str, Any]], str]] = None) -> 'PromptPack':
+        """
+        Beginnt eine Diskussion; der Kontext wird je Budget einmal gepackt
+
+        Args:
+            task: Aufgabe
+            context: Kontext-Dict
+            render: Darstellung des Kontexts, solange er ins Budget passt
+                    (Standard: JSON wie json.dumps(context, ensure_ascii=False))
+        """
+        return PromptPack(self, task, context, render)
+
+    def pack_context(self, context: Optional[Dict[str, Any]], max_tokens: int) -> Tuple[str, Dict[str, int]]:
+        """
+        Serialisiert context kompakt, dedupliziert und auf max_tokens gekürzt
+
+        Returns:
+            (JSON-Text, {'deduplicated': n, 'truncated': n, 'dropped': n})
+        """
+        info = {'deduplicated': 0, 'truncated': 0, 'dropped': 0}
+        if not context:
+            return '', info
+
+        originals: Dict[str, str] = {}
+        first_seen: Dict[str, str] = {}
+        for key, value in context.items():
+            text = value if isinstance(value, str) else json.dumps(
+                value, ensure_ascii=False, default=str, separators=(',', ':'))
+            if estimate_tokens(text) >= self.dedupe_min_tokens:
+                if text in first_seen:
+                    text = f"(= {first_seen[text]})"
+                    info['deduplicated'] += 1
+                else:
+                    first_seen[text] = str(key)
+            originals[str(key)] = text
+
+        values = dict(originals)
+        limits: Dict[str, int] = {}
+        rendered = ''
+        while values:
+            rendered = json.dumps(values, ensure_ascii=False, separators=(',', ':'))
+            excess = estimate_tokens(rendered) - max_tokens
+            if excess <= 0:
+                break
+            rendered = ''
+            # Größe inkl. JSON-Escapes (\n zählt doppelt), gekürzt wird aber der Rohtext
+            sizes = {key: estimate_tokens(json.dumps(value, ensure_ascii=False)) for key, value in values.items()}
+            largest = max(sizes, key=sizes.get)
+            raw_size = estimate_tokens(values[largest])
+            if raw_size <= self.min_value_tokens:
+                values.popitem()
+                info['dropped'] += 1
+                continue
+            # Immer vom Original kürzen, damit sich keine Marker stapeln
+            target = (sizes[largest] - excess) * raw_size // sizes[largest] - MARKER_TOKENS
+            limits[largest] = max(self.min_value_tokens, min(target, raw_size - 1))
+            values[largest] = truncate_tokens(originals[largest], limits[largest])
+        info['truncated'] = len([key for key in limits if key in values])
+        return rendered, info
+
+
+class PromptPack:
+    """Prompts und Token-Bilanz einer Diskussion (nicht thread-sicher, eine Event-Loop)"""
+
+    def __init__(self, builder: PromptBuilder, task: str, context: Optional[Dict[str, Any]],
+                 render: Optional[Callable[[Dict[str, Any]], str]] = None):
+        self.builder = builder
+        self.task = task
+        self.context = context
+        self._raw_context = (render or _render_json)(context) if context else ''
+        self._packed: Dict[int, Tuple[str, Dict[str, int]]] = {}
+        self._prompts: List[str] = []
+        self._raw_tokens = 0
+        self._sent_tokens = 0
+        self._summarized = 0
+
+    def prompt(self, model: str, instruction: str = '', separator: str = '\n',
+               task_label: str = 'Aufgabe: ', context_label: str = 'Kontext: ') -> str:
+        """
+        Prompt für ein Modell: Aufgabe und Kontext (bei gleichem Budget für alle
+        Modelle identisch) vor der modell-spezifischen Anweisung
+
+        Args:
+            model: Modell-/Agentenname für das Budget
+            instruction: Modell-spezifische Anweisung (Fokusbereich), steht am Ende
+            separator: Trenner zwischen Aufgabe, Kontext und Anweisung
+            task_label / context_label: Präfixe von Aufgabe und Kontext
+        """
+        budget = self.builder.budget_for(model)
+        fixed = (max(estimate_tokens(instruction), self.builder.instruction_tokens)
+                 + estimate_tokens(task_label) + estimate_tokens(context_label))
+        task = truncate_tokens(self.task, max(budget - fixed, self.builder.min_value_tokens))
+
+        parts = [task_label + task]
+        if self.context:
+            packed, _ = self._pack(budget - fixed - estimate_tokens(task))
+            if packed:
+                parts.append(context_label + packed)
+        if instruction:
+            parts.append(instruction)
+        prompt = separator.join(parts)
+
+        raw_parts = [task_label + self.task]
+        if self._raw_context:
+            raw_parts.append(context_label + self._raw_context)
+        if instruction:
+            raw_parts.append(instruction)
+        self._raw_tokens += estimate_tokens(separator.join(raw_parts))
+        self._sent_tokens += estimate_tokens(prompt)
+        self._prompts.append(prompt)
+        return prompt
+
+    def chain(self, text: str, max_tokens: Optional[int] = None) -> str:
+        """Fasst die Antwort eines Agenten zusammen, bevor sie an den nächsten geht"""
+        limit = max_tokens if max_tokens is not None else self.builder.chain_tokens
+        summary = summarize(text, limit)
+        raw, sent = estimate_tokens(text), estimate_tokens(summary)
+        self._raw_tokens += raw
+        self._sent_tokens += sent
+        if sent < raw:
+            self._summarized += 1
+        return summary
+
+    def stats(self) -> Dict[str, int]:
+        """Token-Bilanz: roh (ohne Packing) vs. gesendet, plus gemeinsamer Prompt-Anfang"""
+        info = {'deduplicated': 0, 'truncated': 0, 'dropped': 0}
+        for _, packed_info in self._packed.values():
+            for key in info:
+                info[key] = max(info[key], packed_info[key])
+        shared = os.path.commonprefix(self._prompts) if len(self._prompts) > 1 else ''
+        return {
+            'prompts': len(self._prompts),
+            'raw_tokens': self._raw_tokens,
+            'sent_tokens': self._sent_tokens,
+            'saved_tokens': self._raw_tokens - self._sent_tokens,
+            'shared_prefix_tokens': estimate_tokens(shared),
+            'deduplicated_values': info['deduplicated'],
+            'truncated_values': info['truncated'],
+            'dropped_values': info['dropped'],
+            'summarized_outputs': self._summarized,
+        }
+
+    def _pack(self, max_tokens: int) -> Tuple[str, Dict[str, int]]:
+        if max_tokens not in self._packed:
+            if estimate_tokens(self._raw_context) <= max_tokens:
+                # Passt: unverändert wie ohne Packing
+                self._packed[max_tokens] = self._raw_context, {'deduplicated': 0, 'truncated': 0, 'dropped': 0}
+            else:
+                self._packed[max_tokens] = self.builder.pack_context(self.context, max_tokens)
+        return self._packed[max_tokens]
+
+
+def _render_json(context: Dict[str, Any]) -> str:
+    return json.dumps(context, ensure_ascii=False, default=str)
@@ -0,0 +1,183 @@
+"""
+Resilience - Circuit Breaker und Hedged Requests für Modell-Aufrufe
+
+CircuitBreaker: Nach failure_threshold Fehlern bzw. SLO-Verletzungen in Folge
+wird ein Modell für reset_timeout Sekunden übersprungen (offen). Danach darf
+genau ein Probe-Aufruf durch (halb offen); gelingt er, schließt der Breaker,
+sonst bleibt er weitere reset_timeout Sekunden offen.
+
+LatencyWindow: Perzentile über die letzten Latenzen eines Modells.
+
+hedged(): Startet einen Aufruf; ist er nach `delay` Sekunden (z.B. p95 des
+Modells) nicht fertig, geht ein zweiter gleicher Aufruf raus. Die erste
+erfolgreiche Antwort gewinnt, der andere Aufruf wird abgebrochen.
+
+Breaker und Fenster sind thread-sicher: das Dashboard nutzt eine RoundTable
+aus mehreren Request-Threads mit jeweils eigener Event-Loop.
+
+Verwendung:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    if breaker.allow():
+        try:
+            response, _ = await hedged(lambda: query(model), delay=window.percentile(0.95))
+            breaker.record_success(latency)
+        except Exception:
+            breaker.record_failure()
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Circuit Breaker mit halb offenem Probe-Aufruf (thread-sicher)"""
+
+    def __init__(self,
+                 failure_threshold: int = 3,
+                 reset_timeout: float = 30.0,
+                 latency_slo: Optional[float] = None,
+                 on_change: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            failure_threshold: Fehler/SLO-Verletzungen in Folge bis zum Öffnen
+            reset_timeout: Sekunden, die der Breaker offen bleibt, bevor ein Probe-Aufruf erlaubt ist
+            latency_slo: Optional: Antworten langsamer als dieser Wert (Sekunden) zählen als Fehler
+            on_change: Optional: wird bei jedem Zustandswechsel mit dem neuen Zustand aufgerufen
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latency_slo = latency_slo
+        self.on_change = on_change
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Darf ein Aufruf erfolgen? Im halb offenen Zustand nur ein Probe-Aufruf zur Zeit"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._set_state(HALF_OPEN)
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """Erfolgreicher Aufruf; bei Überschreitung von latency_slo wie ein Fehler gezählt"""
+        if self.latency_slo is not None and latency is not None and latency > self.latency_slo:
+            self.record_failure()
+            return
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != CLOSED:
+                self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        """Fehlgeschlagener (oder zu langsamer) Aufruf"""
+        with self._lock:
+            self.failures += 1
+            probe_failed = self.state == HALF_OPEN
+            self._probing = False
+            if probe_failed or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                if self.state != OPEN:
+                    self._set_state(OPEN)
+
+    def release(self) -> None:
+        """Gibt einen erlaubten Aufruf ohne Ergebnis frei (z.B. abgebrochen durch Early Exit)"""
+        with self._lock:
+            self._probing = False
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        if self.on_change:
+            self.on_change(state)
+
+
+class LatencyWindow:
+    """Latenzen der letzten `size` Aufrufe (thread-sicher)"""
+
+    def __init__(self, size: int = 100):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def samples(self) -> List[float]:
+        """Kopie der Messwerte (älteste zuerst)"""
+        with self._lock:
+            return list(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-Perzentil (0.0-1.0, Nearest-Rank) oder None ohne Messwerte"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(q * len(samples) + 0.5) - 1))
+        return samples[index]
+
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: Optional[float]) -> Tuple[T, Optional[str]]:
+    """
+    Führt call aus und startet nach `delay` Sekunden einen zweiten Aufruf
+
+    Args:
+        call: Erzeugt bei jedem Aufruf eine neue Coroutine (gleiche Anfrage)
+        delay: Wartezeit bis zum zweiten Aufruf; None = kein Hedging
+
+    Returns:
+        (Ergebnis, Gewinner) - Gewinner ist None ohne zweiten Aufruf, sonst 'primary' oder 'hedge'
+
+    Raises:
+        Die Exception des letzten fehlgeschlagenen Aufrufs, wenn beide fehlschlagen
+    """
+    if delay is None:
+        return await call(), None
+
+    primary = asyncio.ensure_future(call())
+    try:
+        return await asyncio.wait_for(asyncio.shield(primary), timeout=delay), None
+    except asyncio.TimeoutError:
+        pass
+    except BaseException:
+        if not primary.done():
+            primary.cancel()
+        raise
+
+    hedge = asyncio.ensure_future(call())
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                if finished.exception() is None:
+                    return finished.result(), 'hedge' if finished is hedge else 'primary'
+                error = finished.exception()
+        raise error
+    finally:
+        for outstanding in pending:
+            outstanding.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
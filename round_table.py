@@ -3,14 +3,21 @@
 Round Table - Multi-AI Model Collaboration System
 Koordiniert verschiedene KI-Modelle für optimale Code-Generierung
 """
+import math
 import os
-import json
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 from datetime import datetime
 
+from model_router import Budget, ModelRouter
+from prompt_builder import PromptPack, PromptBuilder, estimate_tokens
+from metrics import ROUND_TABLE_BREAKER_STATE, ROUND_TABLE_HEDGES, ROUND_TABLE_MODEL_LATENCY
+from resilience import CLOSED, HALF_OPEN, CircuitBreaker, LatencyWindow, hedged
+
+
 
 class AIModel(Enum):
     """Verfügbare KI-Modelle"""
@@ -28,11 +35,15 @@ class AIResponse:
     recommendation: str
     code_suggestion: Optional[str] = None
     confidence: float = 0.0
+    weight: float = 1.0
     timestamp: datetime = None
+    focus_model: Optional[AIModel] = None  # Modell, dessen Fokusbereich beantwortet wurde (bei Ersatz != model)
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        if self.focus_model is None:
+            self.focus_model = self.model
 
 
 @dataclass
@@ -43,11 +54,48 @@ class RoundTableResult:
     individual_responses: List[AIResponse]
     final_recommendation: str
     discussion_summary: str
+    stats: Dict = None
     timestamp: datetime = None
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        if self.stats is None:
+            self.stats = {}
+
+
+class _AgreementTracker:
+    """
+    Inkrementelles Übereinstimmungsmaß über eingehende Antworten
+    
+    Die Modelle beantworten verschiedene Fokusbereiche, ihre Texte überschneiden
+    sich kaum. Gemeinsam ist ihnen die Stimme für den Konsens: das Vertrauen,
+    mit dem jedes Modell seine Empfehlung für die Aufgabe abgibt. Übereinstimmung
+    ist das mit dem Modellgewicht gewichtete mittlere Vertrauen, abgewertet um
+    die Spannweite der Stimmen (ein zögerndes Modell neben einem sicheren
+    bedeutet Uneinigkeit).
+    """
+    
+    def __init__(self):
+        self._votes: List[float] = []
+        self._weighted_votes = 0.0
+        self._weight_total = 0.0
+    
+    def add(self, response: AIResponse) -> float:
+        """Fügt eine Antwort hinzu und gibt die aktuelle Übereinstimmung zurück"""
+        vote = min(max(response.confidence, 0.0), 1.0)
+        self._votes.append(vote)
+        self._weighted_votes += vote * response.weight
+        self._weight_total += response.weight
+        return self.agreement
+    
+    @property
+    def agreement(self) -> float:
+        """Aktuelle Übereinstimmung (0.0-1.0)"""
+        if not self._votes or self._weight_total <= 0:
+            return 0.0
+        spread = max(self._votes) - min(self._votes)
+        return self._weighted_votes / self._weight_total * (1.0 - spread)
 
 
 class RoundTable:
@@ -62,6 +110,18 @@ class RoundTable:
     - Gemini: Performance und Skalierbarkeit
     """
     
+    # Simulierte Empfehlungen (Demo-Modus ohne echte APIs)
+    SIMULATED_RESPONSES = {
+        # Grok - Architektur
+        AIModel.GROK: ("Ich empfehle einen objektorientierten Ansatz mit klaren Schnittstellen und Dependency Injection für bessere Testbarkeit.", 0.85),
+        # Claude - Code-Qualität
+        AIModel.CLAUDE: ("Fokus auf Wartbarkeit: Verwende Type Hints, Docstrings und halte Funktionen klein und fokussiert. SOLID-Prinzipien beachten.", 0.90),
+        # GPT - Best Practices
+        AIModel.GPT: ("Nutze bewährte Design Patterns, dokumentiere gründlich und folge PEP 8 Richtlinien. Füge umfassende Docstrings hinzu.", 0.88),
+        # Gemini - Performance
+        AIModel.GEMINI: ("Denke an Skalierbarkeit: Nutze async/await für I/O-Operationen, implementiere Caching und optimiere Datenstrukturen.", 0.87),
+    }
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialisiert den Runden Tisch
@@ -73,52 +133,214 @@ class RoundTable:
         self.api_keys = self.config.get('api_keys', {})
         self.use_simulation = not any(self.api_keys.values())
         
-        # Modell-Konfigurationen
+        # Simulierte Antwortzeiten pro Modell in Sekunden ({'gpt': 0.5, ...})
+        self.simulated_latency = self.config.get('simulated_latency', {})
+        
+        # Early-Exit Standardwerte
+        self.early_exit_config = {
+            'quorum': 2,
+            'agreement_threshold': 0.75,
+            **self.config.get('early_exit', {})
+        }
+        
+        # Gleitender Mittelwert der beobachteten Latenz pro Modell
+        self.expected_latency: Dict[AIModel, float] = {}
+        
+        # Circuit Breaker pro Modell; latency_slo als Zahl (alle Modelle) oder {'gpt': 5.0, ...}
+        breaker_config = {
+            'failure_threshold': 3,
+            'reset_timeout': 30.0,
+            'latency_slo': None,
+            **self.config.get('circuit_breaker', {})
+        }
+        slo = breaker_config['latency_slo']
+        self.breakers: Dict[AIModel, CircuitBreaker] = {
+            model: CircuitBreaker(
+                failure_threshold=breaker_config['failure_threshold'],
+                reset_timeout=breaker_config['reset_timeout'],
+                latency_slo=slo.get(model.value) if isinstance(slo, dict) else slo,
+                on_change=lambda state, model=model: self._breaker_changed(model, state)
+            )
+            for model in AIModel
+        }
+        
+        # Hedging: zweiter Aufruf nach dem p95 der letzten Latenzen eines Modells
+        self.hedging_config = {
+            'enabled': False,
+            'percentile': 0.95,
+            'min_samples': 20,
+            **self.config.get('hedging', {})
+        }
+        self.latency_windows: Dict[AIModel, LatencyWindow] = {model: LatencyWindow() for model in AIModel}
+        
+        # Routing nach Latenz/Kosten für discuss(budget=...); gespeichert wird nur mit
+        # config['router']['path'] (weitere Schlüssel: prices, percentile, min_samples).
+        # Im Simulations-Modus wird nichts erfasst: simulierte Latenzen sind keine Messwerte
+        self.router = ModelRouter(**self.config.get('router', {}))
+        
+        # Token-Budget pro Modell für Prompts (config['prompts']: max_tokens, model_budgets, ...)
+        self.prompt_builder = PromptBuilder(**self.config.get('prompts', {}))
+        
+        # Modell-Konfigurationen (Reihenfolge = Standard-Reihenfolge am Tisch)
         self.model_configs = {
             AIModel.GROK: {
+                'name': 'Grok',
                 'focus': 'Architektur & Design',
-                'prompt_prefix': 'Als Architektur-Experte, fokussiere dich auf:'
+                'prompt_prefix': 'Als Architektur-Experte, fokussiere dich auf:',
+                'label': 'Architektur',
+                'principle': 'Klare Architektur und Schnittstellen',
+                'summary': 'Objektorientierter Ansatz mit klaren Schnittstellen'
             },
             AIModel.CLAUDE: {
+                'name': 'Claude',
                 'focus': 'Code-Qualität & Wartbarkeit',
-                'prompt_prefix': 'Als Code-Qualitäts-Experte, fokussiere dich auf:'
+                'prompt_prefix': 'Als Code-Qualitäts-Experte, fokussiere dich auf:',
+                'label': 'Qualität',
+                'principle': 'Type Hints und Wartbarkeit',
+                'summary': 'Type Hints, Docstrings und SOLID-Prinzipien'
             },
             AIModel.GPT: {
+                'name': 'GPT',
                 'focus': 'Best Practices & Dokumentation',
-                'prompt_prefix': 'Als Best-Practice-Experte, fokussiere dich auf:'
+                'prompt_prefix': 'Als Best-Practice-Experte, fokussiere dich auf:',
+                'label': 'Best Practices',
+                'principle': 'Dokumentation und Standards',
+                'summary': 'Design Patterns und umfassende Dokumentation'
             },
             AIModel.GEMINI: {
+                'name': 'Gemini',
                 'focus': 'Performance & Skalierbarkeit',
-                'prompt_prefix': 'Als Performance-Experte, fokussiere dich auf:'
+                'prompt_prefix': 'Als Performance-Experte, fokussiere dich auf:',
+                'label': 'Performance',
+                'principle': 'Performance-Optimierungen',
+                'summary': 'Async/await und Caching-Strategien'
             }
         }
     
-    async def discuss(self, task: str, context: Optional[Dict] = None) -> RoundTableResult:
+    async def discuss(self, task: str, context: Optional[Dict] = None,
+                      models: Optional[List] = None,
+                      weights: Optional[Dict] = None,
+                      early_exit: bool = False,
+                      quorum: Optional[int] = None,
+                      agreement_threshold: Optional[float] = None,
+                      hedge: Optional[bool] = None,
+                      budget=None) -> RoundTableResult:
         """
         Startet eine Runden Tisch Diskussion
         
         Args:
             task: Die zu lösende Aufgabe
             context: Zusätzlicher Kontext (Sprache, Projekttyp, etc.)
+            models: Optional: Teilmenge der Modelle (AIModel oder Name wie 'gpt').
+                    Standard: alle Modelle
+            weights: Optional: Gewichtung pro Modell ({AIModel|Name: float}).
+                     Nicht angegebene Modelle erhalten Gewicht 1.0
+            early_exit: Ausstehende Modelle abbrechen, sobald sich die bisherigen
+                        Antworten ausreichend einig sind
+            quorum: Mindestanzahl an Antworten vor einem Early Exit
+                    (Standard aus config['early_exit'], sonst 2)
+            agreement_threshold: Benötigte Übereinstimmung (0.0-1.0) für einen Early Exit
+            hedge: Zweiten Aufruf senden, wenn ein Modell länger als sein p95 braucht
+                   (Standard aus config['hedging']['enabled'])
+            budget: Optional: Budget(latency_s=..., max_cost=...), Dict oder Sekunden.
+                    Zu langsame/teure Modelle werden ersetzt oder weggelassen, nach
+                    latency_s werden ausstehende Modelle abgebrochen. Standard: voller Tisch
             
         Returns:
-            RoundTableResult mit Konsens und Empfehlungen
+            RoundTableResult mit Konsens, Empfehlungen und Statistiken
+            (Latenz, eingesparte Modelle/Tokens, übersprungene/fehlgeschlagene/
+            ersetzte Modelle in result.stats)
+            
+        Raises:
+            ValueError: Bei unbekannten Modellen, ungültigen Gewichten oder ungültigem Budget
+            RuntimeError: Wenn kein Modell geantwortet hat
         """
+        budget = Budget.coerce(budget)
+        requested = self._resolve_models(models)
+        
+        # Modelle mit offenem Circuit Breaker überspringen (außer alle wären übersprungen)
+        available = [model for model in requested if self.breakers[model].allow()]
+        skipped = [model for model in requested if model not in available]
+        if not available:
+            print("⚠️  Alle Circuit Breaker offen - frage trotzdem alle Modelle")
+            available = requested
+            skipped = []
+        
+        # Fokusbereiche auf Modelle im Budget verteilen
+        plan = self.router.plan([m.value for m in requested], [m.value for m in available], budget)
+        substitutes = {AIModel(seat): AIModel(model) for seat, model in plan.substitutions.items()}
+        selected = [AIModel(seat) for seat, _ in plan.assignments]
+        used = {substitutes.get(seat, seat) for seat in selected}
+        for model in available:
+            if model not in used:
+                self.breakers[model].release()
+        model_weights = self._resolve_weights(selected, weights)
+        
+        # Kontext einmal packen, alle Prompts beginnen gleich; Budget nach befragtem Modell
+        pack = self.prompt_builder.prepare(task, context)
+        prompts = {seat: self._build_prompt(seat, pack, substitutes.get(seat, seat)) for seat in selected}
+        
         print(f"\n{'='*70}")
         print(f"🤖 RUNDER TISCH DISKUSSION GESTARTET")
         print(f"{'='*70}")
         print(f"📋 Aufgabe: {task}")
+        print(f"👥 Modelle: {', '.join(self._seat_label(m, substitutes) for m in selected)}")
+        if skipped:
+            print(f"⛔ Übersprungen (Circuit Breaker offen): "
+                  f"{', '.join(self.model_configs[m]['name'] for m in skipped)}")
+        if budget:
+            dropped = [m for m in plan.dropped if AIModel(m) not in skipped]
+            limits = []
+            if budget.latency_s is not None:
+                estimate = plan.estimated_latency_s
+                limits.append(f"{budget.latency_s:g}s (geschätzt "
+                              f"{f'{estimate:.1f}s' if estimate is not None else 'unbekannt'})")
+            if budget.max_cost is not None:
+                limits.append(f"Kosten {budget.max_cost:g} (geschätzt {plan.estimated_cost:.4g})")
+            print(f"💰 Budget: {', '.join(limits)}{' - überschritten' if plan.over_budget else ''}")
+            if dropped:
+                print(f"✂️  Weggelassen (Budget): {', '.join(self.model_configs[AIModel(m)]['name'] for m in dropped)}")
         print(f"{'='*70}\n")
         
-        # Sammle Antworten von allen Modellen
-        responses = []
-        
+        # Sammle Antworten der ausgewählten Modelle (parallel)
         if self.use_simulation:
             # Simulationsmodus (wenn keine API-Keys vorhanden)
-            responses = await self._simulate_discussion(task, context)
+            query = self._simulate_model
         else:
             # Echter API-Modus
-            responses = await self._real_discussion(task, context)
+            print("⚠️  Echter API-Modus noch nicht implementiert - nutze Simulation")
+            query = self._query_model
+        
+        responses, stats = await self._collect_responses(
+            task, context, selected, model_weights, query,
+            early_exit=early_exit,
+            quorum=quorum if quorum is not None else self.early_exit_config['quorum'],
+            agreement_threshold=(agreement_threshold if agreement_threshold is not None
+                                 else self.early_exit_config['agreement_threshold']),
+            hedge=hedge if hedge is not None else self.hedging_config['enabled'],
+            substitutes=substitutes,
+            deadline=budget.latency_s if budget else None,
+            prompts=prompts
+        )
+        stats['skipped_models'] = [m.value for m in skipped]
+        stats['substitutions'] = plan.substitutions
+        stats['dropped_models'] = [m for m in plan.dropped if AIModel(m) not in skipped]
+        stats['budget'] = {
+            'latency_s': budget.latency_s,
+            'max_cost': budget.max_cost,
+            'estimated_latency_s': plan.estimated_latency_s,
+            'estimated_cost': round(plan.estimated_cost, 6),
+            'over_budget': plan.over_budget
+        } if budget else None
+        stats['prompt_tokens'] = pack.stats()
+        print(f"🧮 Prompt-Tokens: {stats['prompt_tokens']['sent_tokens']} gesendet, "
+              f"{stats['prompt_tokens']['saved_tokens']} durch Packing gespart")
+        
+        try:
+            if not self.use_simulation:
+                self.router.save()
+        except OSError as e:
+            print(f"⚠️  Modell-Statistiken nicht gespeichert: {e}")
         
         # Erstelle Konsens
         consensus = self._build_consensus(task, responses, context)
@@ -134,7 +356,8 @@ class RoundTable:
             consensus_code=consensus,
             individual_responses=responses,
             final_recommendation=recommendation,
-            discussion_summary=summary
+            discussion_summary=summary,
+            stats=stats
         )
         
         print(f"\n{'='*70}")
@@ -143,56 +366,310 @@ class RoundTable:
         
         return result
     
-    async def _simulate_discussion(self, task: str, context: Optional[Dict]) -> List[AIResponse]:
-        """Simuliert die Diskussion (Demo-Modus ohne echte APIs)"""
-        responses = []
+    def _resolve_models(self, models: Optional[List]) -> List[AIModel]:
+        """
+        Normalisiert die Modellauswahl
         
-        # Grok - Architektur
-        responses.append(AIResponse(
-            model=AIModel.GROK,
-            focus_area=self.model_configs[AIModel.GROK]['focus'],
-            recommendation="Ich empfehle einen objektorientierten Ansatz mit klaren Schnittstellen und Dependency Injection für bessere Testbarkeit.",
-            confidence=0.85
-        ))
+        Args:
+            models: AIModel-Werte oder deren Namen (z.B. 'gpt'), None = alle
+            
+        Returns:
+            Liste eindeutiger AIModel-Werte in der angegebenen Reihenfolge
+        """
+        if models is None:
+            return list(self.model_configs.keys())
         
-        # Claude - Code-Qualität
-        responses.append(AIResponse(
-            model=AIModel.CLAUDE,
-            focus_area=self.model_configs[AIModel.CLAUDE]['focus'],
-            recommendation="Fokus auf Wartbarkeit: Verwende Type Hints, Docstrings und halte Funktionen klein und fokussiert. SOLID-Prinzipien beachten.",
-            confidence=0.90
-        ))
+        selected: List[AIModel] = []
+        for model in models:
+            if not isinstance(model, AIModel):
+                try:
+                    model = AIModel(str(model).lower())
+                except ValueError:
+                    raise ValueError(f"Unbekanntes Modell: {model}")
+            if model not in selected:
+                selected.append(model)
         
-        # GPT - Best Practices
-        responses.append(AIResponse(
-            model=AIModel.GPT,
-            focus_area=self.model_configs[AIModel.GPT]['focus'],
-            recommendation="Nutze bewährte Design Patterns, dokumentiere gründlich und folge PEP 8 Richtlinien. Füge umfassende Docstrings hinzu.",
-            confidence=0.88
-        ))
+        if not selected:
+            raise ValueError("Mindestens ein Modell muss ausgewählt sein")
         
-        # Gemini - Performance
-        responses.append(AIResponse(
-            model=AIModel.GEMINI,
-            focus_area=self.model_configs[AIModel.GEMINI]['focus'],
-            recommendation="Denke an Skalierbarkeit: Nutze async/await für I/O-Operationen, implementiere Caching und optimiere Datenstrukturen.",
-            confidence=0.87
-        ))
-        
-        # Log der Diskussion
-        for response in responses:
-            print(f"{response.model.value.upper()} ({response.focus_area}):")
-            print(f"  → {response.recommendation}")
-            print(f"  📊 Vertrauen: {response.confidence:.0%}\n")
+        return selected
+    
+    def _resolve_weights(self, models: List[AIModel], weights: Optional[Dict]) -> Dict[AIModel, float]:
+        """
+        Normalisiert die Gewichte der ausgewählten Modelle auf Summe 1.0
+        
+        Args:
+            models: Ausgewählte Modelle
+            weights: Rohgewichte ({AIModel|Name: float}), None = gleichgewichtet
+            
+        Returns:
+            Dictionary {AIModel: normalisiertes Gewicht}
+        """
+        raw = {model: 1.0 for model in models}
+        
+        for key, value in (weights or {}).items():
+            model = key if isinstance(key, AIModel) else self._resolve_models([key])[0]
+            if model not in raw:
+                # Gewichte für nicht ausgewählte Modelle werden ignoriert
+                continue
+            try:
+                weight = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Ungültiges Gewicht für {model.value}: {value!r}")
+            if not math.isfinite(weight):
+                raise ValueError(f"Ungültiges Gewicht für {model.value}: {value!r}")
+            if weight < 0:
+                raise ValueError(f"Gewicht für {model.value} darf nicht negativ sein")
+            raw[model] = weight
+        
+        total = sum(raw.values())
+        if total <= 0:
+            raise ValueError("Summe der Gewichte muss größer als 0 sein")
+        
+        return {model: value / total for model, value in raw.items()}
+    
+    async def _collect_responses(self, task: str, context: Optional[Dict],
+                                 models: List[AIModel], weights: Dict[AIModel, float],
+                                 query: Callable[..., Awaitable[AIResponse]],
+                                 early_exit: bool = False, quorum: int = 2,
+                                 agreement_threshold: float = 0.75,
+                                 hedge: bool = False,
+                                 substitutes: Optional[Dict[AIModel, AIModel]] = None,
+                                 deadline: Optional[float] = None,
+                                 prompts: Optional[Dict[AIModel, str]] = None) -> Tuple[List[AIResponse], Dict]:
+        """
+        Befragt alle Modelle parallel und sammelt die Antworten in Eingangsreihenfolge
+        
+        Im Early-Exit Modus wird nach jeder Antwort die Übereinstimmung
+        inkrementell aktualisiert. Sind Quorum und Schwelle erreicht, werden
+        die ausstehenden Modell-Aufrufe abgebrochen. Fehlgeschlagene Modelle
+        fehlen im Ergebnis (und zählen für ihren Circuit Breaker).
+        
+        models sind die Plätze (Fokusbereiche); substitutes ordnet einem Platz ein
+        anderes befragtes Modell zu. Nach deadline Sekunden werden ausstehende
+        Modelle abgebrochen, sobald mindestens eine Antwort vorliegt. prompts enthält
+        die gepackten Prompts pro Platz (Standard: ohne gemeinsames Packing gebaut).
+        
+        Returns:
+            Tuple (Antworten, Statistiken)
+            
+        Raises:
+            RuntimeError: Wenn kein Modell geantwortet hat
+        """
+        started = time.monotonic()
+        substitutes = substitutes or {}
+        if prompts is None:
+            pack = self.prompt_builder.prepare(task, context)
+            prompts = {model: self._build_prompt(model, pack, substitutes.get(model, model)) for model in models}
+        tasks = {
+            asyncio.ensure_future(
+                self._timed_query(query, substitutes.get(model, model), task, context, hedge,
+                                  focus_model=model, prompt=prompts[model])
+            ): model
+            for model in models
+        }
+        pending = set(tasks)
+        tracker = _AgreementTracker()
+        responses: List[AIResponse] = []
+        failed: List[AIModel] = []
+        hedges: Dict[str, str] = {}
+        latencies: Dict[str, float] = {}
+        agreement = 0.0
+        exited_early = False
+        deadline_hit = False
+        
+        try:
+            while pending:
+                timeout = None
+                if deadline is not None and responses:
+                    timeout = max(0.0, started + deadline - time.monotonic())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    deadline_hit = True
+                    break
+                # Gleichzeitig fertige Antworten in Tisch-Reihenfolge verarbeiten
+                for finished in sorted(done, key=lambda t: models.index(tasks[t])):
+                    response, latency, winner = finished.result()
+                    if winner:
+                        hedges[tasks[finished].value] = winner
+                    if response is None:
+                        failed.append(tasks[finished])
+                        continue
+                    response.weight = weights[response.focus_model]
+                    latencies[response.focus_model.value] = latency
+                    self._record_latency(response.model, latency)
+                    agreement = tracker.add(response)
+                    responses.append(response)
+                    self._log_response(response)
+                
+                if (early_exit and pending and len(responses) >= max(quorum, 1)
+                        and agreement >= agreement_threshold):
+                    exited_early = True
+                    break
+        finally:
+            for outstanding in pending:
+                outstanding.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if not responses:
+            raise RuntimeError(f"Kein Modell hat geantwortet ({', '.join(m.value for m in failed)})")
         
-        return responses
+        elapsed = time.monotonic() - started
+        cancelled = [tasks[t] for t in pending]
+        if deadline_hit:
+            # Abgebrochen wegen Budget: mindestens so langsam, für die nächste Planung merken
+            for model in cancelled:
+                if not self.use_simulation:
+                    self.router.record(substitutes.get(model, model).value, elapsed)
+            print(f"⏱️  Budget von {deadline:.1f}s erreicht - abgebrochen: "
+                  f"{', '.join(self.model_configs[m]['name'] for m in cancelled)}\n")
+        
+        # Eingesparte Latenz: erwartete Dauer der langsamsten abgebrochenen Modelle
+        executors = [substitutes.get(m, m) for m in cancelled]
+        estimates = [self.expected_latency[m] for m in executors if m in self.expected_latency]
+        latency_saved = max(0.0, max(estimates) - elapsed) if estimates else 0.0
+        
+        # Eingesparte Tokens: Durchschnitt der beantworteten Aufrufe pro abgebrochenem Modell
+        tokens_used = sum(
+            estimate_tokens(prompts[r.focus_model]) + estimate_tokens(r.recommendation)
+            for r in responses
+        )
+        tokens_saved = round(tokens_used / len(responses) * len(cancelled)) if responses else 0
+        
+        if exited_early:
+            print(f"⚡ Early Exit: Übereinstimmung {agreement:.0%} nach {len(responses)} Antworten - "
+                  f"abgebrochen: {', '.join(self.model_configs[m]['name'] for m in cancelled)}\n")
+        
+        stats = {
+            'models_requested': [m.value for m in models],
+            'models_answered': [r.model.value for r in responses],
+            'cancelled_models': [m.value for m in cancelled],
+            'failed_models': [m.value for m in failed],
+            'hedges': hedges,
+            'early_exit': exited_early,
+            'deadline_exceeded': deadline_hit,
+            'agreement': round(agreement, 4),
+            'elapsed_s': round(elapsed, 4),
+            'model_latencies_s': {k: round(v, 4) for k, v in latencies.items()},
+            'latency_saved_s': round(latency_saved, 4),
+            'tokens_used': tokens_used,
+            'tokens_saved': tokens_saved
+        }
+        return responses, stats
     
-    async def _real_discussion(self, task: str, context: Optional[Dict]) -> List[AIResponse]:
-        """Führt echte API-Calls zu den KI-Modellen durch"""
+    async def _timed_query(self, query: Callable[..., Awaitable[AIResponse]], model: AIModel,
+                           task: str, context: Optional[Dict],
+                           hedge: bool = False,
+                           focus_model: Optional[AIModel] = None,
+                           prompt: Optional[str] = None) -> Tuple[Optional[AIResponse], float, Optional[str]]:
+        """
+        Führt einen Modell-Aufruf aus (ggf. gehedgt) und misst seine Dauer
+        
+        Args:
+            focus_model: Platz, dessen Fokusbereich model übernimmt (Standard: model selbst)
+            prompt: Gesendeter Prompt, für die Token-Statistik des Routers
+        
+        Returns:
+            Tuple (Antwort oder None bei Fehler, Dauer, Hedge-Gewinner oder None)
+        """
+        focus_model = focus_model or model
+        breaker = self.breakers[model]
+        delay = self._hedge_delay(model) if hedge else None
+        started = time.monotonic()
+        try:
+            response, winner = await hedged(lambda: query(model, task, context, focus_model), delay)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            if not self.use_simulation:
+                self.router.record(model.value, time.monotonic() - started, ok=False)
+            print(f"❌ {model.value.upper()} fehlgeschlagen: {e}\n")
+            return None, time.monotonic() - started, None
+        
+        latency = time.monotonic() - started
+        breaker.record_success(latency)
+        if not self.use_simulation:
+            self.router.record(
+                model.value, latency,
+                tokens=estimate_tokens(prompt) + estimate_tokens(response.recommendation) if prompt else None
+            )
+        if winner:
+            ROUND_TABLE_HEDGES.inc(model=model.value, winner=winner)
+        return response, latency, winner
+    
+    def _hedge_delay(self, model: AIModel) -> Optional[float]:
+        """Wartezeit bis zum zweiten Aufruf (p95) oder None, solange zu wenige Messwerte vorliegen"""
+        window = self.latency_windows[model]
+        if len(window) < self.hedging_config['min_samples']:
+            return None
+        return window.percentile(self.hedging_config['percentile'])
+    
+    def _seat_label(self, model: AIModel, substitutes: Dict[AIModel, AIModel]) -> str:
+        """Name eines Platzes, bei Ersatz mit dem befragten Modell (z.B. 'Grok → Gemini')"""
+        name = self.model_configs[model]['name']
+        if model in substitutes:
+            name += f" → {self.model_configs[substitutes[model]]['name']}"
+        return name
+    
+    def _breaker_changed(self, model: AIModel, state: str) -> None:
+        """Meldet Zustandswechsel eines Circuit Breakers"""
+        ROUND_TABLE_BREAKER_STATE.set({CLOSED: 0, HALF_OPEN: 1}.get(state, 2), model=model.value)
+        print(f"🔌 Circuit Breaker {self.model_configs[model]['name']}: {state}")
+    
+    def _record_latency(self, model: AIModel, latency: float, alpha: float = 0.3) -> None:
+        """Aktualisiert den gleitenden Latenz-Mittelwert eines Modells"""
+        ROUND_TABLE_MODEL_LATENCY.observe(latency, model=model.value)
+        self.latency_windows[model].add(latency)
+        previous = self.expected_latency.get(model)
+        if previous is None:
+            self.expected_latency[model] = latency
+        else:
+            self.expected_latency[model] = alpha * latency + (1 - alpha) * previous
+    
+    def _build_prompt(self, model: AIModel, pack: PromptPack, recipient: Optional[AIModel] = None) -> str:
+        """
+        Erstellt den Prompt für einen Platz: Aufgabe und gepackter Kontext, danach der Fokusbereich
+        
+        Args:
+            model: Platz (Fokusbereich)
+            pack: PromptPack der Diskussion
+            recipient: Befragtes Modell, bestimmt das Token-Budget (Standard: model)
+        """
+        config = self.model_configs[model]
+        return pack.prompt((recipient or model).value, f"{config['prompt_prefix']} {config['focus']}")
+    
+    def _log_response(self, response: AIResponse) -> None:
+        """Gibt eine einzelne Modell-Antwort aus"""
+        print(f"{response.model.value.upper()} ({response.focus_area}):")
+        print(f"  → {response.recommendation}")
+        print(f"  📊 Vertrauen: {response.confidence:.0%}\n")
+    
+    async def _simulate_model(self, model: AIModel, task: str, context: Optional[Dict],
+                              focus_model: Optional[AIModel] = None) -> AIResponse:
+        """Simuliert die Antwort eines Modells (Demo-Modus ohne echte APIs)"""
+        focus_model = focus_model or model
+        delay = self.simulated_latency.get(model.value, 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        
+        recommendation, confidence = self.SIMULATED_RESPONSES[focus_model]
+        return AIResponse(
+            model=model,
+            focus_area=self.model_configs[focus_model]['focus'],
+            recommendation=recommendation,
+            confidence=confidence,
+            focus_model=focus_model
+        )
+    
+    async def _query_model(self, model: AIModel, task: str, context: Optional[Dict],
+                           focus_model: Optional[AIModel] = None) -> AIResponse:
+        """Führt einen echten API-Call zu einem KI-Modell durch (Prompt aus dem Fokus von focus_model)"""
         # TODO: Implementiere echte API-Calls
         # Placeholder: Für jetzt nutzen wir die Simulation
-        print("⚠️  Echter API-Modus noch nicht implementiert - nutze Simulation")
-        return await self._simulate_discussion(task, context)
+        return await self._simulate_model(model, task, context, focus_model)
     
     def _build_consensus(self, task: str, responses: List[AIResponse], context: Optional[Dict]) -> str:
         """Erstellt Konsens-Code aus allen Empfehlungen"""
@@ -217,14 +694,22 @@ class RoundTable:
         """Generiert Python-Code basierend auf Konsens"""
         module_name = class_name.lower()
         
+        # Gewichtigste Stimmen zuerst
+        ranked = sorted(responses, key=lambda r: r.weight, reverse=True)
+        contributions = '\n'.join(
+            f"- {self.model_configs[r.model]['name']}: {r.recommendation[:60]}..."
+            for r in ranked
+        )
+        principles = '\n'.join(
+            f"    - {self.model_configs[r.focus_model]['principle']} ({self.model_configs[r.model]['name']})"
+            for r in ranked
+        )
+        
         code = f'''"""
 {task}
 
 Dieser Code wurde vom Runden Tisch generiert und vereint:
-- Grok: {responses[0].recommendation[:60]}...
-- Claude: {responses[1].recommendation[:60]}...
-- GPT: {responses[2].recommendation[:60]}...
-- Gemini: {responses[3].recommendation[:60]}...
+{contributions}
 """
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -244,11 +729,8 @@ class {class_name}:
     """
     {task}
     
-    Diese Klasse folgt Best Practices aller KI-Modelle:
-    - Klare Architektur und Schnittstellen (Grok)
-    - Type Hints und Wartbarkeit (Claude)
-    - Dokumentation und Standards (GPT)
-    - Performance-Optimierungen (Gemini)
+    Diese Klasse folgt Best Practices aller beteiligten KI-Modelle:
+{principles}
     """
     
     def __init__(self, config: Optional[{class_name}Config] = None):
@@ -585,19 +1067,24 @@ class {class_name} {{
     
     def _create_recommendation(self, responses: List[AIResponse]) -> str:
         """Erstellt finale Empfehlung"""
-        avg_confidence = sum(r.confidence for r in responses) / len(responses)
+        total_weight = sum(r.weight for r in responses) or 1.0
+        avg_confidence = sum(r.confidence * r.weight for r in responses) / total_weight
+        
+        ranked = sorted(responses, key=lambda r: r.weight, reverse=True)
+        expertise = '\n'.join(
+            f"✅ {self.model_configs[r.focus_model]['label']} ({self.model_configs[r.model]['name']}): "
+            f"{self.model_configs[r.focus_model]['summary']} (Gewicht {r.weight:.0%})"
+            for r in ranked
+        )
         
         recommendation = f"""
 📝 FINALE EMPFEHLUNG DES RUNDEN TISCHES
 
-Der Konsens-Code vereint die Expertise aller {len(responses)} KI-Modelle:
+Der Konsens-Code vereint die Expertise aller {len(responses)} beteiligten KI-Modelle:
 
-✅ Architektur (Grok): Objektorientierter Ansatz mit klaren Schnittstellen
-✅ Qualität (Claude): Type Hints, Docstrings und SOLID-Prinzipien  
-✅ Best Practices (GPT): Design Patterns und umfassende Dokumentation
-✅ Performance (Gemini): Async/await und Caching-Strategien
+{expertise}
 
-📊 Durchschnittliches Vertrauen: {avg_confidence:.0%}
+📊 Gewichtetes Vertrauen: {avg_confidence:.0%}
 
 🔄 NÄCHSTE SCHRITTE:
 1. Code reviewen und anpassen
@@ -635,14 +1122,3 @@ Der Konsens-Code vereint die Expertise aller {len(responses)} KI-Modelle:
 """
         return output
 
-
-# -- Start injected by Copilot: forward to roundtable_safe if available --
-try:
-    # try absolute import
-    from roundtable_safe import RoundTable as _RoundTableSafe  # type: ignore
-    RoundTable = _RoundTableSafe
-    __all__ = ["RoundTable"]
-except Exception:
-    # If import fails, keep existing implementation in this file
-    pass
-# -- End injected block --
@@ -4,16 +4,20 @@ Round Table CLI - Direkter Zugriff auf den Runden Tisch
 """
 import argparse
 import sys
-import asyncio
+from typing import TYPE_CHECKING, Optional
 from colorama import init, Fore, Style
-from round_table import RoundTable
+
+# round_table (inkl. roundtable_safe und Sandbox) und asyncio werden erst nach dem
+# Parsen der Argumente importiert, damit --help sofort antwortet
+if TYPE_CHECKING:
+    from round_table import RoundTable
 
 # Initialisiere Colorama
 init(autoreset=True)
 
 
-async def main():
-    """Hauptfunktion für Round Table CLI"""
+def build_parser() -> argparse.ArgumentParser:
+    """Erstellt den Argument-Parser der Round Table CLI"""
     parser = argparse.ArgumentParser(
         description='Round Table - Multi-AI Kollaborations-System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -61,9 +65,26 @@ Beispiele:
         help='Interaktiver Modus'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Parst die Argumente; ohne Aufgabe (und ohne -i) wird die Hilfe gezeigt"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.interactive and not args.task:
+        parser.print_help()
+        sys.exit(1)
+    return args
+
+
+async def main(args: Optional[argparse.Namespace] = None):
+    """Hauptfunktion für Round Table CLI"""
+    if args is None:
+        args = parse_args()
     
     # Initialisiere Round Table
+    from round_table import RoundTable
     round_table = RoundTable()
     
     # Interaktiver Modus
@@ -71,11 +92,6 @@ Beispiele:
         await interactive_mode(round_table)
         return
     
-    # Prüfe ob Task angegeben wurde
-    if not args.task:
-        parser.print_help()
-        sys.exit(1)
-    
     # Starte Diskussion
     context = {
         'language': args.language,
@@ -110,7 +126,7 @@ Beispiele:
         print(f"{Fore.GREEN}✅ Dokumentation gespeichert in: {doc_file}")
 
 
-async def interactive_mode(round_table: RoundTable):
+async def interactive_mode(round_table: 'RoundTable'):
     """Interaktiver Modus für Round Table"""
     print(f"{Fore.CYAN}{'='*70}")
     print(f"{Fore.CYAN}🤖 Round Table - Interaktiver Modus")
@@ -179,8 +195,10 @@ async def interactive_mode(round_table: RoundTable):
 
 
 if __name__ == '__main__':
+    cli_args = parse_args()
+    import asyncio
     try:
-        asyncio.run(main())
+        asyncio.run(main(cli_args))
     except KeyboardInterrupt:
         print(f"\n{Fore.CYAN}Auf Wiedersehen! 👋")
         sys.exit(0)
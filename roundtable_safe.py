@@ -7,18 +7,188 @@ API-Kompatibilität:
         - consensus_code: str
         - individual_responses: list of SimpleNamespace (mit model.value und recommendation)
         - raw_responses: dict (Agent-Antworten)
+        - critical_path: list (Agenten-Kette, die die Gesamtdauer bestimmt)
 - RoundTable.format_result(result) -> str
 """
 import asyncio
 import ast
-from types import MethodType, SimpleNamespace
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import CodeType, MethodType, SimpleNamespace
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from extension_sandbox import ExtensionSandboxPool, SandboxResult, get_default_pool
+from metrics import ROUND_TABLE_MODEL_LATENCY, counter, gauge
+from prompt_builder import PromptBuilder, PromptPack
+
+
+# AST-Knoten, die in Erweiterungen nicht vorkommen dürfen
+BANNED_NODES = frozenset({
+    ast.Import,
+    ast.ImportFrom,
+    ast.Attribute,
+    ast.Subscript,
+    ast.Assign,
+    ast.AugAssign,
+    ast.Global,
+    ast.Nonlocal,
+    ast.ClassDef,
+    ast.Lambda,
+    ast.AsyncFunctionDef,
+    ast.While,
+    ast.For,
+    ast.Try,
+    ast.With,
+    ast.Raise,
+    ast.Delete,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+})
+
+
+class ExtensionRejected(Exception):
+    """Wird vom Validator bei der ersten unzulässigen Konstruktion ausgelöst."""
+
+
+class ExtensionValidator(ast.NodeVisitor):
+    """
+    Validiert den Körper einer Erweiterung in einem einzigen Durchlauf.
+    Bricht beim ersten verbotenen Knoten mit ExtensionRejected ab.
+    """
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if type(node) in BANNED_NODES:
+            raise ExtensionRejected(f"Verbotener AST-Knoten: {node.__class__.__name__}")
+        super().generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not isinstance(node.func, ast.Name):
+            raise ExtensionRejected("Nur direkte Funktionsnamen-Aufrufe (z.B. print()) erlaubt.")
+        if node.func.id != "print":
+            raise ExtensionRejected(f"Nur print() erlaubt, gefunden: {node.func.id}")
+        self.generic_visit(node)
+
+
+class CachedExtension(NamedTuple):
+    """Validierungsergebnis eines Snippets: Urteil, Name/Fehler und kompilierter Code."""
+    ok: bool
+    message: str
+    code: Optional[CodeType]
+
+
+class ExtensionCache:
+    """
+    Thread-sicherer LRU-Cache für validierte Erweiterungen, Schlüssel ist der
+    SHA-256-Hash des Quelltexts. Speichert auch negative Urteile, damit
+    wiederholt abgelehnte Snippets nicht erneut geparst werden.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedExtension]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(code_snippet: str) -> str:
+        return hashlib.sha256(code_snippet.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedExtension]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedExtension) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def compile_extension(code_snippet: str) -> CachedExtension:
+    """
+    Sehr konservative Validierung und Kompilierung einer einzelnen FunctionDef.
+    Erlaubt nur: eine def-Funktion, keine Imports, keine Zuweisungen, nur print()-Aufrufe.
+    """
+    try:
+        parsed = ast.parse(code_snippet)
+    except SyntaxError as se:
+        return CachedExtension(False, f"SyntaxError: {se}", None)
+
+    if len(parsed.body) != 1 or not isinstance(parsed.body[0], ast.FunctionDef):
+        return CachedExtension(False, "Code muss genau eine FunctionDef enthalten.", None)
+
+    func_def = parsed.body[0]
+    try:
+        ExtensionValidator().visit(func_def)
+    except ExtensionRejected as e:
+        return CachedExtension(False, str(e), None)
+
+    try:
+        compiled = compile(parsed, filename="<safe_ext>", mode="exec")
+    except Exception as e:
+        return CachedExtension(False, f"Fehler beim Kompilieren: {e}", None)
+
+    return CachedExtension(True, func_def.name, compiled)
+
+
+# Prozessweiter Cache, geteilt von allen RoundTable-Instanzen
+extension_cache = ExtensionCache()
+
+# Cache-Statistiken werden erst beim Scrapen gelesen
+counter("autocoder_extension_cache_hits_total", "Treffer im Erweiterungs-Cache").set_function(
+    lambda: extension_cache.hits)
+counter("autocoder_extension_cache_misses_total", "Fehlgriffe im Erweiterungs-Cache").set_function(
+    lambda: extension_cache.misses)
+gauge("autocoder_extension_cache_hit_ratio", "Trefferquote des Erweiterungs-Caches").set_function(
+    lambda: extension_cache.info()["hit_ratio"])
+
+
+# Platzhalter in Agent.inputs für den ursprünglichen Prompt
+PROMPT = "prompt"
 
 
 class Agent:
-    def __init__(self, name: str, role: str) -> None:
+    def __init__(self, name: str, role: str, inputs: Tuple[str, ...] = (PROMPT,)) -> None:
+        """
+        inputs: Namen der Agenten, deren Antworten dieser Agent benötigt,
+                oder PROMPT für die ursprüngliche Aufgabe
+        """
         self.name = name
         self.role = role
+        self.inputs = tuple(inputs)
+
+    async def arespond(self, input_data: str) -> str:
+        """Asynchrone Variante von respond(); läuft in einem Thread, um den Loop nicht zu blockieren."""
+        return await asyncio.to_thread(self.respond, input_data)
 
     def respond(self, input_data: str) -> str:
         if self.role == "analysis":
@@ -37,39 +207,48 @@ class Agent:
 
 
 class RoundTable:
-    def __init__(self) -> None:
+    def __init__(self, sandbox: Optional[ExtensionSandboxPool] = None, use_sandbox: bool = True,
+                 prompt_builder: Optional[PromptBuilder] = None) -> None:
+        """
+        sandbox: eigener Worker-Pool für Erweiterungen (Standard: prozessweiter Pool)
+        use_sandbox: False führt Erweiterungen wie früher im eigenen Prozess aus
+        prompt_builder: Token-Budgets für Prompt und weitergereichte Antworten
+        """
+        # Abhängigkeitsgraph: jeder Agent listet seine Eingaben.
+        # Kreativ und Tech bauen beide nur auf der Analyse auf und laufen parallel;
+        # Security prüft beide, Eingaben werden in der hier deklarierten Reihenfolge
+        # zusammengeführt (Ergebnis unabhängig davon, wer zuerst fertig ist).
         self.agents: List[Agent] = [
-            Agent("Analysis-KI", "analysis"),
-            Agent("Kreativ-KI", "creative"),
-            Agent("Tech-KI", "tech"),
-            Agent("Security-KI", "security"),
+            Agent("Analysis-KI", "analysis", inputs=(PROMPT,)),
+            Agent("Kreativ-KI", "creative", inputs=("Analysis-KI",)),
+            Agent("Tech-KI", "tech", inputs=("Analysis-KI",)),
+            Agent("Security-KI", "security", inputs=("Kreativ-KI", "Tech-KI")),
         ]
-        # Gebundene Erweiterungsfunktionen
+        # Gebundene Erweiterungsfunktionen und deren kompilierter Code
         self.extensions: Dict[str, Any] = {}
+        self._extension_code: Dict[str, CodeType] = {}
+        self.sandbox = sandbox
+        self.use_sandbox = use_sandbox
+        self.prompt_builder = prompt_builder or PromptBuilder()
 
     async def discuss(self, task: str, context: Optional[Dict[str, Any]] = None) -> SimpleNamespace:
         """
-        Führt die Diskussionskette aus und liefert ein Ergebnisobjekt zurück.
+        Führt den Agenten-Graphen aus und liefert ein Ergebnisobjekt zurück.
         Minimal kompatibel zu demo_round_table.py (consensus_code, individual_responses).
+        Unabhängige Agenten laufen parallel; critical_path nennt die Agentenkette,
+        die die Gesamtdauer bestimmt hat. Zu großer Kontext und weitergereichte
+        Antworten werden auf das Token-Budget gepackt (Bilanz in prompt_tokens).
         """
-        # Context kann genutzt werden, hier nur als Info weitergegeben
-        prompt = task
-        if context:
-            prompt = f"{task} | context: {context}"
-
-        responses: Dict[str, str] = {}
-        current_input = prompt
-        for agent in self.agents:
-            try:
-                resp = agent.respond(current_input)
-            except Exception as e:
-                resp = f"Error in agent.respond: {e}"
-            responses[agent.name] = resp
-            current_input = resp  # chaining
+        pack = self.prompt_builder.prepare(task, context, render=str)
+        responses, timings = await self._run_agents(pack)
+        for name, (start, end) in timings.items():
+            ROUND_TABLE_MODEL_LATENCY.observe(end - start, model=name)
+        critical_path = self._critical_path(timings)
 
         # Versuche Self-Extension (sicherheitshalber eingeschränkt)
         tech_response = responses.get("Tech-KI", "")
         consensus_code = ""
+        extension_result: Optional[SandboxResult] = None
         if "Generating code extension:" in tech_response:
             code_snippet = tech_response.split("Generating code extension:", 1)[1].strip()
             # Versuche das Snippet sicher zu validieren + zu laden
@@ -77,13 +256,8 @@ class RoundTable:
             if ok:
                 func_name = result
                 consensus_code = code_snippet
-                # Rufe gebundene Funktion demonstrativ auf (nur print erlaubt)
-                try:
-                    fn = self.extensions.get(func_name)
-                    if callable(fn):
-                        fn()  # bound method
-                except Exception:
-                    pass
+                # Rufe Funktion demonstrativ auf (nur print erlaubt), isoliert im Worker-Pool
+                extension_result = await self._run_extension(func_name)
 
         # Baue individual_responses so auf, dass demo_round_table.py damit arbeiten kann
         individual_responses: List[SimpleNamespace] = []
@@ -98,9 +272,110 @@ class RoundTable:
             consensus_code=consensus_code,
             individual_responses=individual_responses,
             raw_responses=responses,
+            critical_path=[name for name, _ in critical_path],
+            critical_path_s=critical_path[-1][1] if critical_path else 0.0,
+            agent_timings={name: {"start": start, "end": end} for name, (start, end) in timings.items()},
+            extension_result=extension_result,
+            prompt_tokens=pack.stats(),
         )
         return result_obj
 
+    def _agent_order(self) -> List[Agent]:
+        """Topologische Reihenfolge der Agenten; prüft auf unbekannte Eingaben und Zyklen."""
+        by_name = {agent.name: agent for agent in self.agents}
+        for agent in self.agents:
+            for dep in agent.inputs:
+                if dep != PROMPT and dep not in by_name:
+                    raise ValueError(f"Unbekannte Eingabe '{dep}' für Agent {agent.name}")
+
+        order: List[Agent] = []
+        state: Dict[str, int] = {}  # 1 = in Bearbeitung, 2 = fertig
+
+        def visit(agent: Agent) -> None:
+            if state.get(agent.name) == 2:
+                return
+            if state.get(agent.name) == 1:
+                raise ValueError(f"Zyklische Abhängigkeit bei Agent {agent.name}")
+            state[agent.name] = 1
+            for dep in agent.inputs:
+                if dep != PROMPT:
+                    visit(by_name[dep])
+            state[agent.name] = 2
+            order.append(agent)
+
+        for agent in self.agents:
+            visit(agent)
+        return order
+
+    async def _run_agents(self, pack: PromptPack) -> Tuple[Dict[str, str], Dict[str, Tuple[float, float]]]:
+        """
+        Führt alle Agenten aus. Jeder Agent startet, sobald seine Eingaben vorliegen.
+        Der Prompt kommt gepackt aus pack, Antworten anderer Agenten zusammengefasst.
+        Rückgabe: (Antworten je Agent, (Start, Ende) je Agent in Sekunden ab Beginn)
+        """
+        started = time.monotonic()
+        tasks: Dict[str, "asyncio.Task[str]"] = {}
+        timings: Dict[str, Tuple[float, float]] = {}
+
+        async def run(agent: Agent) -> str:
+            inputs = [
+                pack.prompt(agent.name, separator=" | ", task_label="", context_label="context: ")
+                if dep == PROMPT else pack.chain(await tasks[dep])
+                for dep in agent.inputs
+            ]
+            begin = time.monotonic() - started
+            try:
+                resp = await agent.arespond(" | ".join(inputs))
+            except Exception as e:
+                resp = f"Error in agent.respond: {e}"
+            timings[agent.name] = (begin, time.monotonic() - started)
+            return resp
+
+        for agent in self._agent_order():
+            tasks[agent.name] = asyncio.ensure_future(run(agent))
+        await asyncio.gather(*tasks.values())
+
+        responses = {agent.name: tasks[agent.name].result() for agent in self.agents}
+        return responses, timings
+
+    def _critical_path(self, timings: Dict[str, Tuple[float, float]]) -> List[Tuple[str, float]]:
+        """Verfolgt vom zuletzt fertigen Agenten jeweils die zuletzt fertige Eingabe zurück."""
+        if not timings:
+            return []
+        by_name = {agent.name: agent for agent in self.agents}
+        current: Optional[str] = max(timings, key=lambda name: timings[name][1])
+        path: List[Tuple[str, float]] = []
+        while current is not None:
+            path.append((current, timings[current][1]))
+            upstream = [dep for dep in by_name[current].inputs if dep != PROMPT]
+            current = max(upstream, key=lambda name: timings[name][1]) if upstream else None
+        path.reverse()
+        return path
+
+    async def _run_extension(self, func_name: str) -> Optional[SandboxResult]:
+        """
+        Führt eine geladene Erweiterung in einem Sandbox-Worker aus, ohne den
+        Event Loop zu blockieren. Ohne Sandbox (z.B. Windows oder use_sandbox=False)
+        wird die gebundene Funktion wie bisher direkt aufgerufen.
+        """
+        pool = self.sandbox
+        if pool is None and self.use_sandbox:
+            pool = get_default_pool()
+
+        if pool is None:
+            try:
+                fn = self.extensions.get(func_name)
+                if callable(fn):
+                    fn()  # bound method
+            except Exception:
+                pass
+            return None
+
+        result = await pool.run(self._extension_code[func_name], func_name)
+        if result.output:
+            print(result.output, end="")
+        return result
+
     def format_result(self, result: SimpleNamespace) -> str:
         """Einfache Formatierhilfe, erzeugt eine lesbare Zusammenfassung."""
         lines: List[str] = []
@@ -111,6 +386,9 @@ class RoundTable:
         lines.append("- Einzelantworten:")
         for resp in result.individual_responses:
             lines.append(f"  • {resp.model.value.upper()}: {resp.recommendation}")
+        if getattr(result, "critical_path", None):
+            lines.append(f"- Kritischer Pfad: {' → '.join(result.critical_path)} "
+                         f"({result.critical_path_s * 1000:.1f} ms)")
         return "\n".join(lines)
 
     def _validate_and_load_extension(self, code_snippet: str) -> Tuple[bool, str]:
@@ -118,59 +396,24 @@ class RoundTable:
         Sehr konservative Validierung und Laden einer einzelnen FunctionDef.
         Erlaubt nur: eine def-Funktion, keine Imports, keine Zuweisungen, nur print()-Aufrufe.
         Bei Erfolg: bindet die Funktion an self und speichert sie unter ihrem Namen.
+        Urteil und kompilierter Code werden im extension_cache wiederverwendet.
         Rückgabe:
           (True, func_name) oder (False, error_message)
         """
-        try:
-            parsed = ast.parse(code_snippet)
-        except SyntaxError as se:
-            return False, f"SyntaxError: {se}"
-
-        if len(parsed.body) != 1 or not isinstance(parsed.body[0], ast.FunctionDef):
-            return False, "Code muss genau eine FunctionDef enthalten."
-
-        func_def = parsed.body[0]
-        func_name = func_def.name
-
-        banned_nodes = (
-            ast.Import,
-            ast.ImportFrom,
-            ast.Attribute,
-            ast.Subscript,
-            ast.Assign,
-            ast.AugAssign,
-            ast.Global,
-            ast.Nonlocal,
-            ast.ClassDef,
-            ast.Lambda,
-            ast.AsyncFunctionDef,
-            ast.While,
-            ast.For,
-            ast.Try,
-            ast.With,
-            ast.Raise,
-            ast.Delete,
-            ast.ListComp,
-            ast.SetComp,
-            ast.DictComp,
-            ast.GeneratorExp,
-        )
+        key = ExtensionCache.key_for(code_snippet)
+        entry = extension_cache.get(key)
+        if entry is None:
+            entry = compile_extension(code_snippet)
+            extension_cache.put(key, entry)
 
-        for node in ast.walk(func_def):
-            if isinstance(node, banned_nodes):
-                return False, f"Verbotener AST-Knoten: {node.__class__.__name__}"
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id != "print":
-                        return False, f"Nur print() erlaubt, gefunden: {node.func.id}"
-                else:
-                    return False, "Nur direkte Funktionsnamen-Aufrufe (z.B. print()) erlaubt."
+        if not entry.ok:
+            return False, entry.message
 
+        func_name = entry.message
         safe_globals: Dict[str, Any] = {"__builtins__": {}, "print": print}
         local_ns: Dict[str, Any] = {}
         try:
-            compiled = compile(parsed, filename="<safe_ext>", mode="exec")
-            exec(compiled, safe_globals, local_ns)
+            exec(entry.code, safe_globals, local_ns)
         except Exception as e:
             return False, f"Fehler beim Ausführen: {e}"
 
@@ -180,6 +423,7 @@ class RoundTable:
 
         bound = MethodType(func_obj, self)
         self.extensions[func_name] = bound
+        self._extension_code[func_name] = entry.code
         return True, func_name
 
 
@@ -0,0 +1,88 @@
+"""
+Single Flight - Gleichzeitige identische Aufrufe nur einmal ausführen
+
+Kommt ein Aufruf mit einem Schlüssel an, für den bereits ein Aufruf läuft,
+wartet er auf dessen Ergebnis statt selbst zu rechnen (Muster aus Go's
+golang.org/x/sync/singleflight). Es wird nichts gecacht: sobald der laufende
+Aufruf fertig ist, startet der nächste mit demselben Schlüssel neu.
+
+Funktioniert über Threads hinweg (Flask-Requests); der ausführende Thread
+darf intern eine eigene Event-Loop nutzen.
+
+Verwendung:
+    discussions = SingleFlight('discussion')
+    result, shared = discussions.do(key, lambda: run_discussion(task))
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from metrics import SINGLEFLIGHT_COALESCED
+
+
+class _Call:
+    """Ein laufender Aufruf, auf den weitere Threads warten können"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Bündelt gleichzeitige Aufrufe mit demselben Schlüssel (thread-sicher)"""
+
+    def __init__(self, kind: str):
+        """
+        Args:
+            kind: Label für den Metrik-Counter (z.B. 'discussion')
+        """
+        self.kind = kind
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Führt fn aus oder wartet auf den bereits laufenden Aufruf mit demselben Schlüssel
+
+        Args:
+            key: Schlüssel, unter dem Aufrufe zusammengefasst werden
+            fn: Auszuführende Funktion ohne Argumente
+
+        Returns:
+            (Ergebnis, shared) - shared ist True, wenn das Ergebnis von einem anderen
+            Aufruf stammt
+
+        Raises:
+            Die Exception von fn, auch in allen wartenden Threads
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+                SINGLEFLIGHT_COALESCED.inc(kind=self.kind)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Anzahl gerade laufender (unterschiedlicher) Aufrufe"""
+        with self._lock:
+            return len(self._calls)
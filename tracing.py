@@ -0,0 +1,297 @@
+"""
+Tracing - Leichtgewichtige Spans für die Auto-Coder Pipeline
+
+Misst mit monotonen Timern, wo die Laufzeit eines create_project-Aufrufs
+bleibt (parse, generate, round table, save, jeder GitHub-Call).
+
+Verwendung:
+    trace = Trace('create_project')
+    with trace.activate():
+        with span('parse_task'):
+            ...
+    trace.totals()               # {'parse_task': 0.0012, ...}
+    JsonFileExporter('trace.jsonl').export(trace)
+    OTLPExporter('http://localhost:4318').export(trace)
+
+Außerhalb eines aktiven Traces ist span() ein No-Op, Bibliotheks-Code
+(z.B. GitHubClient) kann also immer instrumentiert werden.
+"""
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    """Ein gemessener Abschnitt innerhalb eines Traces"""
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration: float = 0.0
+    error: Optional[str] = None
+    _started: float = 0.0
+
+    @property
+    def end_ns(self) -> int:
+        return self.start_ns + int(self.duration * 1e9)
+
+    def set(self, **attributes: Any) -> None:
+        """Ergänzt Attribute (z.B. Ergebnisgrößen) nachträglich"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_ns': self.start_ns,
+            'duration_s': self.duration,
+            'attributes': self.attributes,
+        }
+        if self.error:
+            data['error'] = self.error
+        return data
+
+
+class Trace:
+    """Sammelt alle Spans eines Laufs (thread-sicher)"""
+
+    def __init__(self, name: str, **attributes: Any):
+        self.name = name
+        self.trace_id = secrets.token_hex(16)
+        self.attributes = attributes
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self.root = self._open(name, None, attributes)
+
+    def _open(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        span_ = Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes),
+            _started=time.perf_counter(),
+        )
+        with self._lock:
+            self.spans.append(span_)
+        return span_
+
+    @staticmethod
+    def _close(span_: Span) -> None:
+        span_.duration = time.perf_counter() - span_._started
+
+    @contextmanager
+    def activate(self) -> Iterator['Trace']:
+        """Macht den Trace für span() im aktuellen Kontext sichtbar und schließt den Root-Span"""
+        token = _current.set((self, self.root))
+        try:
+            yield self
+        except BaseException as e:
+            self.root.error = f"{e.__class__.__name__}: {e}"
+            raise
+        finally:
+            self._close(self.root)
+            _current.reset(token)
+
+    @property
+    def duration(self) -> float:
+        return self.root.duration
+
+    def totals(self) -> Dict[str, float]:
+        """Summierte Dauer pro Span-Name (ohne Root) in Sekunden"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span_ in spans:
+            if span_ is self.root:
+                continue
+            totals[span_.name] = totals.get(span_.name, 0.0) + span_.duration
+        return totals
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl der Spans pro Name (ohne Root)"""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span_ in spans:
+            if span_ is not self.root:
+                counts[span_.name] = counts.get(span_.name, 0) + 1
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Kompakte Zusammenfassung für Ergebnis-Dictionaries"""
+        return {
+            'trace_id': self.trace_id,
+            'total_s': self.duration,
+            'stages_s': self.totals(),
+            'calls': self.counts(),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = [span_.to_dict() for span_ in self.spans]
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'attributes': self.attributes,
+            'total_s': self.duration,
+            'spans': spans,
+        }
+
+
+_current: ContextVar[Optional[tuple]] = ContextVar('auto_coder_trace', default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """Gibt den im aktuellen Kontext aktiven Trace zurück"""
+    active = _current.get()
+    return active[0] if active else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Misst einen Abschnitt als Kind des aktuell offenen Spans
+
+    Args:
+        name: Name des Abschnitts (gleiche Namen werden in totals() summiert)
+        **attributes: Zusätzliche Attribute für den Export
+
+    Yields:
+        Den Span oder None, wenn kein Trace aktiv ist
+    """
+    active = _current.get()
+    if active is None:
+        yield None
+        return
+
+    trace, parent = active
+    span_ = trace._open(name, parent, attributes)
+    token = _current.set((trace, span_))
+    try:
+        yield span_
+    except BaseException as e:
+        span_.error = f"{e.__class__.__name__}: {e}"
+        raise
+    finally:
+        trace._close(span_)
+        _current.reset(token)
+
+
+class JsonFileExporter:
+    """Hängt jeden Trace als eine JSON-Zeile an eine Datei an"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+class OTLPExporter:
+    """
+    Sendet Traces im OTLP/HTTP-JSON-Format an einen OpenTelemetry Collector
+
+    Benötigt kein OpenTelemetry SDK, nur einen Collector mit aktiviertem
+    OTLP/HTTP-Receiver (Standard: Port 4318).
+    """
+
+    def __init__(self, endpoint: str = 'http://localhost:4318', service_name: str = 'github-auto-coder',
+                 timeout: float = 2.0):
+        endpoint = endpoint.rstrip('/')
+        self.url = endpoint if endpoint.endswith('/v1/traces') else endpoint + '/v1/traces'
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        converted = []
+        for key, value in attributes.items():
+            if isinstance(value, bool):
+                converted.append({'key': key, 'value': {'boolValue': value}})
+            elif isinstance(value, int):
+                converted.append({'key': key, 'value': {'intValue': str(value)}})
+            elif isinstance(value, float):
+                converted.append({'key': key, 'value': {'doubleValue': value}})
+            else:
+                converted.append({'key': key, 'value': {'stringValue': str(value)}})
+        return converted
+
+    def payload(self, trace: Trace) -> Dict[str, Any]:
+        """Baut den ExportTraceServiceRequest für einen Trace"""
+        with trace._lock:
+            spans = list(trace.spans)
+        otlp_spans = []
+        for span_ in spans:
+            otlp_span = {
+                'traceId': trace.trace_id,
+                'spanId': span_.span_id,
+                'name': span_.name,
+                'kind': 1,
+                'startTimeUnixNano': str(span_.start_ns),
+                'endTimeUnixNano': str(span_.end_ns),
+                'attributes': self._attributes(span_.attributes),
+                'status': {'code': 2, 'message': span_.error} if span_.error else {'code': 1},
+            }
+            if span_.parent_id:
+                otlp_span['parentSpanId'] = span_.parent_id
+            otlp_spans.append(otlp_span)
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': self._attributes({'service.name': self.service_name})},
+                'scopeSpans': [{'scope': {'name': 'auto_coder.tracing'}, 'spans': otlp_spans}],
+            }]
+        }
+
+    def export(self, trace: Trace) -> None:
+        import urllib.request  # zieht http.client/email/ssl nach, nur bei Bedarf laden
+
+        body = json.dumps(self.payload(trace)).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, method='POST',
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def format_trace(trace: Trace) -> str:
+    """Formatiert die Stage-Zeiten als kurze Tabelle (verschachtelte Spans eingerückt)"""
+    total = trace.duration or 1e-9
+    totals = trace.totals()
+    with trace._lock:
+        spans = list(trace.spans)
+    by_id = {span_.span_id: span_ for span_ in spans}
+    children: Dict[Optional[str], List[str]] = {}
+    for span_ in spans:
+        if span_ is trace.root:
+            continue
+        parent = by_id.get(span_.parent_id)
+        parent_name = None if parent is None or parent is trace.root else parent.name
+        names = children.setdefault(parent_name, [])
+        if span_.name not in names and not any(span_.name in v for v in children.values()):
+            names.append(span_.name)
+
+    lines = []
+
+    def _emit(parent_name: Optional[str], depth: int) -> None:
+        for name in sorted(children.get(parent_name, []), key=lambda n: -totals[n]):
+            label = '  ' * depth + name
+            seconds = totals[name]
+            lines.append(f"   {label:<30} {seconds * 1000:9.1f} ms  {seconds / total:6.1%}")
+            _emit(name, depth + 1)
+
+    _emit(None, 0)
+    return '\n'.join(lines)
@@ -0,0 +1,150 @@
+"""
+Upload Journal - Checkpoints für unterbrochene GitHub-Uploads
+
+Append-only JSONL-Datei neben dem lokalen Projekt (.<projekt>.upload.jsonl).
+Jede hochgeladene Datei wird sofort geschrieben und geflusht (überlebt einen
+Prozessabbruch); fsync erfolgt gebündelt alle `fsync_every` Einträge sowie bei
+start/finish (schützt zusätzlich gegen Stromausfall, ohne pro Datei zu warten).
+
+Einträge:
+    {"event": "start", "repo": "user/name", "mode": "api", "paths": [...], "ts": ...}
+    {"event": "file", "path": "src/main.py", "commit": "<sha>"}
+    {"event": "finish", "commit": "<sha>"}
+
+Verwendung:
+    journal = UploadJournal.for_project('./mein-projekt')
+    journal.start('user/mein-projekt', 'api', list(files))
+    journal.record_file('README.md', commit_sha)
+    journal.finish(commit_sha)
+
+    state = UploadJournal.for_project('./mein-projekt').load()
+    state.pending    # noch nicht hochgeladene Pfade
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+
+@dataclass
+class JournalState:
+    """Aus dem Journal rekonstruierter Upload-Stand"""
+    repo: Optional[str] = None
+    mode: str = 'api'
+    paths: List[str] = field(default_factory=list)
+    uploaded: Set[str] = field(default_factory=set)
+    last_commit: Optional[str] = None
+    finished: bool = False
+
+    @property
+    def pending(self) -> List[str]:
+        """Pfade, die noch hochgeladen werden müssen (in ursprünglicher Reihenfolge)"""
+        return [path for path in self.paths if path not in self.uploaded]
+
+
+class UploadJournal:
+    """Append-only Checkpoint-Datei für einen Upload (thread-sicher)"""
+
+    def __init__(self, path: str, fsync_every: int = 20):
+        """
+        Args:
+            path: Pfad der Journal-Datei
+            fsync_every: Nach wie vielen Datei-Einträgen fsync aufgerufen wird
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self._file = None
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, local_path: str, **kwargs) -> 'UploadJournal':
+        """Journal neben dem Projektordner (nicht darin, damit es nicht mit hochgeladen wird)"""
+        local_path = os.path.abspath(local_path)
+        parent, name = os.path.split(local_path)
+        return cls(os.path.join(parent, f'.{name}.upload.jsonl'), **kwargs)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> JournalState:
+        """
+        Liest den letzten Upload-Stand
+
+        Eine abgeschnittene letzte Zeile (Abbruch beim Schreiben) wird ignoriert.
+        """
+        state = JournalState()
+        if not self.exists():
+            return state
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                event = entry.get('event')
+                if event == 'start':
+                    state = JournalState(repo=entry['repo'], mode=entry.get('mode', 'api'),
+                                         paths=list(entry['paths']))
+                elif event == 'file':
+                    state.uploaded.add(entry['path'])
+                    state.last_commit = entry.get('commit') or state.last_commit
+                elif event == 'finish':
+                    state.finished = True
+                    state.last_commit = entry.get('commit') or state.last_commit
+        return state
+
+    def start(self, repo: str, mode: str, paths: List[str]) -> None:
+        """Beginnt einen neuen Upload; load() wertet nur den letzten start-Eintrag aus"""
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+        self._append({'event': 'start', 'repo': repo, 'mode': mode, 'paths': paths, 'ts': time.time()}, sync=True)
+
+    def resume(self) -> None:
+        """Öffnet ein vorhandenes Journal zum Weiterschreiben"""
+        with self._lock:
+            if self._file is None:
+                truncated = False
+                with open(self.path, 'rb') as f:
+                    if f.seek(0, os.SEEK_END) > 0:
+                        f.seek(-1, os.SEEK_END)
+                        truncated = f.read(1) != b'\n'
+                self._file = open(self.path, 'a', encoding='utf-8')
+                if truncated:
+                    # Abgebrochene letzte Zeile abschließen, sonst verschmilzt sie mit dem nächsten Eintrag
+                    self._file.write('\n')
+
+    def record_file(self, path: str, commit: Optional[str] = None) -> None:
+        """Vermerkt eine hochgeladene (oder bereits vorhandene) Datei"""
+        self._append({'event': 'file', 'path': path, 'commit': commit})
+
+    def finish(self, commit: Optional[str] = None) -> None:
+        """Markiert den Upload als abgeschlossen und schließt das Journal"""
+        self._append({'event': 'finish', 'commit': commit, 'ts': time.time()}, sync=True)
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    def _append(self, entry: dict, sync: bool = False) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError('Journal nicht geöffnet (start() oder resume() aufrufen)')
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if sync or self._unsynced >= self.fsync_every:
+                self._sync()
+
+    def _sync(self) -> None:
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
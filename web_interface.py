@@ -2,13 +2,16 @@
 """
 Web Interface für GitHub Auto-Coder
 """
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, stream_with_context
 import os
 import json
 from auto_coder import GitHubAutoCoder
+from metrics import IN_FLIGHT, install_flask
+from project_archive import ARCHIVE_FORMATS, check_format, stream_archive
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
+install_flask(app, 'web_interface')  # GET /metrics
 
 # Initialisiere Auto-Coder
 try:
@@ -26,27 +29,42 @@ def index():
 
 @app.route('/api/create', methods=['POST'])
 def create_project():
-    """API Endpoint zum Erstellen eines Projekts"""
+    """API Endpoint zum Erstellen eines Projekts (?format=zip|tar.zst: Archiv als Download)"""
     try:
         data = request.json
         task = data.get('task')
         repo_name = data.get('repo_name')
         local_only = data.get('local_only', False)
         private = data.get('private', False)
+        archive_format = request.args.get('format') or data.get('format')
         
         if not task:
             return jsonify({'error': 'Keine Aufgabenbeschreibung angegeben'}), 400
         
+        if archive_format and archive_format not in ARCHIVE_FORMATS:
+            return jsonify({'error': f"Unbekanntes Archivformat: {archive_format}"}), 400
+        
+        if archive_format:
+            # Vor der Generierung: nach dem Start des Streams ist der Status schon 200
+            try:
+                check_format(archive_format)
+            except ImportError as e:
+                return jsonify({'error': str(e)}), 501
+        
         if not coder:
             return jsonify({'error': 'GitHub Auto-Coder nicht initialisiert'}), 500
         
+        if archive_format:
+            return _archive_response(task, repo_name, archive_format)
+        
         # Erstelle Projekt
-        result = coder.create_project(
-            task_description=task,
-            repo_name=repo_name if repo_name else None,
-            local_only=local_only,
-            private=private
-        )
+        with IN_FLIGHT.track_inprogress(kind='job'):
+            result = coder.create_project(
+                task_description=task,
+                repo_name=repo_name if repo_name else None,
+                local_only=local_only,
+                private=private
+            )
         
         return jsonify({
             'success': True,
@@ -57,6 +75,40 @@ def create_project():
         return jsonify({'error': str(e)}), 500
 
 
+def _archive_response(task: str, repo_name: str, archive_format: str) -> Response:
+    """Generiert das Projekt und streamt es als Archiv (ohne lokalen Ordner und GitHub)"""
+    with IN_FLIGHT.track_inprogress(kind='job'):
+        plan = coder.generate_project(task, repo_name=repo_name if repo_name else None)
+    
+    return Response(
+        stream_with_context(stream_archive(plan.files, archive_format, root=plan.repo_name)),
+        mimetype=ARCHIVE_FORMATS[archive_format],
+        headers={'Content-Disposition': f'attachment; filename="{plan.repo_name}.{archive_format}"'}
+    )
+
+
+@app.route('/api/repos')
+def list_repos():
+    """Status der Repositories per GraphQL (?names=a,b oder alle eigenen)"""
+    try:
+        if not coder or not coder.authenticated:
+            return jsonify({'error': 'Nicht mit GitHub verbunden'}), 500
+        
+        names = [name for name in request.args.get('names', '').split(',') if name.strip()]
+        if names:
+            infos = coder.github.get_repos_info([name.strip() for name in names])
+            repos = [info for info in infos.values() if info]
+            missing = [name for name, info in infos.items() if info is None]
+        else:
+            repos = coder.github.list_repositories_info()
+            missing = []
+        
+        return jsonify({'repos': repos, 'missing': missing})
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/examples')
 def get_examples():
     """Gibt Beispiel-Aufgaben zurück"""